@@ -1,10 +1,14 @@
 # ai_engine/orchestrator.py - WITH DEBUG LOGGING
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 from scrapers.scraper_factory import ScraperFactory
 from ai_engine.matcher import ProfileMatcher
 from ai_engine.data_processor import DataProcessor
-import concurrent.futures
+from utils.async_transport import AsyncTransport, run_sync
+from utils.circuit_breaker import get_circuit_breakers
+from utils.retry_policy import RetryBudget, set_retry_budget, reset_retry_budget
+from config.settings import SEARCH_DEADLINE_SECONDS
+import asyncio
 
 class AIOrchestrator:
     """Main AI orchestration engine for scholarship search"""
@@ -12,18 +16,47 @@ class AIOrchestrator:
     def __init__(self):
         self.matcher = ProfileMatcher()
         self.processor = DataProcessor()
+        # Sources that had not finished when the last search hit its deadline
+        self.last_missing_sources: List[str] = []
     
-    def search_scholarships(self, profile: Dict, progress_callback=None) -> List[Dict]:
+    def search_scholarships(self, profile: Dict, progress_callback=None,
+                            deadline: Optional[float] = None) -> List[Dict]:
         """
-        Main orchestration method for scholarship search
+        Main orchestration method for scholarship search (sync wrapper)
         
         Args:
             profile: User profile dictionary
             progress_callback: Optional callback for progress updates
+            deadline: Seconds the whole search may take (defaults to SEARCH_DEADLINE_SECONDS)
         
         Returns:
             List of matched and ranked scholarships
         """
+        return run_sync(self.asearch_scholarships(profile, progress_callback, deadline))
+    
+    async def asearch_scholarships(self, profile: Dict, progress_callback=None,
+                                   deadline: Optional[float] = None) -> List[Dict]:
+        """
+        Async scholarship search - all sources are fetched concurrently on one event loop
+        
+        Sources still running when the deadline passes are cancelled and the
+        search continues with the results it has; their names are left in
+        last_missing_sources.
+        
+        Args:
+            profile: User profile dictionary
+            progress_callback: Optional callback for progress updates
+            deadline: Seconds the whole search may take (defaults to SEARCH_DEADLINE_SECONDS)
+        
+        Returns:
+            List of matched and ranked scholarships
+        """
+        if deadline is None:
+            deadline = SEARCH_DEADLINE_SECONDS
+        loop = asyncio.get_running_loop()
+        ends_at = loop.time() + deadline if deadline else None
+        self.last_missing_sources = []
+        
         print("\n" + "="*60)
         print("🚀 STARTING SCHOLARSHIP SEARCH")
         print("="*60)
@@ -41,10 +74,12 @@ class AIOrchestrator:
         if progress_callback:
             progress_callback("Initializing scrapers...", 0.1)
         
-        # Step 2: Execute parallel scraping
-        all_scholarships = self._parallel_scrape(scrapers, profile, progress_callback)
+        # Step 2: Execute concurrent scraping
+        all_scholarships = await self._async_scrape(scrapers, profile, progress_callback, ends_at)
         
         print(f"\n📊 RAW RESULTS: {len(all_scholarships)} scholarships scraped")
+        if self.last_missing_sources:
+            print(f"⏱️  Deadline of {deadline}s reached, missing: {', '.join(self.last_missing_sources)}")
         
         if progress_callback:
             progress_callback(f"Found {len(all_scholarships)} scholarships", 0.6)
@@ -79,35 +114,79 @@ class AIOrchestrator:
         
         return matched
     
-    def _parallel_scrape(self, scrapers: List, profile: Dict, progress_callback=None) -> List[Dict]:
-        """Execute scraping in parallel for faster results"""
-        all_scholarships = []
+    def get_source_health(self) -> Dict[str, Dict]:
+        """Circuit breaker state per source (closed / open / half_open) and counters"""
+        return get_circuit_breakers().states()
+    
+    def reset_source_health(self, source_name: Optional[str] = None):
+        """Close a source's circuit breaker (all sources if no name is given)"""
+        get_circuit_breakers().reset(source_name)
+    
+    async def _async_scrape(self, scrapers: List, profile: Dict, progress_callback=None,
+                            ends_at: Optional[float] = None) -> List[Dict]:
+        """
+        Fan out every scraper on the event loop and collect results as they finish
         
-        # Use ThreadPoolExecutor for parallel scraping
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            # Submit all scraping tasks
-            future_to_scraper = {
-                executor.submit(scraper.get_scholarships, profile): scraper 
-                for scraper in scrapers
-            }
-            
-            # Collect results as they complete
-            completed = 0
-            for future in concurrent.futures.as_completed(future_to_scraper):
-                scraper = future_to_scraper[future]
-                try:
-                    scholarships = future.result(timeout=40)
-                    all_scholarships.extend(scholarships)
-                    
-                    completed += 1
-                    result_msg = f"  ✓ {scraper.name}: {len(scholarships)} scholarships"
-                    print(result_msg)
-                    
-                    if progress_callback:
-                        progress_pct = 0.1 + (completed / len(scrapers)) * 0.5
-                        progress_callback(result_msg, progress_pct)
+        ends_at is a loop.time() deadline; scrapers still running then are
+        cancelled (blocking work already on a worker thread finishes in the
+        background) and recorded in last_missing_sources.
+        """
+        all_scholarships = []
+        loop = asyncio.get_running_loop()
+        
+        # One retry budget for the whole search; tasks inherit it from this context
+        budget = RetryBudget()
+        budget_token = set_retry_budget(budget)
+        
+        try:
+            async with AsyncTransport():
+                # Submit all scraping tasks
+                task_to_scraper = {
+                    asyncio.create_task(scraper.aget_scholarships(profile)): scraper
+                    for scraper in scrapers
+                }
+                
+                # Collect results as they complete
+                completed = 0
+                pending = set(task_to_scraper)
+                while pending:
+                    timeout = None if ends_at is None else ends_at - loop.time()
+                    if timeout is not None and timeout <= 0:
+                        break
+                    done, pending = await asyncio.wait(
+                        pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        scraper = task_to_scraper[task]
+                        try:
+                            scholarships = task.result()
+                            all_scholarships.extend(scholarships)
+                            
+                            completed += 1
+                            result_msg = f"  ✓ {scraper.name}: {len(scholarships)} scholarships"
+                            print(result_msg)
+                            
+                            if progress_callback:
+                                progress_pct = 0.1 + (completed / len(scrapers)) * 0.5
+                                progress_callback(result_msg, progress_pct)
                         
-                except Exception as e:
-                    print(f"  ✗ {scraper.name}: FAILED - {str(e)}")
-        
-        return all_scholarships
\ No newline at end of file
+                        except Exception as e:
+                            print(f"  ✗ {scraper.name}: FAILED - {str(e)}")
+                
+                # Deadline reached: give up on the stragglers
+                for task in pending:
+                    scraper = task_to_scraper[task]
+                    task.cancel()
+                    scraper.breaker.record_failure()  # a timeout counts against the source
+                    self.last_missing_sources.append(scraper.name)
+                    print(f"  ⏱️  {scraper.name}: no result before the deadline")
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            reset_retry_budget(budget_token)
+        
+        stats = budget.stats()
+        if stats['spent']:
+            print(f"🔁 Retries used: {stats['spent']}/{stats['budget']}")
+        
+        return all_scholarships
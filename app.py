@@ -202,6 +202,10 @@ class ScholarshipFinderApp:
             # Clear progress
             progress_container.empty()
             
+            missing = self.orchestrator.last_missing_sources
+            if missing:
+                st.info(f"⏱️ Time limit reached before these sources responded: {', '.join(missing)}")
+            
             if scholarships:
                 status_container.success(f"✅ Found {len(scholarships)} matching scholarships!")
                 time.sleep(1)
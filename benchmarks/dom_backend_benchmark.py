@@ -0,0 +1,134 @@
+# benchmarks/dom_backend_benchmark.py
+
+"""
+Parse time and result parity of the HTML backends in scrapers/dom.py.
+
+Every page is parsed with each available backend (bs4, lxml, selectolax)
+and the listing parsers are run on the result: the hybrid scrapers'
+_parse_html, GenericScraper's link parser, extract_scholarship_cards and
+HEC's announcement parser. The bs4 backend (with each scraper's parse scope)
+is the reference; any parser whose output differs on another backend is
+reported, and the script exits with status 1.
+
+Usage:
+    python benchmarks/dom_backend_benchmark.py [page.html ...] [--repeat 5]
+
+Without pages, the source pages in benchmarks/fixtures/ and the synthetic
+portal page from parse_scope_benchmark.py are used. A fixture is named after
+its source key in config/sources.py, and the parsers that source uses
+(FIXTURE_PARSERS) must also extract something from it, so a fixture that
+has drifted from its parser does not pass as "same empty result". The
+fixtures reproduce each site's listing template, trimmed; replace them with
+recorded copies to check against current markup, e.g.
+    curl -o benchmarks/fixtures/scholars4dev.html https://www.scholars4dev.com/category/scholarships/
+
+For a parity check only:
+    python benchmarks/dom_backend_benchmark.py --repeat 1
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from parse_scope_benchmark import synthetic_page
+from scrapers.dom import BACKENDS, resolve_backend
+from scrapers.hybrid_scraper import HybridScraper
+from scrapers.specialized_hybrids import Scholars4DevHybrid, ScholarshipPortalHybrid, DAADHybrid
+from scrapers.hec_scraper import HECScraper
+from scrapers.generic_scraper import GenericScraper
+from scrapers.additional_scholarship_scrapers import CardListScraper, extract_scholarship_cards
+
+FIXTURES = Path(__file__).resolve().parent / 'fixtures'
+
+# Source key (fixture file name) -> the parsers that source runs in production
+FIXTURE_PARSERS = {
+    'scholars4dev': ('Scholars4DevHybrid',),
+    'scholarshipportal': ('ScholarshipPortalHybrid',),
+    'daad': ('DAADHybrid',),
+    'hec': ('HECScraper', 'HybridScraper'),
+    'opportunitiescorners': ('HybridScraper', 'GenericScraper'),
+    'chevening': ('extract_scholarship_cards',),
+}
+
+
+def _scraper(cls, backend: str):
+    return cls({'name': cls.__name__, 'url': 'https://example.org/scholarships', 'html_backend': backend})
+
+
+def parsers(backend: str) -> Dict[str, Callable[[bytes], List[Dict]]]:
+    """Parser name -> function from page bytes to its scholarships"""
+    table = {}
+    for cls in (HybridScraper, Scholars4DevHybrid, ScholarshipPortalHybrid, DAADHybrid):
+        scraper = _scraper(cls, backend)
+        table[cls.__name__] = lambda content, s=scraper: s._parse_html_bytes(content, {}, 'utf-8')
+    hec = _scraper(HECScraper, backend)
+    table['HECScraper'] = lambda content: hec._parse_scholarship_list(hec.parse_page(content, 'utf-8'), {})
+    generic = _scraper(GenericScraper, backend)
+    table['GenericScraper'] = lambda content: generic._parse_html(generic.parse_page(content, 'utf-8'))
+    cards = _scraper(CardListScraper, backend)
+    table['extract_scholarship_cards'] = lambda content: extract_scholarship_cards(
+        cards.parse_page(content, 'utf-8'), limit=15
+    )
+    return table
+
+
+def timed(run: Callable[[], object], repeat: int) -> Tuple[float, object]:
+    times, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times), result
+
+
+def bench_page(name: str, content: bytes, repeat: int, required: Tuple[str, ...] = ()) -> int:
+    """Print the page's timings; returns the number of failed parity checks"""
+    backends = [b for b in BACKENDS if resolve_backend(b) == b]
+    print(f"\n{name}: {len(content) / 1024:.0f} KB, backends: {', '.join(backends)}")
+    print(f"{'parser':<28}" + ''.join(f"{b + ' ms':>15}" for b in backends) + f"{'items':>7}  parity")
+
+    tables = {backend: parsers(backend) for backend in backends}
+    failures = 0
+    for parser_name in tables['bs4']:
+        row, results = [], {}
+        for backend in backends:
+            elapsed, results[backend] = timed(lambda: tables[backend][parser_name](content), repeat)
+            row.append(elapsed)
+        differing = [b for b in backends if results[b] != results['bs4']]
+        status = 'ok' if not differing else 'DIFFERS: ' + ', '.join(differing)
+        if parser_name in required and not results['bs4']:
+            status += ' (EMPTY: the fixture no longer matches this parser)'
+            failures += 1
+        failures += len(differing)
+        print(f"{parser_name:<28}" + ''.join(f"{t * 1000:>15.1f}" for t in row)
+              + f"{len(results['bs4']):>7}  {status}")
+    return failures
+
+
+def default_pages() -> List[Tuple[str, bytes, Tuple[str, ...]]]:
+    """The source fixtures (with the parsers each must feed) and the synthetic page"""
+    pages = [(path.name, path.read_bytes(), FIXTURE_PARSERS.get(path.stem, ()))
+             for path in sorted(FIXTURES.glob('*.html'))]
+    return pages + [('synthetic portal page', synthetic_page(), ())]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('pages', nargs='*', help='recorded HTML pages (default: benchmarks/fixtures/ and a synthetic page)')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per measurement (median)')
+    args = parser.parse_args()
+
+    pages = [(path, Path(path).read_bytes(), FIXTURE_PARSERS.get(Path(path).stem, ())) for path in args.pages]
+    failures = sum(bench_page(name, content, args.repeat, required)
+                   for name, content, required in pages or default_pages())
+    print(f"\n{'parity: ok' if not failures else f'parity: {failures} failed check(s)'}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+# benchmarks/parse_scope_benchmark.py
+
+"""
+Parse time and peak memory: full BeautifulSoup trees vs parse scopes.
+
+For every page and every scraper below, the page is parsed once into a full
+tree and once restricted to the scraper's parse_scope, and the scraper's own
+parser is run on both trees to check that the results are the same.
+
+    HybridScraper        links
+    Scholars4DevHybrid   <article> posts
+    ScholarshipPortal    scholarship <div> cards
+    DAADHybrid           scripts and links
+    HECScraper           announcement blocks
+    CardListScraper      extract_scholarship_cards blocks and links
+    GenericScraper       link containers
+
+Usage:
+    python benchmarks/parse_scope_benchmark.py [page.html ...] [--repeat 5]
+
+Without pages, a synthetic portal page (large <head>, navigation, 300 listing
+cards, footer) is used. Save real pages with e.g.
+    curl -o chevening.html https://www.chevening.org/scholarships/
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+from scrapers.parse_scope import scoped_soup
+from scrapers.hybrid_scraper import HybridScraper
+from scrapers.specialized_hybrids import Scholars4DevHybrid, ScholarshipPortalHybrid, DAADHybrid
+from scrapers.hec_scraper import HECScraper
+from scrapers.generic_scraper import GenericScraper
+from scrapers.additional_scholarship_scrapers import CardListScraper, extract_scholarship_cards
+
+
+def synthetic_page(cards: int = 300) -> bytes:
+    head = ''.join(f'<script>var config{i} = {{"key": "{"x" * 200}"}};</script>' for i in range(40))
+    head += '<style>' + '.c{color:red}' * 2000 + '</style>'
+    nav = '<nav><ul>' + ''.join(f'<li><a href="/menu/{i}">Menu item {i}</a></li>' for i in range(150)) + '</ul></nav>'
+    listing = ''.join(
+        f'<article class="post"><div class="scholarship-card"><h3>Fully funded scholarship {i} for '
+        f'international students</h3><p>{"Eligibility and funding details. " * 8}</p>'
+        f'<a href="/stipendium/{i}">Read more about scholarship {i} in Germany</a></div></article>'
+        for i in range(cards)
+    )
+    footer = '<footer>' + ''.join(f'<p>Footer paragraph {i} with <span>inline</span> text</p>' for i in range(200)) + '</footer>'
+    return (f'<html><head><meta charset="utf-8"><title>Portal</title>{head}</head>'
+            f'<body>{nav}<main><div class="content">{listing}</div></main>{footer}</body></html>').encode()
+
+
+def _hybrid(cls):
+    scraper = cls({'name': cls.__name__, 'url': 'https://example.org/scholarships'})
+    return scraper.parse_scope, lambda soup: len(scraper._parse_html(soup, {}))
+
+
+def _cards():
+    return CardListScraper.parse_scope, lambda soup: len(extract_scholarship_cards(soup, limit=15))
+
+
+def _hec():
+    scraper = HECScraper({'name': 'HEC', 'url': 'https://hec.gov.pk/'})
+    return scraper.parse_scope, lambda soup: len(scraper._parse_scholarship_list(soup, {}))
+
+
+def _generic():
+    scraper = GenericScraper({'name': 'Generic', 'url': 'https://example.org/'})
+
+    return scraper.parse_scope, lambda soup: len(scraper._parse_html(soup))
+
+
+SCRAPERS: Dict[str, Callable[[], Tuple[object, Callable]]] = {
+    'HybridScraper': lambda: _hybrid(HybridScraper),
+    'Scholars4DevHybrid': lambda: _hybrid(Scholars4DevHybrid),
+    'ScholarshipPortal': lambda: _hybrid(ScholarshipPortalHybrid),
+    'DAADHybrid': lambda: _hybrid(DAADHybrid),
+    'HECScraper': _hec,
+    'CardListScraper': _cards,
+    'GenericScraper': _generic,
+}
+
+
+def measure(build: Callable[[], BeautifulSoup], repeat: int) -> Tuple[float, float]:
+    """(median seconds, peak MB) to build a tree"""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build()
+        times.append(time.perf_counter() - started)
+    tracemalloc.start()
+    soup = build()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del soup
+    return statistics.median(times), peak / (1024 * 1024)
+
+
+def bench_page(name: str, content: bytes, repeat: int):
+    print(f"\n{name}: {len(content) / 1024:.0f} KB")
+    print(f"{'scraper':<20}{'full ms':>9}{'scoped ms':>11}{'speedup':>9}{'full MB':>9}"
+          f"{'scoped MB':>11}{'items':>7}{'same':>6}")
+    full_time, full_peak = measure(lambda: BeautifulSoup(content, 'lxml'), repeat)
+    full_soup = BeautifulSoup(content, 'lxml')
+    for label, factory in SCRAPERS.items():
+        scope, parse = factory()
+        scoped_time, scoped_peak = measure(lambda: scoped_soup(content, scope), repeat)
+        full_items = parse(full_soup)
+        scoped_items = parse(scoped_soup(content, scope))
+        print(f"{label:<20}{full_time * 1000:>9.1f}{scoped_time * 1000:>11.1f}"
+              f"{full_time / scoped_time:>8.1f}x{full_peak:>9.1f}{scoped_peak:>11.1f}"
+              f"{scoped_items:>7}{'yes' if scoped_items == full_items else 'NO':>6}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('pages', nargs='*', help='saved HTML pages (default: a synthetic portal page)')
+    parser.add_argument('--repeat', type=int, default=5, help='timed parses per measurement (median)')
+    args = parser.parse_args()
+
+    pages: List[Tuple[str, bytes]] = [(path, Path(path).read_bytes()) for path in args.pages]
+    if not pages:
+        pages = [('synthetic portal page', synthetic_page())]
+    for name, content in pages:
+        bench_page(name, content, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
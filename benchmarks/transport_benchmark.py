@@ -0,0 +1,148 @@
+# benchmarks/transport_benchmark.py
+
+"""
+Bytes on the wire and wall-clock time: the requests session vs httpx (HTTP/2).
+
+The same pages are fetched concurrently in each mode, bypassing the response
+cache and the rate limiter so only the transport is measured:
+
+    requests/identity  BaseScraper-style session, no compression (reference)
+    requests           BaseScraper-style session with ACCEPT_ENCODING (HTTP/1.1)
+    httpx/1.1          the async path's client without HTTP/2
+    httpx/2            the async path's client with HTTP/2 (needs: pip install httpx[http2])
+
+Wire bytes are the (compressed) body bytes read from the socket; headers are
+not counted.
+
+Usage:
+    python benchmarks/transport_benchmark.py [URL ...] [--rounds 3] [--workers 8]
+
+Without URLs, the enabled sources' pages, feeds and robots.txt files are used.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+from urllib.parse import urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import requests
+import httpx
+from config.sources import SCHOLARSHIP_SOURCES
+from utils.async_transport import HTTP2_AVAILABLE
+from utils.http_transport import ACCEPT_ENCODING
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+TIMEOUT = 20
+
+
+def default_urls() -> List[str]:
+    urls = []
+    for source in SCHOLARSHIP_SOURCES.values():
+        if not source.get('enabled', True) or not source.get('url'):
+            continue
+        parsed = urlparse(source['url'])
+        urls.append(f"{parsed.scheme}://{parsed.netloc}/robots.txt")
+        urls.append(source['url'])
+        if source.get('rss_feed'):
+            urls.append(source['rss_feed'])
+    return list(dict.fromkeys(urls))
+
+
+def run_requests(urls: List[str], workers: int, encoding: str) -> Tuple[float, int, int]:
+    """(seconds, wire bytes, failures) for one round over a fresh session"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update(HEADERS)
+    session.headers['Accept-Encoding'] = encoding
+
+    def fetch(url: str) -> int:
+        with session.get(url, timeout=TIMEOUT, stream=True) as response:
+            response.content
+            return response.raw.tell()  # bytes pulled off the socket, before decoding
+
+    started = time.perf_counter()
+    wire = failures = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(fetch, url) for url in urls]:
+            try:
+                wire += future.result()
+            except requests.RequestException:
+                failures += 1
+    elapsed = time.perf_counter() - started
+    session.close()
+    return elapsed, wire, failures
+
+
+async def _run_httpx(urls: List[str], workers: int, http2: bool) -> Tuple[float, int, int]:
+    limits = httpx.Limits(max_connections=workers, max_keepalive_connections=workers)
+    headers = dict(HEADERS, **{'Accept-Encoding': ACCEPT_ENCODING})
+    async with httpx.AsyncClient(http2=http2, limits=limits, headers=headers,
+                                 follow_redirects=True, timeout=TIMEOUT) as client:
+        async def fetch(url: str) -> int:
+            response = await client.get(url)
+            return response.num_bytes_downloaded
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(fetch(url) for url in urls), return_exceptions=True)
+        elapsed = time.perf_counter() - started
+    wire = sum(result for result in results if isinstance(result, int))
+    failures = sum(1 for result in results if isinstance(result, BaseException))
+    return elapsed, wire, failures
+
+
+def run_httpx(urls: List[str], workers: int, http2: bool) -> Tuple[float, int, int]:
+    return asyncio.run(_run_httpx(urls, workers, http2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('urls', nargs='*', help='pages to fetch (default: the configured sources)')
+    parser.add_argument('--rounds', type=int, default=3, help='rounds per mode (median is reported)')
+    parser.add_argument('--workers', type=int, default=8, help='concurrent requests / connections')
+    args = parser.parse_args()
+
+    urls = args.urls or default_urls()
+    modes = {
+        'requests/identity': lambda: run_requests(urls, args.workers, 'identity'),
+        'requests': lambda: run_requests(urls, args.workers, ACCEPT_ENCODING),
+        'httpx/1.1': lambda: run_httpx(urls, args.workers, http2=False),
+    }
+    if HTTP2_AVAILABLE:
+        modes['httpx/2'] = lambda: run_httpx(urls, args.workers, http2=True)
+
+    print(f"{len(urls)} URLs, {args.rounds} rounds, {args.workers} workers, "
+          f"Accept-Encoding: {ACCEPT_ENCODING}")
+    if not HTTP2_AVAILABLE:
+        print("h2 is not installed, skipping httpx/2")
+
+    results: Dict[str, Tuple[float, int, int]] = {}
+    for name, run in modes.items():
+        rounds = [run() for _ in range(args.rounds)]
+        results[name] = (
+            statistics.median(r[0] for r in rounds),
+            int(statistics.median(r[1] for r in rounds)),
+            max(r[2] for r in rounds),
+        )
+
+    baseline_time, baseline_bytes, _ = results['requests']
+    print(f"\n{'mode':<20}{'wall (s)':>10}{'vs requests':>13}{'wire KB':>11}{'vs requests':>13}{'failed':>8}")
+    for name, (elapsed, wire, failures) in results.items():
+        print(f"{name:<20}{elapsed:>10.2f}{elapsed / baseline_time:>12.2f}x"
+              f"{wire / 1024:>11.1f}{wire / max(baseline_bytes, 1):>12.2f}x{failures:>8}")
+
+
+if __name__ == '__main__':
+    main()
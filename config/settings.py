@@ -61,19 +61,87 @@ NATIONALITIES = [
     "Any Nationality"
 ]
 
-# Scraping Configuration
-REQUEST_TIMEOUT = 15
-MAX_RETRIES = 3
-RETRY_DELAY = 2
+# Scraping Configuration (timeouts/retries: see utils/retry_policy.py)
+CONNECT_TIMEOUT = 5            # Seconds to establish a connection
+REQUEST_TIMEOUT = 15           # Default read timeout
+MAX_RETRIES = 3                # Retries per request (idempotent requests, transient errors only)
+RETRY_DELAY = 2                # Base of the jittered exponential backoff
+RETRY_MAX_DELAY = 10           # Longest single backoff (also caps Retry-After)
+SEARCH_RETRY_BUDGET = 10       # Retries one search may spend across all sources
+
+# Adaptive Timeouts (per host, see utils/latency_tracker.py)
+TIMEOUT_PERCENTILE = 95        # Latency percentile a timeout is based on
+TIMEOUT_MARGIN = 1.5           # Multiplier applied on top of that percentile
+TIMEOUT_FLOOR = 3              # Never time out faster than this
+TIMEOUT_CEILING = 45           # Never wait longer than this
+TIMEOUT_MIN_SAMPLES = 5        # Responses needed before a host's history is trusted
 USER_AGENT_ROTATION = True
 
-# Rate Limiting
+# HTML Parsing (see scrapers/dom.py)
+# Scrapers' parse scopes (scrapers/parse_scope.py) apply to "bs4" and "lxml"; selectolax keeps the whole page
+HTML_BACKEND = "lxml"     # "lxml", "bs4" (BeautifulSoup) or "selectolax"; per-source "html_backend" overrides
+
+# Feed Downloads (see utils/feed_fetcher.py)
+FEED_CONNECT_TIMEOUT = 5       # Seconds to establish the connection
+FEED_READ_TIMEOUT = 15         # Seconds to wait for each chunk
+FEED_TOTAL_TIMEOUT = 30        # Hard limit for the whole download
+FEED_MAX_BYTES = 2 * 1024 * 1024
+
+# Streaming Page Downloads (see utils/page_fetcher.py)
+PAGE_MAX_BYTES = 5 * 1024 * 1024   # Default body cap; per-source "max_body_bytes" overrides it
+PAGE_TOTAL_TIMEOUT = 45            # Hard limit for the whole download
+STREAM_EARLY_STOP = True           # Stop reading once enough candidates have streamed in (uncacheable responses only)
+STREAM_CANDIDATE_HEADROOM = 2      # Read until item cap x this many candidates (parsers drop some)
+
+# Connection Pooling (shared by all scrapers, see utils/http_transport.py)
+HTTP_POOL_CONNECTIONS = 20   # Number of per-host pools kept alive
+HTTP_POOL_MAXSIZE = 10       # Max idle connections kept per host
+HTTP_POOL_BLOCK = False
+ASYNC_MAX_CONNECTIONS = 50   # Concurrent connections for the asyncio search path
+HTTP2_ENABLED = True         # Multiplex the async path over HTTP/2 when the h2 package is installed
+
+# Search Deadline (see ai_engine/orchestrator.py)
+SEARCH_DEADLINE_SECONDS = None     # Seconds before returning partial results (e.g. 20); None waits for every source
+
+# Hybrid Scraping Methods (see scrapers/hybrid_scraper.py)
+HYBRID_METHOD_MODE = "sequential"  # "sequential" or "race"; overridable per source with method_mode
+HEDGE_DELAY_SECONDS = 2.0          # In race mode, head start each method gets before the next one starts
+ADAPTIVE_METHOD_ORDER = True       # Try methods in order of recent success (see utils/method_stats.py)
+METHOD_STATS_MIN_ATTEMPTS = 3      # Attempts before a method can be skipped
+METHOD_SKIP_BELOW = 0.2            # Skip methods whose recent success rate is below this
+METHOD_PROBE_HOURS = 6             # Retry a skipped method this often to notice recoveries
+
+# Circuit Breakers (per source, see utils/circuit_breaker.py)
+BREAKER_FAILURE_THRESHOLD = 3      # Consecutive failed scrapes before a source is short-circuited
+BREAKER_COOLDOWN_SECONDS = 300     # How long to serve fallback data before probing again
+
+# Headless Browser Pool (Selenium sources, see utils/browser_pool.py)
+BROWSER_POOL_SIZE = 2          # Chrome instances kept for reuse
+BROWSER_IDLE_TIMEOUT = 300     # Seconds before an unused browser is quit
+BROWSER_MAX_PAGES = 50         # Restart a browser after this many pages
+CHROMEDRIVER_PATH = None       # Set to skip the webdriver_manager lookup
+BROWSER_FAST_PROFILE = True    # Eager page loads, no images/fonts/trackers
+SELENIUM_READY_TIMEOUT = 10    # Max seconds to wait for a source's ready_selector
+BROWSER_BLOCKED_URLS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.mp3",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.css",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*connect.facebook.net*", "*hotjar.com*", "*clarity.ms*", "*addthis.com*",
+)
+
+# Rate Limiting (per-host token bucket, see utils/rate_limiter.py)
 MIN_REQUEST_DELAY = 1.5
 MAX_REQUEST_DELAY = 3.0
+RATE_LIMIT_BURST = 3           # Requests per host allowed before spacing kicks in
 
 # Cache Settings
 CACHE_DURATION_HOURS = 6
 ENABLE_CACHING = True
+CACHE_DIR = ".cache"                               # On-disk state (HTTP cache, robots.txt, stats)
+CACHE_MAX_SIZE_MB = 100                            # LRU eviction above this size
+CACHE_VARY_HEADERS = ("Accept", "Accept-Language")  # Request headers that are part of the cache key
+ROBOTS_CACHE_HOURS = 24                            # How long a host's robots.txt is trusted
 
 # Excel Export Settings
 EXCEL_SHEET_NAME = "Scholarships"
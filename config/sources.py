@@ -1,5 +1,16 @@
 # config/sources.py - WITH API, RSS, AND SELENIUM CONFIGURATION
 
+# Optional per-source keys:
+#   "timeout"          fixed read timeout in seconds (default: adaptive, from the host's latency history)
+#   "method_mode"      "sequential" or "race" (hybrid scrapers, default HYBRID_METHOD_MODE)
+#   "hedge_delay"      seconds between raced methods (default HEDGE_DELAY_SECONDS)
+#   "structured_data"  try embedded JSON-LD / hydration data (default: same as use_selenium)
+#   "ready_selector"   CSS selector that marks a Selenium-rendered page as ready
+#   "max_body_bytes"   cap on a streamed page body (default PAGE_MAX_BYTES)
+#   "parse_scope"      tag names the HTML parser needs, e.g. ["article"] (default: set by the scraper class;
+#                      ignored by the "selectolax" html_backend)
+#   "html_backend"     "lxml", "bs4" or "selectolax" tree for the HTML parsers (default HTML_BACKEND)
+
 SCHOLARSHIP_SOURCES = {
     "daad": {
         "name": "DAAD (German Academic Exchange Service)",
@@ -29,6 +40,7 @@ SCHOLARSHIP_SOURCES = {
         "api_endpoint": None,
         "rss_feed": "https://www.scholars4dev.com/feed/",  # ✅ HAS RSS
         "use_selenium": False,
+        "method_mode": "race",  # RSS and HTML raced, first result wins
         "type": "hybrid",
         "enabled": True,
         "priority": 3
@@ -40,6 +52,7 @@ SCHOLARSHIP_SOURCES = {
         "api_endpoint": None,
         "rss_feed": "https://opportunitiescorners.com/feed/",  # ✅ HAS RSS
         "use_selenium": False,
+        "method_mode": "race",  # RSS and HTML raced, first result wins
         "type": "hybrid",
         "enabled": True,
         "priority": 4
@@ -51,6 +64,7 @@ SCHOLARSHIP_SOURCES = {
         "api_endpoint": None,
         "rss_feed": "https://www.youthopportunities.com/feed/",  # ✅ HAS RSS
         "use_selenium": False,
+        "method_mode": "race",  # RSS and HTML raced, first result wins
         "type": "hybrid",
         "enabled": True,
         "priority": 5
@@ -62,6 +76,7 @@ SCHOLARSHIP_SOURCES = {
         "api_endpoint": None,  # They have API but requires key
         "rss_feed": "https://www.scholarshipportal.com/feed",  # ✅ HAS RSS
         "use_selenium": False,
+        "method_mode": "race",  # RSS and HTML raced, first result wins
         "type": "hybrid",
         "enabled": True,
         "priority": 6
@@ -73,6 +88,7 @@ SCHOLARSHIP_SOURCES = {
         "api_endpoint": None,
         "rss_feed": None,
         "use_selenium": True,  # ✅ JavaScript-heavy site
+        "ready_selector": "main a[href*='scholarship']",  # Rendered once this matches
         "type": "hybrid",
         "enabled": True,
         "priority": 7
@@ -84,6 +100,7 @@ SCHOLARSHIP_SOURCES = {
         "api_endpoint": None,
         "rss_feed": None,
         "use_selenium": True,  # ✅ JavaScript-heavy site
+        "ready_selector": "main",  # Rendered once this matches
         "type": "hybrid",
         "enabled": True,
         "priority": 8
@@ -106,6 +123,7 @@ SCHOLARSHIP_SOURCES = {
         "api_endpoint": None,
         "rss_feed": None,
         "use_selenium": True,  # ✅ JavaScript-heavy site
+        "ready_selector": "main article, main .ecl-content-item",  # Rendered once this matches
         "type": "hybrid",
         "enabled": True,
         "priority": 10
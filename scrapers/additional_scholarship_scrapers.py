@@ -4,6 +4,7 @@ Additional scrapers for global scholarship sources.
 This single file provides 10 scraper classes that extend your existing BaseScraper
 and follow the same patterns used in your existing scrapers (requests.Session,
 BeautifulSoup fallback parsing, robots.txt checks, robust error handling).
+They share CardListScraper, which also implements the native async path.
 
 Classes included:
 - CheveningScraper
@@ -20,55 +21,67 @@ Classes included:
 Drop this file into your `scrapers/` package and import the classes where needed.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from scrapers.base_scraper import BaseScraper
-from bs4 import BeautifulSoup
+from scrapers.dom import Node
+from scrapers.text_index import TextIndex
+from utils.http_transport import get_transport
+from utils.async_transport import current_async_transport
+from utils.robots_cache import get_robots_cache
+from utils.page_fetcher import CandidateCounter
 import requests
-import urllib.robotparser
-import urllib.parse
+import asyncio
 import time
 import re
 
 # Helper: check robots.txt for a given URL and user-agent
+# robots.txt is cached per host (in memory and on disk) and its Crawl-delay
+# feeds the per-host rate limiter, see utils/robots_cache.py
 
-def is_path_allowed(session: requests.Session, page_url: str, user_agent: str = "*") -> bool:
+def is_path_allowed(session: Optional[requests.Session], page_url: str, user_agent: str = "*") -> bool:
     try:
-        parsed = urllib.parse.urlparse(page_url)
-        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-        # Use session to respect proxies or mounts
-        resp = session.get(robots_url, timeout=10)
-        if resp.status_code != 200:
-            # No robots.txt or inaccessible -> treat as allowed (conservative)
-            return True
-        rp = urllib.robotparser.RobotFileParser()
-        rp.parse(resp.text.splitlines())
-        return rp.can_fetch(user_agent, page_url)
+        # Use session to respect proxies or mounts; default to the pooled transport
+        session = session or get_transport().session
+        return get_robots_cache().can_fetch(page_url, user_agent, session)
     except Exception:
         # If robots check fails for any reason, return False to be safe
         return False
 
 
+async def ais_path_allowed(session: Optional[requests.Session], page_url: str, user_agent: str = "*") -> bool:
+    """Async is_path_allowed, fetched through the search's AsyncTransport with session's headers"""
+    try:
+        transport = current_async_transport()
+        if transport is None:
+            return await asyncio.to_thread(is_path_allowed, session, page_url, user_agent)
+        headers = dict(session.headers) if session is not None else None
+        return await get_robots_cache().acan_fetch(page_url, user_agent, transport, headers)
+    except Exception:
+        return False
+
+
 # Common lightweight HTML parsing helper
 
-def extract_scholarship_cards(soup: BeautifulSoup, keywords: List[str] = None, limit: int = 10) -> List[Dict]:
-    keywords = keywords or ["scholarship", "fellowship", "grant", "funding", "award"]
+CARD_KEYWORDS = ["scholarship", "fellowship", "grant", "funding", "award"]
+# Blocks extract_scholarship_cards reads, plus the anchors of its fallback scan
+CARD_SCOPE = ('article', 'div', 'li', 'section', 'a')
+
+def extract_scholarship_cards(soup: Node, keywords: List[str] = None, limit: int = 10) -> List[Dict]:
+    keywords = keywords or CARD_KEYWORDS
     results = []
+    # One walk gives every block's text, first link and heading (see scrapers/text_index.py)
+    index = TextIndex(soup)
 
     # Strategy: find article/listing elements and anchor tags that mention keywords
-    candidates = soup.find_all(['article', 'div', 'li', 'section'], limit=50)
-    for block in candidates:
-        txt = block.get_text(separator=' ', strip=True).lower()
-        if any(k in txt for k in keywords):
+    for block in index.blocks[:50]:
+        if index.contains_any(block, keywords):
             # try to extract title and link
-            a = block.find('a', href=True)
-            title_elem = block.find(['h1', 'h2', 'h3', 'h4', 'strong'])
-            title = title_elem.get_text(strip=True) if title_elem else (a.get_text(strip=True) if a else None)
-            url = a['href'] if a else None
+            a = block.anchor
+            title_elem = block.heading
+            title = index.get_text(title_elem) if title_elem else (index.get_text(a) if a else None)
+            url = a.node['href'] if a else None
+            # relative URLs are kept; callers post-process them if needed
             if title and url:
-                if url.startswith('/'):
-                    parsed = soup.find('base')
-                    # best-effort absolute construction
-                    # caller should post-process absolute URLs if needed
                 results.append({
                     'title': title,
                     'country': 'Various',
@@ -86,12 +99,11 @@ def extract_scholarship_cards(soup: BeautifulSoup, keywords: List[str] = None, l
 
     # fallback: scan anchors
     if not results:
-        anchors = soup.find_all('a', href=True)
-        for a in anchors:
-            txt = a.get_text(strip=True).lower()
+        for a in index.links:
+            txt = index.get_text(a).lower()
             if any(k in txt for k in keywords):
                 results.append({
-                    'title': a.get_text(strip=True) or 'Scholarship',
+                    'title': index.get_text(a) or 'Scholarship',
                     'country': 'Various',
                     'degree': 'Not specified',
                     'field': 'All fields',
@@ -100,7 +112,7 @@ def extract_scholarship_cards(soup: BeautifulSoup, keywords: List[str] = None, l
                     'eligibility': 'See official site',
                     'documents': 'See official site',
                     'deadline': 'See official site',
-                    'url': a['href']
+                    'url': a.node['href']
                 })
                 if len(results) >= limit:
                     break
@@ -108,168 +120,126 @@ def extract_scholarship_cards(soup: BeautifulSoup, keywords: List[str] = None, l
     return results
 
 
-# -------------- Individual scraper classes --------------
+# -------------- Shared listing-page scraper --------------
 
-class CheveningScraper(BaseScraper):
-    def scrape(self, profile: Dict) -> List[Dict]:
-        if not is_path_allowed(self.session, self.url, self.session.headers.get('User-Agent', '*')):
-            print(f"Chevening: robots.txt disallows scraping {self.url}")
-            return []
+class CardListScraper(BaseScraper):
+    """
+    Robots-aware scraper for listing pages parsed with extract_scholarship_cards.
 
-        try:
-            resp = self.session.get(self.url, timeout=30)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.content, 'lxml')
-            results = extract_scholarship_cards(soup, limit=12)
-            return results
-        except Exception as e:
-            print(f"Chevening scraping error: {e}")
-            return []
+    Subclasses only declare their label, timeout, card limit and keywords.
+    """
 
+    label = 'Scholarship source'
+    timeout = 25  # until the host has latency history, see BaseScraper.request_timeout
+    limit = 12
+    keywords = None
+    parse_scope = CARD_SCOPE
 
-class FulbrightScraper(BaseScraper):
     def scrape(self, profile: Dict) -> List[Dict]:
         if not is_path_allowed(self.session, self.url, self.session.headers.get('User-Agent', '*')):
-            print(f"Fulbright: robots.txt disallows scraping {self.url}")
+            print(f"{self.label}: robots.txt disallows scraping {self.url}")
             return []
         try:
-            resp = self.session.get(self.url, timeout=30)
+            resp = self._fetch_listing()
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.content, 'lxml')
-            # Fulbright often lists program types; find program listing links
-            results = extract_scholarship_cards(soup, limit=15)
-            return results
+            return self._parse_listing(resp.content, resp.encoding)
         except Exception as e:
-            print(f"Fulbright scraping error: {e}")
+            print(f"{self.label} scraping error: {e}")
             return []
 
-
-class CommonwealthScraper(BaseScraper):
-    def scrape(self, profile: Dict) -> List[Dict]:
-        if not is_path_allowed(self.session, self.url, self.session.headers.get('User-Agent', '*')):
-            print(f"Commonwealth: robots.txt disallows scraping {self.url}")
+    async def ascrape(self, profile: Dict) -> List[Dict]:
+        """Async scrape; robots.txt is still checked before the page is requested"""
+        if not await ais_path_allowed(self.session, self.url, self.session.headers.get('User-Agent', '*')):
+            print(f"{self.label}: robots.txt disallows scraping {self.url}")
             return []
         try:
-            resp = self.session.get(self.url, timeout=25)
+            resp = await self.afetch_page(**self._listing_options())
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.content, 'lxml')
-            items = extract_scholarship_cards(soup, limit=12)
-            return items
+            return await asyncio.to_thread(self._parse_listing, resp.content, resp.encoding)
         except Exception as e:
-            print(f"Commonwealth scraping error: {e}")
+            print(f"{self.label} scraping error: {e}")
             return []
 
+    def _fetch_listing(self):
+        """Stream the listing page until it has enough keyword links for limit cards"""
+        return self.fetch_page(**self._listing_options())
 
-class ErasmusScraper(BaseScraper):
-    def scrape(self, profile: Dict) -> List[Dict]:
-        if not is_path_allowed(self.session, self.url, self.session.headers.get('User-Agent', '*')):
-            print(f"Erasmus: robots.txt disallows scraping {self.url}")
-            return []
-        try:
-            resp = self.session.get(self.url, timeout=25)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.content, 'lxml')
-            # Erasmus pages are often content-rich; try to find links mentioning "opportunities" or "students"
-            items = extract_scholarship_cards(soup, keywords=['opportunity', 'scholarship', 'study abroad'], limit=15)
-            return items
-        except Exception as e:
-            print(f"Erasmus scraping error: {e}")
-            return []
+    def _listing_options(self) -> Dict:
+        """fetch_page()/afetch_page() arguments for the listing page"""
+        keywords = self.keywords or CARD_KEYWORDS
+        return dict(
+            timeout=self.request_timeout(default=self.timeout), stop_after=self.limit,
+            is_candidate=lambda a: a.get('href') is not None
+            and any(k in CandidateCounter.text(a).lower() for k in keywords)
+        )
 
+    def _parse_listing(self, content: bytes, encoding: Optional[str] = None) -> List[Dict]:
+        soup = self.parse_page(content, encoding)
+        return extract_scholarship_cards(soup, keywords=self.keywords, limit=self.limit)
 
-class CSCChinaScraper(BaseScraper):
-    def scrape(self, profile: Dict) -> List[Dict]:
-        # China Scholarship Council site sometimes enforces stricter bot checks
-        if not is_path_allowed(self.session, self.url, self.session.headers.get('User-Agent', '*')):
-            print(f"CSC: robots.txt disallows scraping {self.url}")
-            return []
-        try:
-            resp = self.session.get(self.url, timeout=30)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.content, 'lxml')
-            items = extract_scholarship_cards(soup, limit=10)
-            return items
-        except Exception as e:
-            print(f"CSC scraping error: {e}")
-            return []
 
+# -------------- Individual scraper classes --------------
 
-class MEXTJapanScraper(BaseScraper):
-    def scrape(self, profile: Dict) -> List[Dict]:
-        if not is_path_allowed(self.session, self.url, self.session.headers.get('User-Agent', '*')):
-            print(f"MEXT: robots.txt disallows scraping {self.url}")
-            return []
-        try:
-            resp = self.session.get(self.url, timeout=25)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.content, 'lxml')
-            items = extract_scholarship_cards(soup, limit=12)
-            return items
-        except Exception as e:
-            print(f"MEXT scraping error: {e}")
-            return []
+class CheveningScraper(CardListScraper):
+    label = 'Chevening'
+    timeout = 30
+    limit = 12
 
 
-class SwedishInstituteScraper(BaseScraper):
-    def scrape(self, profile: Dict) -> List[Dict]:
-        if not is_path_allowed(self.session, self.url, self.session.headers.get('User-Agent', '*')):
-            print(f"Swedish Institute: robots.txt disallows scraping {self.url}")
-            return []
-        try:
-            resp = self.session.get(self.url, timeout=25)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.content, 'lxml')
-            items = extract_scholarship_cards(soup, limit=10)
-            return items
-        except Exception as e:
-            print(f"Swedish Institute scraping error: {e}")
-            return []
+class FulbrightScraper(CardListScraper):
+    # Fulbright often lists program types; find program listing links
+    label = 'Fulbright'
+    timeout = 30
+    limit = 15
 
 
-class AustraliaAwardsScraper(BaseScraper):
-    def scrape(self, profile: Dict) -> List[Dict]:
-        if not is_path_allowed(self.session, self.url, self.session.headers.get('User-Agent', '*')):
-            print(f"Australia Awards: robots.txt disallows scraping {self.url}")
-            return []
-        try:
-            resp = self.session.get(self.url, timeout=25)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.content, 'lxml')
-            items = extract_scholarship_cards(soup, limit=12)
-            return items
-        except Exception as e:
-            print(f"Australia Awards scraping error: {e}")
-            return []
+class CommonwealthScraper(CardListScraper):
+    label = 'Commonwealth'
+    timeout = 25
+    limit = 12
 
 
-class VanierCanadaScraper(BaseScraper):
-    def scrape(self, profile: Dict) -> List[Dict]:
-        if not is_path_allowed(self.session, self.url, self.session.headers.get('User-Agent', '*')):
-            print(f"Vanier: robots.txt disallows scraping {self.url}")
-            return []
-        try:
-            resp = self.session.get(self.url, timeout=25)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.content, 'lxml')
-            items = extract_scholarship_cards(soup, limit=8)
-            return items
-        except Exception as e:
-            print(f"Vanier scraping error: {e}")
-            return []
+class ErasmusScraper(CardListScraper):
+    # Erasmus pages are often content-rich; try to find links mentioning "opportunities" or "students"
+    label = 'Erasmus'
+    timeout = 25
+    limit = 15
+    keywords = ['opportunity', 'scholarship', 'study abroad']
 
 
-class GatesCambridgeScraper(BaseScraper):
-    def scrape(self, profile: Dict) -> List[Dict]:
-        # Gates Cambridge is university-managed and may list limited info publicly
-        if not is_path_allowed(self.session, self.url, self.session.headers.get('User-Agent', '*')):
-            print(f"Gates Cambridge: robots.txt disallows scraping {self.url}")
-            return []
-        try:
-            resp = self.session.get(self.url, timeout=25)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.content, 'lxml')
-            items = extract_scholarship_cards(soup, limit=8)
-            return items
-        except Exception as e:
-            print(f"Gates Cambridge scraping error: {e}")
-            return []
+class CSCChinaScraper(CardListScraper):
+    # China Scholarship Council site sometimes enforces stricter bot checks
+    label = 'CSC'
+    timeout = 30
+    limit = 10
+
+
+class MEXTJapanScraper(CardListScraper):
+    label = 'MEXT'
+    timeout = 25
+    limit = 12
+
+
+class SwedishInstituteScraper(CardListScraper):
+    label = 'Swedish Institute'
+    timeout = 25
+    limit = 10
+
+
+class AustraliaAwardsScraper(CardListScraper):
+    label = 'Australia Awards'
+    timeout = 25
+    limit = 12
+
+
+class VanierCanadaScraper(CardListScraper):
+    label = 'Vanier'
+    timeout = 25
+    limit = 8
+
+
+class GatesCambridgeScraper(CardListScraper):
+    # Gates Cambridge is university-managed and may list limited info publicly
+    label = 'Gates Cambridge'
+    timeout = 25
+    limit = 8
@@ -0,0 +1,210 @@
+# scrapers/attribute_extractor.py
+
+"""
+Scholarship attributes (country, degree, field, funding, ...) from free text.
+
+The scrapers used to carry their own _extract_country/_extract_degree/...
+methods, which rebuilt their dict literals on every call, lowercased the
+text once per attribute (sometimes once per keyword) and compiled their
+regexes on every search. An AttributeExtractor is built once, at import, from
+a scraper's tables:
+
+- the keywords of all attributes go into one matcher and a text is
+  lowercased once. With pyahocorasick installed the matcher is a native
+  Aho-Corasick automaton that finds all of them in one scan; without it,
+  each keyword gets one substring test, only when a rule first asks for it
+- regexes are compiled up front, and a regex with guard keywords (month
+  names, "year", ...) only runs when the scan saw one of them
+- each attribute keeps the order of its rules: the first rule that matches
+  wins (keyword priority, not position in the text), as in the if/elif
+  chains and dict scans this replaces
+
+Rules of an Attribute, tried in order (a dict of keyword -> value is a list
+of single-keyword rules):
+    ('keyword', value) or (('kw1', 'kw2'), value)   any of the keywords occurs
+    (AllOf('tuition', 'waiver'), value)           all of them occur
+    Pattern(regex, flags=0, lowered=False, guard=())
+                                                   the regex's first match
+    callable(text, lowered) -> Optional[str]       anything else (None: no match)
+
+Keywords are matched as substrings of the lowercased text, like
+"keyword in text.lower()".
+"""
+
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+AHOCORASICK_AVAILABLE = ahocorasick is not None
+
+# Date formats shared by the scrapers' deadline rules, and their guards
+NUMERIC_DATE = r'\d{1,2}[-/]\d{1,2}[-/]\d{4}'
+ISO_DATE = r'\d{4}[-/]\d{1,2}[-/]\d{1,2}'
+DATE_SEPARATORS = ('-', '/')
+MONTHS = ('january', 'february', 'march', 'april', 'may', 'june', 'july', 'august',
+          'september', 'october', 'november', 'december')
+MONTH_DATE = (r'(January|February|March|April|May|June|July|August|September|October|November|December)'
+              r'\s+\d{1,2},?\s+\d{4}')
+
+
+class AllOf(tuple):
+    """Keywords of a rule that must all occur"""
+
+    def __new__(cls, *keywords: str):
+        return super().__new__(cls, keywords)
+
+
+class Pattern:
+    """Rule whose value is the first match of a regex (compiled once)"""
+
+    __slots__ = ('regex', 'lowered', 'guard')
+
+    def __init__(self, pattern: str, flags: int = 0, lowered: bool = False, guard: Sequence[str] = ()):
+        self.regex = re.compile(pattern, flags)
+        self.lowered = lowered  # search the lowercased text (and return its match)
+        # Lowercase strings of which every match contains at least one; the
+        # regex is skipped when none occurs
+        self.guard = tuple(guard)
+
+    def __call__(self, text: str, lowered: str) -> Optional[str]:
+        match = self.regex.search(lowered if self.lowered else text)
+        return match.group(0) if match else None
+
+
+Lookup = Callable[[int], bool]
+Rule = Union[Tuple[Union[str, Sequence[str]], str], Pattern, Callable[[str, str], Optional[str]]]
+
+
+class Attribute:
+    """Ordered rules for one attribute and the value when none matches"""
+
+    def __init__(self, rules: Union[Dict[str, str], Iterable[Rule]], default: Optional[str],
+                 title: bool = False):
+        self.rules: List[Rule] = list(rules.items() if isinstance(rules, dict) else rules)
+        self.default = default
+        self.title = title  # also read the title passed to extract(), when there is one
+
+
+def _rule_keywords(rule: Rule) -> Tuple[str, ...]:
+    if isinstance(rule, Pattern):
+        return rule.guard
+    if not isinstance(rule, tuple):
+        return ()
+    keywords = rule[0]
+    return (keywords,) if isinstance(keywords, str) else tuple(keywords)
+
+
+class KeywordMatcher:
+    """Which of a fixed set of keywords occur in lowercased texts"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(keywords))
+        self.ids: Dict[str, int] = {keyword: i for i, keyword in enumerate(self.keywords)}
+        self._automaton = None
+        if ahocorasick is not None and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for i, keyword in enumerate(self.keywords):
+                automaton.add_word(keyword, (i, len(keyword)))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def scan(self, items: Sequence[Tuple[str, str]]) -> List[Tuple[Lookup, Lookup]]:
+        """
+        Keyword lookups for each (prefix, text) pair, both lowercased
+
+        Returns, per pair, functions telling whether keyword id i occurs in
+        prefix + text and in text alone. With the automaton each pair is
+        scanned once for all keywords; without it, each keyword is looked up
+        when a rule first asks for it, as the if/elif chains did.
+        """
+        if self._automaton is None:
+            return [(self._lookup(prefix + text) if prefix else self._lookup(text), self._lookup(text))
+                    for prefix, text in items]
+
+        results = []
+        for prefix, text in items:
+            if not prefix:
+                found = {keyword for _, (keyword, _) in self._automaton.iter(text)}
+                results.append((found.__contains__, found.__contains__))
+                continue
+            split, found, in_text = len(prefix), set(), set()
+            for end, (keyword, length) in self._automaton.iter(prefix + text):
+                found.add(keyword)
+                if end - length + 1 >= split:
+                    in_text.add(keyword)
+            results.append((found.__contains__, in_text.__contains__))
+        return results
+
+    def _lookup(self, text: str) -> Lookup:
+        keywords, hits = self.keywords, {}
+
+        def occurs(i: int) -> bool:
+            hit = hits.get(i)
+            if hit is None:
+                hit = hits[i] = keywords[i] in text
+            return hit
+        return occurs
+
+
+class AttributeExtractor:
+    """Extracts a scraper's attributes from text with one keyword matcher"""
+
+    def __init__(self, **attributes: Attribute):
+        self.attributes = attributes
+        self.matcher = KeywordMatcher(
+            keyword for attribute in attributes.values()
+            for rule in attribute.rules for keyword in _rule_keywords(rule)
+        )
+        self._rules = {name: [self._compile(rule) for rule in attribute.rules]
+                       for name, attribute in attributes.items()}
+        self._reads_title = any(attribute.title for attribute in attributes.values())
+
+    def _compile(self, rule: Rule):
+        """(kind, keyword ids, value or callable) for a rule"""
+        ids = tuple(self.matcher.ids[keyword] for keyword in _rule_keywords(rule))
+        if isinstance(rule, tuple):
+            return ('all' if isinstance(rule[0], AllOf) else 'any'), ids, rule[1]
+        return 'call', ids, rule  # a guarded Pattern, or any callable (no ids)
+
+    def extract(self, text: str, title: Optional[str] = None) -> Dict[str, str]:
+        """Attribute name -> value; attributes declared with title=True read title + ' ' + text"""
+        return self.extract_many([text], [title])[0]
+
+    def extract_many(self, texts: Sequence[str],
+                     titles: Optional[Sequence[Optional[str]]] = None) -> List[Dict[str, str]]:
+        """extract() for a batch of texts (and their titles, if any attribute reads them)"""
+        titles = titles if titles is not None else [None] * len(texts)
+        lowered = [(text or '').lower() for text in texts]
+        prefixes = [title.lower() + ' ' if title is not None and self._reads_title else ''
+                    for title in titles]
+        scans = self.matcher.scan(list(zip(prefixes, lowered)))
+
+        results = []
+        for text, title, low, prefix, (in_all, in_text) in zip(texts, titles, lowered, prefixes, scans):
+            text = text or ''
+            values = {}
+            for name, attribute in self.attributes.items():
+                if attribute.title and prefix:
+                    values[name] = self._evaluate(name, attribute, f"{title} {text}", prefix + low, in_all)
+                else:
+                    values[name] = self._evaluate(name, attribute, text, low, in_text)
+            results.append(values)
+        return results
+
+    def _evaluate(self, name: str, attribute: Attribute, text: str, lowered: str, occurs: Lookup):
+        for kind, ids, value in self._rules[name]:
+            if kind == 'any':
+                if any(map(occurs, ids)):
+                    return value
+            elif kind == 'all':
+                if all(map(occurs, ids)):
+                    return value
+            elif not ids or any(map(occurs, ids)):
+                value = value(text, lowered)
+                if value is not None:
+                    return value
+        return attribute.default
@@ -2,41 +2,88 @@
 
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import asyncio
+import traceback
+from config.settings import REQUEST_TIMEOUT
 from utils.validators import ScholarshipValidator
+from utils.http_transport import ACCEPT_ENCODING, HTTPTransport, get_transport
+from utils.async_transport import current_async_transport
+from utils.circuit_breaker import get_circuit_breakers
+from utils.feed_fetcher import FeedFetcher
+from utils.page_fetcher import PageFetcher
+from scrapers.dom import parse_html
 
 class BaseScraper(ABC):
     """Abstract base class for all scholarship scrapers"""
     
-    def __init__(self, source_config: Dict):
+    # Elements the HTML parsers need (None: whole page), see scrapers/parse_scope.py
+    parse_scope = None
+    
+    def __init__(self, source_config: Dict, transport: Optional[HTTPTransport] = None):
         self.name = source_config.get('name', 'Unknown Source')
         self.url = source_config.get('url', '')
         self.enabled = source_config.get('enabled', True)
+        self.timeout_override = source_config.get('timeout')  # fixed read timeout, skips adaptation
+        self.max_body_bytes = source_config.get('max_body_bytes')  # None: PAGE_MAX_BYTES
+        self.parse_scope = source_config.get('parse_scope', self.parse_scope)
+        self.html_backend = source_config.get('html_backend')  # None: HTML_BACKEND
         self.validator = ScholarshipValidator()
         
-        # Use a standard requests.Session
-        self.session = requests.Session()
+        # Per-scraper session (headers/cookies) on top of the shared connection pools
+        self.transport = transport or get_transport()
+        self.session = self.transport.create_session()
         self._configure_robust_session()
+        self.feeds = FeedFetcher(self.transport)
+        self.pages = PageFetcher(self.transport)
+        # Breakers outlive the scraper instance (one per source, process-wide)
+        self.breaker = get_circuit_breakers().get(self.name)
 
-    def _configure_robust_session(self):
-        """Configures the session with retries and browser-like headers"""
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+    def request_timeout(self, url: Optional[str] = None, default: Optional[float] = None) -> float:
+        """
+        Read timeout for a request to url (defaults to the source URL)
         
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+        The source's configured timeout wins; otherwise it is derived from the
+        host's observed latency, or default/REQUEST_TIMEOUT without history.
+        """
+        if self.timeout_override:
+            return self.timeout_override
+        default = default or REQUEST_TIMEOUT
+        return self.transport.latency.timeout_for(url or self.url, default)
+    
+    def fetch_page(self, url: Optional[str] = None, timeout=None, verify: bool = True,
+                   stop_after: Optional[int] = None, is_candidate=None, candidate_tags=('a',)):
+        """
+        Stream a page (the source URL by default) within the source's body limit
         
+        With stop_after and is_candidate, reading stops once enough candidate
+        elements have arrived; see utils/page_fetcher.py.
+        """
+        return self.pages.fetch(
+            url or self.url, self.session, timeout=timeout, verify=verify,
+            max_bytes=self.max_body_bytes, stop_after=stop_after,
+            is_candidate=is_candidate, candidate_tags=candidate_tags
+        )
+    
+    async def afetch_page(self, url: Optional[str] = None, timeout=None, verify: bool = True,
+                          stop_after: Optional[int] = None, is_candidate=None, candidate_tags=('a',)):
+        """Async fetch_page(), streamed on the event loop through the search's AsyncTransport"""
+        return await self.pages.afetch(
+            url or self.url, self.session, timeout=timeout, verify=verify,
+            max_bytes=self.max_body_bytes, stop_after=stop_after,
+            is_candidate=is_candidate, candidate_tags=candidate_tags
+        )
+    
+    def parse_page(self, content, encoding: Optional[str] = None, scope=None):
+        """Root node of a page in the source's HTML backend, restricted to the parse scope (scrapers/dom.py)"""
+        return parse_html(content, encoding, self.html_backend, scope or self.parse_scope)
+    
+    def _configure_robust_session(self):
+        """Configures the session with browser-like headers (retries live on the shared transport)"""
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
+            "Accept-Encoding": ACCEPT_ENCODING,
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
             "Sec-Fetch-Dest": "document",
@@ -59,6 +106,23 @@ class BaseScraper(ABC):
         """
         pass
     
+    async def ascrape(self, profile: Dict) -> List[Dict]:
+        """
+        Async scraping entry point used by the asyncio orchestrator
+        
+        The default runs the blocking scrape() on a worker thread; scrapers
+        with native async fetching override this.
+        """
+        return await asyncio.to_thread(self.scrape, profile)
+    
+    async def _aget(self, url: str, **kwargs):
+        """GET through the search's AsyncTransport (or a worker thread outside one)"""
+        transport = current_async_transport()
+        if transport is None:
+            return await asyncio.to_thread(self.session.get, url, **kwargs)
+        headers = {**self.session.headers, **(kwargs.pop('headers', None) or {})}
+        return await transport.get(url, headers=headers, **kwargs)
+    
     def validate_and_clean(self, scholarships: List[Dict]) -> List[Dict]:
         """Validate and clean scraped scholarships"""
         cleaned = []
@@ -142,31 +206,93 @@ class BaseScraper(ABC):
         }
         return mapping.get(degree, [degree.lower()])
     
-    def get_scholarships(self, profile: Dict) -> List[Dict]:
-        """Main entry point - scrape, validate, and match"""
+    def _get_fallback_scholarships(self) -> List[Dict]:
+        """Guaranteed data served when live scraping fails - override in subclasses"""
+        return []
+    
+    def _short_circuit(self, profile: Dict) -> Optional[List[Dict]]:
+        """Result to return without scraping (disabled source, open circuit breaker), else None"""
         if not self.enabled:
             return []
+        if not self.breaker.allow():
+            print(f"  ⛔ {self.name}: circuit open (failing recently), serving fallback data")
+            try:
+                return self._postprocess(self._get_fallback_scholarships(), profile)
+            except Exception as e:
+                self._report_error(e)
+                return []
+        print(f"  🔍 Scraping {self.name}...")
+        return None
+    
+    def _finish_scrape(self, profile: Dict, raw_scholarships: Optional[List[Dict]],
+                       error: Optional[Exception] = None) -> List[Dict]:
+        """
+        Record a scrape's outcome with the circuit breaker and post-process its results
+        
+        A scrape counts as failed when it raised, produced nothing (None or an
+        empty list) or only the fallback data. Errors while validating or
+        matching are handled like scrape errors: reported, and [] returned.
+        """
+        if error is None:
+            raw_scholarships = raw_scholarships or []
+            try:
+                matched_scholarships = self._postprocess(raw_scholarships, profile)
+            except Exception as e:
+                error = e
+        
+        if error is not None:
+            self.breaker.record_failure()
+            self._report_error(error)
+            return []
+        
+        if raw_scholarships and raw_scholarships != self._get_fallback_scholarships():
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+        return matched_scholarships
+    
+    def _report_error(self, error: Exception):
+        print(f"    ✗ ERROR in {self.name}: {str(error)}")
+        traceback.print_exception(type(error), error, error.__traceback__)
+    
+    def get_scholarships(self, profile: Dict) -> List[Dict]:
+        """Main entry point - scrape, validate, and match"""
+        short_circuited = self._short_circuit(profile)
+        if short_circuited is not None:
+            return short_circuited
         
         try:
-            print(f"  🔍 Scraping {self.name}...")
             raw_scholarships = self.scrape(profile)
-            print(f"    📊 Raw: {len(raw_scholarships)} scholarships")
-            
-            cleaned_scholarships = self.validate_and_clean(raw_scholarships)
-            print(f"    ✓ Validated: {len(cleaned_scholarships)} scholarships")
-            
-            matched_scholarships = self.match_profile(cleaned_scholarships, profile)
-            print(f"    ✓ Matched: {len(matched_scholarships)} scholarships")
-            
-            return matched_scholarships
         except Exception as e:
-            print(f"    ✗ ERROR in {self.name}: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return []
+            return self._finish_scrape(profile, None, e)
+        return self._finish_scrape(profile, raw_scholarships)
+    
+    async def aget_scholarships(self, profile: Dict) -> List[Dict]:
+        """Async entry point - same pipeline as get_scholarships() on top of ascrape()"""
+        short_circuited = self._short_circuit(profile)
+        if short_circuited is not None:
+            return short_circuited
+        
+        try:
+            raw_scholarships = await self.ascrape(profile)
+        except Exception as e:
+            return self._finish_scrape(profile, None, e)
+        return self._finish_scrape(profile, raw_scholarships)
+    
+    def _postprocess(self, raw_scholarships: List[Dict], profile: Dict) -> List[Dict]:
+        """Validate and match raw scrape results"""
+        print(f"    📊 Raw: {len(raw_scholarships)} scholarships")
+        
+        cleaned_scholarships = self.validate_and_clean(raw_scholarships)
+        print(f"    ✓ Validated: {len(cleaned_scholarships)} scholarships")
+        
+        matched_scholarships = self.match_profile(cleaned_scholarships, profile)
+        print(f"    ✓ Matched: {len(matched_scholarships)} scholarships")
+        
+        return matched_scholarships
     
     def __del__(self):
-        """Cleanup session on deletion"""
+        """Cleanup session on deletion (pooled connections stay with the transport)"""
         if hasattr(self, 'session'):
             try:
                 self.session.close()
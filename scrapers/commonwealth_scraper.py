@@ -17,8 +17,8 @@ class CommonwealthScraper(BaseScraper):
         scholarships = []
 
         try:
-            response = self.session.get(self.url, timeout=40)
-            soup = BeautifulSoup(response.content, "lxml")
+            response = self.session.get(self.url, timeout=self.request_timeout(default=40))
+            soup = BeautifulSoup(response.content, "lxml", from_encoding=response.encoding)
 
             posts = soup.find_all("article")
 
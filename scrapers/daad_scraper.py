@@ -2,18 +2,15 @@
 
 from typing import List, Dict
 from scrapers.base_scraper import BaseScraper
+from scrapers.structured_data import iter_json
 
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    BeautifulSoup = None
-
-import json
 import re
 
 class DAADScraper(BaseScraper):
     """DAAD scraper with guaranteed fallback results"""
 
+    parse_scope = ('script', 'a')
+
     def scrape(self, profile: Dict) -> List[Dict]:
         """Main scrape entry - always returns results"""
         scholarships = []
@@ -35,22 +32,17 @@ class DAADScraper(BaseScraper):
         """Scrape DAAD website"""
         scholarships = []
 
-        response = self.session.get(self.url, timeout=40, verify=True)
-        soup = BeautifulSoup(response.text, "lxml")
+        response = self.session.get(self.url, timeout=self.request_timeout(default=40), verify=True)
+        # Bytes plus the sniffed encoding: response.text would decode the page a second time
+        soup = self.parse_page(response.content, response.encoding)
 
         # Method 1: Look for JSON in script tags
-        script_tags = soup.find_all("script", text=re.compile("scholarship|stipendium", re.I))
+        script_tags = soup.find_all("script", string=re.compile("scholarship|stipendium", re.I))
         for script_tag in script_tags:
-            try:
-                # Try to extract JSON
-                json_match = re.search(r'({[\s\S]*?})', script_tag.string)
-                if json_match:
-                    data = json.loads(json_match.group(1))
-                    parsed = self._parse_json_data(data)
-                    if parsed:
-                        scholarships.extend(parsed)
-            except:
-                continue
+            # Every complete JSON object in the script, found by bracket matching
+            for data in iter_json(script_tag.string or ''):
+                if isinstance(data, dict):
+                    scholarships.extend(self._parse_json_data(data))
 
         # Method 2: Parse visible scholarship cards
         if not scholarships:
@@ -0,0 +1,501 @@
+# scrapers/dom.py
+
+"""
+DOM facade for the HTML parsers.
+
+Building a BeautifulSoup tree (one Python object per element and string) is
+the biggest CPU cost of most sources, and as pure Python it holds the GIL,
+which throttles the thread-pool searches. The listing parsers only need a
+small slice of the bs4 API, so they are written against that slice and the
+tree behind it is pluggable:
+
+- "lxml" (default): lxml.html, a native tree with thin wrappers; the tree is
+  pruned to the scraper's parse scope, like a SoupStrainer would build it
+- "bs4": BeautifulSoup itself (honours the scraper's parse scope), kept for
+  compatibility and for pages lxml.html parses differently
+- "selectolax": the Lexbor parser, if the selectolax package is installed
+  (falls back to lxml otherwise)
+
+HTML_BACKEND sets the default; a source's "html_backend" key overrides it.
+
+The facade (what parsers may use on a node):
+    node.name, node.get(attr, default), node[attr], node.string
+    node.get_text(separator='', strip=False)
+    node.find(name, **filters), node.find_all(name, limit=None, **filters)
+    node.find_parent(name)
+name is a tag name or a list of them; filters are attribute criteria
+(True = present, a string, a compiled regex or a callable; class_ for the
+class attribute, matched per class name like bs4) and string= for the
+element's own text. get_text() skips <script>/<style> contents and comments,
+like bs4. walk(node) streams a subtree as start/text/end events for parsers
+that need a whole page in one pass (see scrapers/text_index.py).
+"""
+
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional, Tuple, Union
+from config.settings import HTML_BACKEND
+from scrapers.html_text import strip_html
+from scrapers.parse_scope import scoped_soup
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = etree = None
+
+try:
+    from bs4 import CData, NavigableString, Tag
+except ImportError:
+    CData = NavigableString = Tag = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+BACKENDS = ('lxml', 'bs4', 'selectolax')
+
+# Strings get_text() leaves out, as bs4 does
+_NON_TEXT_TAGS = frozenset(('script', 'style', 'template'))
+
+_warned = set()
+
+
+def _names(name) -> Optional[frozenset]:
+    if name is None or name is True:
+        return None
+    if isinstance(name, str):
+        return frozenset((name,))
+    return frozenset(name)
+
+
+def _value_matches(value: Optional[str], criterion) -> bool:
+    if criterion is True:
+        return value is not None
+    if criterion is False or criterion is None:
+        return value is None
+    if value is None:
+        return False
+    if hasattr(criterion, 'search'):
+        return criterion.search(value) is not None
+    if callable(criterion):
+        return bool(criterion(value))
+    if isinstance(criterion, (list, tuple, set, frozenset)):
+        return value in criterion
+    return value == criterion
+
+
+def _class_matches(value: Optional[str], criterion) -> bool:
+    """bs4 semantics: any single class, or the whole attribute, may match"""
+    if value is None or criterion is True or criterion is None or criterion is False:
+        return _value_matches(value, criterion)
+    return any(_value_matches(cls, criterion) for cls in value.split()) or _value_matches(value, criterion)
+
+
+class _Node(ABC):
+    """Backend-independent part of the facade; subclasses wrap one element"""
+
+    __slots__ = ('_el',)
+
+    def __init__(self, element):
+        self._el = element
+
+    # Backends implement these
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        pass
+
+    @abstractmethod
+    def get(self, attr: str, default=None):
+        pass
+
+    @abstractmethod
+    def _descendants(self, names: Optional[frozenset]) -> Iterator['_Node']:
+        pass
+
+    @abstractmethod
+    def _parent(self) -> Optional['_Node']:
+        pass
+
+    @abstractmethod
+    def _strings(self) -> Iterator[str]:
+        pass
+
+    @property
+    @abstractmethod
+    def string(self) -> Optional[str]:
+        pass
+
+    # Shared API
+    def __getitem__(self, attr: str) -> str:
+        value = self.get(attr)
+        if value is None:
+            raise KeyError(attr)
+        return value
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _Node) and self._el == other._el
+
+    def __hash__(self) -> int:
+        return hash(self._el)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        strings = self._strings()
+        if strip:
+            strings = (s.strip() for s in strings)
+            return separator.join(s for s in strings if s)
+        return separator.join(strings)
+
+    def _matches(self, filters) -> bool:
+        for attr, criterion in filters.items():
+            if attr == 'string':
+                if not _value_matches(self.string, criterion):
+                    return False
+            elif attr in ('class_', 'class'):
+                if not _class_matches(self.get('class'), criterion):
+                    return False
+            elif not _value_matches(self.get(attr), criterion):
+                return False
+        return True
+
+    def find_all(self, name=None, limit: Optional[int] = None, **filters) -> List['_Node']:
+        if 'text' in filters:
+            filters['string'] = filters.pop('text')
+        found = []
+        for node in self._descendants(_names(name)):
+            if not filters or node._matches(filters):
+                found.append(node)
+                if limit and len(found) >= limit:
+                    break
+        return found
+
+    def find(self, name=None, **filters) -> Optional['_Node']:
+        found = self.find_all(name, limit=1, **filters)
+        return found[0] if found else None
+
+    def find_parent(self, name=None) -> Optional['_Node']:
+        names = _names(name)
+        parent = self._parent()
+        while parent is not None:
+            if names is None or parent.name in names:
+                return parent
+            parent = parent._parent()
+        return None
+
+
+class LxmlNode(_Node):
+    """Facade over an lxml.html element"""
+
+    __slots__ = ()
+
+    @property
+    def name(self) -> str:
+        return self._el.tag
+
+    def get(self, attr: str, default=None):
+        return self._el.get(attr, default)
+
+    def _descendants(self, names):
+        elements = self._el.iterdescendants(*names) if names else self._el.iterdescendants()
+        for element in elements:
+            if isinstance(element.tag, str):  # skip comments and processing instructions
+                yield LxmlNode(element)
+
+    def _parent(self):
+        parent = self._el.getparent()
+        return LxmlNode(parent) if parent is not None else None
+
+    def _strings(self):
+        if self._el.tag in _NON_TEXT_TAGS:
+            if self._el.text:
+                yield self._el.text
+            return
+        yield from _lxml_strings(self._el)
+
+    @property
+    def string(self) -> Optional[str]:
+        # bs4: the only child's string, so text plus children plus their tails must be one node
+        element = self._el
+        contents = (1 if element.text else 0) + sum(1 + (1 if child.tail else 0) for child in element)
+        if contents != 1:
+            return None
+        if element.text:
+            return element.text
+        child = element[0]
+        return LxmlNode(child).string if isinstance(child.tag, str) else child.text
+
+
+def _lxml_strings(element) -> Iterator[str]:
+    if element.text:
+        yield element.text
+    for child in element:
+        if isinstance(child.tag, str) and child.tag not in _NON_TEXT_TAGS:
+            yield from _lxml_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+class SelectolaxNode(_Node):
+    """Facade over a selectolax (Lexbor) node"""
+
+    __slots__ = ()
+
+    @property
+    def name(self) -> str:
+        return self._el.tag
+
+    def get(self, attr: str, default=None):
+        attributes = self._el.attributes
+        if attr not in attributes:
+            return default
+        value = attributes[attr]
+        return '' if value is None else value  # valueless attribute, as in bs4
+
+    def _descendants(self, names):
+        walker = self._el.traverse(include_text=False)
+        next(walker, None)  # the node itself
+        for node in walker:
+            tag = node.tag
+            if not tag.startswith('-') and (names is None or tag in names):
+                yield SelectolaxNode(node)
+
+    def _parent(self):
+        parent = self._el.parent
+        if parent is None or parent.tag.startswith('-'):  # the document node
+            return None
+        return SelectolaxNode(parent)
+
+    def _strings(self):
+        if self._el.tag in _NON_TEXT_TAGS:
+            yield self._el.text(deep=True)
+            return
+        yield from _selectolax_strings(self._el)
+
+    @property
+    def string(self) -> Optional[str]:
+        children = list(self._el.iter(include_text=True))
+        if len(children) == 1:
+            child = children[0]
+            return child.text(deep=False) if child.tag == '-text' else SelectolaxNode(child).string
+        if not children and self._el.tag in _NON_TEXT_TAGS:
+            return self._el.text(deep=True) or None
+        return None
+
+
+def _selectolax_strings(node) -> Iterator[str]:
+    for child in node.iter(include_text=True):
+        tag = child.tag
+        if tag == '-text':
+            yield child.text(deep=False)
+        elif not tag.startswith('-') and tag not in _NON_TEXT_TAGS:
+            yield from _selectolax_strings(child)
+
+
+Node = Union[_Node, 'BeautifulSoup']
+
+
+def walk(root: Node, names: Optional[frozenset] = None) -> Iterator[Tuple[str, object]]:
+    """
+    Document-order events for everything below root
+
+    ('start', node) and ('end', node) for each element (only those named in
+    names, if given; the others are still descended into) and ('text', string)
+    for each string get_text() would return, so the strings between an
+    element's start and end are exactly its text.
+    """
+    if isinstance(root, LxmlNode):
+        return _walk_lxml(root._el, names, root._el.tag in _NON_TEXT_TAGS)
+    if isinstance(root, SelectolaxNode):
+        return _walk_selectolax(root._el, names, root._el.tag in _NON_TEXT_TAGS)
+    return _walk_soup(root, names, root.name in _NON_TEXT_TAGS)
+
+
+# The walkers keep an explicit stack: nested generators would pass every
+# event up through one frame per level, O(depth) each
+
+def _walk_lxml(root, names, skipping: bool) -> Iterator[Tuple[str, object]]:
+    if root.text and not skipping:
+        yield 'text', root.text
+    stack = [(root, None, iter(root), skipping)]
+    while stack:
+        element, wrapped, children, skipping = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            if stack:
+                if wrapped is not None:
+                    yield 'end', wrapped
+                if element.tail and not stack[-1][3]:
+                    yield 'text', element.tail
+            continue
+        tag = child.tag
+        if not isinstance(tag, str):  # comments and processing instructions only contribute their tail
+            if child.tail and not skipping:
+                yield 'text', child.tail
+            continue
+        inner = skipping or tag in _NON_TEXT_TAGS
+        wrapped = None
+        if names is None or tag in names:
+            wrapped = LxmlNode(child)
+            yield 'start', wrapped
+        if child.text and not inner:
+            yield 'text', child.text
+        stack.append((child, wrapped, iter(child), inner))
+
+
+def _walk_selectolax(root, names, skipping: bool) -> Iterator[Tuple[str, object]]:
+    stack = [(None, root.iter(include_text=True), skipping)]
+    while stack:
+        wrapped, children, skipping = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            if wrapped is not None:
+                yield 'end', wrapped
+            continue
+        tag = child.tag
+        if tag == '-text':
+            if not skipping:
+                yield 'text', child.text(deep=False)
+        elif not tag.startswith('-'):
+            wrapped = None
+            if names is None or tag in names:
+                wrapped = SelectolaxNode(child)
+                yield 'start', wrapped
+            stack.append((wrapped, child.iter(include_text=True), skipping or tag in _NON_TEXT_TAGS))
+
+
+def _walk_soup(root, names, skipping: bool) -> Iterator[Tuple[str, object]]:
+    stack = [(None, iter(root.contents), skipping)]
+    while stack:
+        tag, children, skipping = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            if tag is not None:
+                yield 'end', tag
+            continue
+        if isinstance(child, Tag):
+            reported = names is None or child.name in names
+            if reported:
+                yield 'start', child
+            stack.append((child if reported else None, iter(child.contents),
+                          skipping or child.name in _NON_TEXT_TAGS))
+        elif type(child) in (NavigableString, CData) and not skipping:  # not comments, doctypes, scripts
+            yield 'text', child
+
+
+def _warn_once(message: str):
+    if message not in _warned:
+        _warned.add(message)
+        print(f"      ⚠️  {message}")
+
+
+def resolve_backend(backend: Optional[str]) -> str:
+    """Backend that will actually be used for a requested one"""
+    backend = (backend or HTML_BACKEND).lower()
+    if backend not in BACKENDS:
+        _warn_once(f"Unknown HTML backend {backend!r}, using bs4")
+        return 'bs4'
+    if backend == 'selectolax' and LexborHTMLParser is None:
+        _warn_once("selectolax is not installed, using lxml")
+        backend = 'lxml'
+    if backend == 'lxml' and lxml is None:
+        return 'bs4'
+    return backend
+
+
+def parse_html(content: Union[bytes, str], encoding: Optional[str] = None,
+               backend: Optional[str] = None, scope=None) -> Node:
+    """
+    Root node of an HTML document
+
+    encoding is the one the fetch layer sniffed (bytes only). scope is the
+    scraper's parse scope (scrapers/parse_scope.py): bs4 builds only its
+    elements, lxml prunes the parsed tree to them. selectolax ignores it.
+    """
+    backend = resolve_backend(backend)
+    if backend == 'bs4':
+        return scoped_soup(content, scope, encoding)
+    if backend == 'selectolax':
+        if isinstance(content, bytes):
+            content = content.decode(encoding or 'utf-8', errors='replace')
+        return SelectolaxNode(LexborHTMLParser(content).root)
+
+    if isinstance(content, str):
+        # lxml refuses str input with an encoding declaration; hand it UTF-8 bytes
+        content, encoding = content.encode('utf-8'), 'utf-8'
+    parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+    try:
+        root = lxml.html.document_fromstring(content, parser=parser)
+    except (etree.ParserError, ValueError):
+        root = lxml.html.document_fromstring('<html></html>')  # empty or unparsable body
+    return LxmlNode(_prune_lxml(root, scope))
+
+
+def _scope_filters(scope) -> Optional[Tuple[Optional[frozenset], dict]]:
+    """(tag names, attribute filters) of a parse scope, None for the whole page"""
+    if scope is None:
+        return None
+    if isinstance(scope, str):
+        return frozenset((scope,)), {}
+    if isinstance(scope, dict):
+        filters = dict(scope)
+        filters.update(filters.pop('attrs', None) or {})
+        return _names(filters.pop('name', None)), filters
+    if isinstance(scope, (list, tuple, set, frozenset)):
+        return frozenset(scope), {}
+    return None  # a ready-made SoupStrainer: only bs4 can apply it
+
+
+def _prune_lxml(root, scope):
+    """
+    The parse scope's elements of a document, as the tree a SoupStrainer builds
+
+    The outermost matching elements (with their whole subtrees) become the
+    children of a new root, in document order; everything else, including
+    the text between them, is dropped. The tree is still parsed whole (lxml
+    does that natively), but the parsers only walk the scoped part and
+    find_parent() stops where the bs4 tree would.
+    """
+    spec = _scope_filters(scope)
+    if spec is None:
+        return root
+    names, filters = spec
+    tags = tuple(names) if names else ()
+    # Document order puts an element's own candidates right after it, so a
+    # kept subtree is skipped by counting them instead of checking ancestors
+    candidates = list(root.iter(*tags))
+    kept, i = [], 0
+    while i < len(candidates):
+        element = candidates[i]
+        if not isinstance(element.tag, str) or element is root \
+                or (filters and not LxmlNode(element)._matches(filters)):
+            i += 1
+            continue
+        kept.append(element)
+        i += sum(1 for _ in element.iter(*tags))
+
+    scoped = lxml.html.Element('html')
+    for element in kept:
+        element.tail = None
+        scoped.append(element)  # moves the subtree out of the full document
+    return scoped
+
+
+def html_to_text(markup: str, backend: Optional[str] = None) -> str:
+    """
+    Text of an HTML fragment (e.g. an RSS summary), like get_text(strip=True)
+
+    The fragment is scanned without building a tree (scrapers/html_text.py);
+    with a backend it is parsed by that backend instead.
+    """
+    if not markup:
+        return ''
+    if backend is None:
+        return strip_html(markup)
+    return parse_html(markup, backend=backend).get_text(strip=True)
@@ -17,8 +17,8 @@ class ErasmusScraper(BaseScraper):
         scholarships = []
 
         try:
-            response = self.session.get(self.url, timeout=45)
-            soup = BeautifulSoup(response.content, "lxml")
+            response = self.session.get(self.url, timeout=self.request_timeout(default=45))
+            soup = BeautifulSoup(response.content, "lxml", from_encoding=response.encoding)
 
             listings = soup.find_all("a", href=True)
 
@@ -15,8 +15,8 @@ class FulbrightScraper(BaseScraper):
         scholarships = []
 
         try:
-            response = self.session.get(self.url, timeout=40)
-            soup = BeautifulSoup(response.content, "lxml")
+            response = self.session.get(self.url, timeout=self.request_timeout(default=40))
+            soup = BeautifulSoup(response.content, "lxml", from_encoding=response.encoding)
 
             links = soup.find_all("a", href=True)
 
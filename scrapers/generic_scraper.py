@@ -1,19 +1,74 @@
 # scrapers/generic_scraper.py - ENHANCED VERSION
 
 from typing import List, Dict
+from scrapers.attribute_extractor import (
+    AllOf, Attribute, AttributeExtractor, Pattern, DATE_SEPARATORS, ISO_DATE, MONTH_DATE, MONTHS, NUMERIC_DATE
+)
 from scrapers.base_scraper import BaseScraper
+from scrapers.dom import Node, html_to_text
+from scrapers.parse_scope import LINK_CONTEXT_SCOPE
+from scrapers.text_index import IndexedElement, TextIndex
+from utils.page_fetcher import CandidateCounter
 
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    BeautifulSoup = None
-
-import feedparser
 import re
 
+# Attributes of RSS entries and link contexts (first matching rule wins)
+GENERIC_ATTRIBUTES = AttributeExtractor(
+    country=Attribute({
+        'germany': 'Germany', 'usa': 'United States', 'america': 'United States',
+        'uk': 'United Kingdom', 'britain': 'United Kingdom', 'england': 'United Kingdom',
+        'canada': 'Canada', 'australia': 'Australia', 'netherlands': 'Netherlands',
+        'sweden': 'Sweden', 'norway': 'Norway', 'denmark': 'Denmark',
+        'switzerland': 'Switzerland', 'france': 'France', 'japan': 'Japan',
+        'china': 'China', 'singapore': 'Singapore', 'korea': 'South Korea',
+        'europe': 'Europe (Multiple)', 'european': 'Europe (Multiple)'
+    }, default='Various', title=True),
+    degree=Attribute([
+        (('phd', 'doctoral', 'doctorate'), 'PhD'),
+        (('master', 'postgraduate', 'graduate'), 'Master\'s'),
+        (('bachelor', 'undergraduate'), 'Bachelor\'s'),
+        ('postdoc', 'Postdoctoral'),
+    ], default='Various levels'),
+    field=Attribute({
+        'engineering': 'Engineering & Technology',
+        'computer': 'Computer Science & IT',
+        'business': 'Business & Management',
+        'medicine': 'Medicine & Health Sciences',
+        'science': 'Natural Sciences',
+        'social': 'Social Sciences',
+        'arts': 'Arts & Humanities',
+        'law': 'Law',
+        'education': 'Education',
+    }, default='All fields'),
+    duration=Attribute([
+        Pattern(r'(\d+)\s*year', lowered=True, guard=('year',)),
+        Pattern(r'(\d+)\s*month', lowered=True, guard=('month',)),
+        Pattern(r'(\d+-\d+)\s*year', lowered=True, guard=('year',)),
+    ], default='Varies'),
+    funding=Attribute([
+        (('fully funded', 'full funding', 'full scholarship'), 'Fully funded'),
+        ('partial', 'Partial funding'),
+        (AllOf('tuition', 'waiver'), 'Tuition waiver'),
+        ('tuition', 'Tuition coverage'),
+        ('stipend', 'Monthly stipend provided'),
+    ], default='See official website'),
+    deadline=Attribute([
+        Pattern(NUMERIC_DATE, re.IGNORECASE, guard=DATE_SEPARATORS),
+        Pattern(ISO_DATE, re.IGNORECASE, guard=DATE_SEPARATORS),
+        Pattern(MONTH_DATE, re.IGNORECASE, guard=MONTHS),
+        ('rolling', 'Rolling deadline'),
+        ('open', 'Currently open'),
+    ], default='Check official website'),
+)
+
+
 class GenericScraper(BaseScraper):
     """Enhanced generic scraper for scholarship sources"""
     
+    max_items = 15  # links kept from the HTML page
+    parse_scope = LINK_CONTEXT_SCOPE
+    extractor = GENERIC_ATTRIBUTES
+    
     def scrape(self, profile: Dict) -> List[Dict]:
         """Scrape using multiple methods"""
         scholarships = []
@@ -55,7 +110,8 @@ class GenericScraper(BaseScraper):
         
         for feed_url in rss_feeds:
             try:
-                feed = feedparser.parse(feed_url)
+                # Bounded download through the pooled session (cached and coalesced)
+                feed = self.feeds.parse(feed_url, self.session)
                 
                 for entry in feed.entries[:10]:
                     scholarship = self._parse_rss_entry(entry)
@@ -75,19 +131,19 @@ class GenericScraper(BaseScraper):
         content = entry.get('summary', '') or entry.get('description', '')
         
         # Clean HTML tags
-        soup = BeautifulSoup(content, 'lxml')
-        text_content = soup.get_text(strip=True)
+        text_content = html_to_text(content)
+        attributes = self.extractor.extract(text_content, title=title)
         
         return {
             'title': title,
-            'country': self._extract_country(title + ' ' + text_content),
-            'degree': self._extract_degree(text_content),
-            'field': self._extract_field(text_content),
-            'duration': self._extract_duration(text_content),
-            'funding': self._extract_funding(text_content),
+            'country': attributes['country'],
+            'degree': attributes['degree'],
+            'field': attributes['field'],
+            'duration': attributes['duration'],
+            'funding': attributes['funding'],
             'eligibility': 'International students - check official website',
             'documents': 'See official announcement',
-            'deadline': self._extract_deadline(text_content),
+            'deadline': attributes['deadline'],
             'url': entry.get('link', '')
         }
     
@@ -96,36 +152,50 @@ class GenericScraper(BaseScraper):
         scholarships = []
         
         try:
-            response = self.session.get(self.url, timeout=30, verify=False)
-            soup = BeautifulSoup(response.content, 'lxml')
-            
-            # Find potential scholarship links
-            links = soup.find_all('a', href=True)
-            
-            for link in links:
-                text = link.get_text(strip=True)
-                if self._is_scholarship_link(text):
-                    scholarship = self._create_from_link(link, soup)
-                    if scholarship:
-                        scholarships.append(scholarship)
-                        if len(scholarships) >= 15:
-                            break
+            response = self.fetch_page(
+                timeout=self.request_timeout(default=30), verify=False,
+                stop_after=self.max_items, is_candidate=self._is_stream_candidate
+            )
+            soup = self.parse_page(response.content, response.encoding)
+            scholarships = self._parse_html(soup)
         
         except Exception as e:
             print(f"    HTML scraping error: {e}")
         
         return scholarships
     
+    def _parse_html(self, soup: Node) -> List[Dict]:
+        """Scholarships from the links of a parsed page"""
+        scholarships = []
+        
+        # Find potential scholarship links (one walk indexes links and their containers)
+        index = TextIndex(soup)
+        
+        for link in index.links:
+            text = index.get_text(link)
+            if self._is_scholarship_link(text):
+                scholarship = self._create_from_link(link, index)
+                if scholarship:
+                    scholarships.append(scholarship)
+                    if len(scholarships) >= self.max_items:
+                        break
+        
+        return scholarships
+    
     def _is_scholarship_link(self, text: str) -> bool:
         """Check if link text indicates a scholarship"""
         keywords = ['scholarship', 'fellowship', 'grant', 'funding', 'bursary', 'award', 'stipend']
         text_lower = text.lower()
         return any(keyword in text_lower for keyword in keywords) and len(text) > 10
     
-    def _create_from_link(self, link, soup) -> Dict:
-        """Create scholarship entry from link"""
-        title = link.get_text(strip=True)
-        url = link.get('href', '')
+    def _is_stream_candidate(self, element) -> bool:
+        """Whether a streamed lxml element is a link _scrape_html would keep"""
+        return element.get('href') is not None and self._is_scholarship_link(CandidateCounter.text(element))
+    
+    def _create_from_link(self, link: IndexedElement, index: TextIndex) -> Dict:
+        """Create scholarship entry from an indexed link"""
+        title = index.get_text(link)
+        url = link.node.get('href', '')
         
         # Make URL absolute
         if url.startswith('/'):
@@ -137,19 +207,20 @@ class GenericScraper(BaseScraper):
             url = self.url
         
         # Try to find associated content
-        parent = link.find_parent(['div', 'article', 'section', 'li'])
-        content = parent.get_text(strip=True) if parent else title
+        parent = link.container
+        content = index.get_text(parent) if parent else title
+        attributes = self.extractor.extract(content)
         
         return {
             'title': title,
-            'country': self._extract_country(content),
-            'degree': self._extract_degree(content),
-            'field': self._extract_field(content),
-            'duration': self._extract_duration(content),
-            'funding': self._extract_funding(content),
+            'country': attributes['country'],
+            'degree': attributes['degree'],
+            'field': attributes['field'],
+            'duration': attributes['duration'],
+            'funding': attributes['funding'],
             'eligibility': 'International students',
             'documents': 'See official website',
-            'deadline': self._extract_deadline(content),
+            'deadline': attributes['deadline'],
             'url': url
         }
     
@@ -197,113 +268,3 @@ class GenericScraper(BaseScraper):
                 'url': self.url
             }
         ]
-    
-    def _extract_country(self, text: str) -> str:
-        """Extract country from text"""
-        countries = {
-            'germany': 'Germany', 'usa': 'United States', 'america': 'United States',
-            'uk': 'United Kingdom', 'britain': 'United Kingdom', 'england': 'United Kingdom',
-            'canada': 'Canada', 'australia': 'Australia', 'netherlands': 'Netherlands',
-            'sweden': 'Sweden', 'norway': 'Norway', 'denmark': 'Denmark',
-            'switzerland': 'Switzerland', 'france': 'France', 'japan': 'Japan',
-            'china': 'China', 'singapore': 'Singapore', 'korea': 'South Korea',
-            'europe': 'Europe (Multiple)', 'european': 'Europe (Multiple)'
-        }
-        
-        text_lower = text.lower()
-        for keyword, country in countries.items():
-            if keyword in text_lower:
-                return country
-        
-        return 'Various'
-    
-    def _extract_degree(self, text: str) -> str:
-        """Extract degree level from text"""
-        text_lower = text.lower()
-        
-        if 'phd' in text_lower or 'doctoral' in text_lower or 'doctorate' in text_lower:
-            return 'PhD'
-        elif 'master' in text_lower or 'postgraduate' in text_lower or 'graduate' in text_lower:
-            return 'Master\'s'
-        elif 'bachelor' in text_lower or 'undergraduate' in text_lower:
-            return 'Bachelor\'s'
-        elif 'postdoc' in text_lower:
-            return 'Postdoctoral'
-        
-        return 'Various levels'
-    
-    def _extract_field(self, text: str) -> str:
-        """Extract field of study from text"""
-        fields = {
-            'engineering': 'Engineering & Technology',
-            'computer': 'Computer Science & IT',
-            'business': 'Business & Management',
-            'medicine': 'Medicine & Health Sciences',
-            'science': 'Natural Sciences',
-            'social': 'Social Sciences',
-            'arts': 'Arts & Humanities',
-            'law': 'Law',
-            'education': 'Education',
-        }
-        
-        text_lower = text.lower()
-        for keyword, field in fields.items():
-            if keyword in text_lower:
-                return field
-        
-        return 'All fields'
-    
-    def _extract_duration(self, text: str) -> str:
-        """Extract duration from text"""
-        # Look for duration patterns
-        duration_patterns = [
-            r'(\d+)\s*year',
-            r'(\d+)\s*month',
-            r'(\d+-\d+)\s*year',
-        ]
-        
-        for pattern in duration_patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                return match.group(0)
-        
-        return 'Varies'
-    
-    def _extract_funding(self, text: str) -> str:
-        """Extract funding information"""
-        text_lower = text.lower()
-        
-        if 'fully funded' in text_lower or 'full funding' in text_lower or 'full scholarship' in text_lower:
-            return 'Fully funded'
-        elif 'partial' in text_lower:
-            return 'Partial funding'
-        elif 'tuition' in text_lower:
-            if 'waiver' in text_lower:
-                return 'Tuition waiver'
-            return 'Tuition coverage'
-        elif 'stipend' in text_lower:
-            return 'Monthly stipend provided'
-        
-        return 'See official website'
-    
-    def _extract_deadline(self, text: str) -> str:
-        """Extract deadline from text"""
-        # Date patterns
-        patterns = [
-            r'\d{1,2}[-/]\d{1,2}[-/]\d{4}',
-            r'\d{4}[-/]\d{1,2}[-/]\d{1,2}',
-            r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-        
-        if 'rolling' in text.lower():
-            return 'Rolling deadline'
-        
-        if 'open' in text.lower():
-            return 'Currently open'
-        
-        return 'Check official website'
\ No newline at end of file
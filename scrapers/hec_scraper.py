@@ -1,12 +1,11 @@
 # scrapers/hec_scraper.py - GUARANTEED TO RETURN RESULTS
 
 from typing import List, Dict
+from scrapers.attribute_extractor import (
+    Attribute, AttributeExtractor, Pattern, DATE_SEPARATORS, ISO_DATE, MONTH_DATE, MONTHS, NUMERIC_DATE
+)
 from scrapers.base_scraper import BaseScraper
-
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    BeautifulSoup = None
+from scrapers.dom import Node
 
 import re
 import urllib3
@@ -14,9 +13,57 @@ import urllib3
 # Suppress SSL warnings for HEC website
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Class names of the HEC blocks that hold scholarship announcements
+LISTING_CLASSES = re.compile(r'(content|scholarship|news|announcement)', re.I)
+
+
+def _deadline_sentence(text: str, lowered: str):
+    """The sentence starting at 'deadline', when no date was found"""
+    index = lowered.find('deadline')
+    if index == -1:
+        return None
+    return text[index:index + 100].split('.')[0]
+
+
+# Attributes of announcement blocks (first matching rule wins)
+HEC_ATTRIBUTES = AttributeExtractor(
+    country=Attribute({
+        'germany': 'Germany',
+        'usa': 'United States', 'america': 'United States',
+        'uk': 'United Kingdom', 'britain': 'United Kingdom',
+        'canada': 'Canada',
+        'australia': 'Australia',
+        'china': 'China',
+        'japan': 'Japan',
+        'france': 'France',
+        'netherlands': 'Netherlands',
+        'sweden': 'Sweden',
+        'norway': 'Norway',
+        'turkey': 'Turkey',
+        'korea': 'South Korea'
+    }, default='Various', title=True),
+    degree=Attribute([
+        (('phd', 'doctoral'), 'PhD'),
+        (('master', 'ms', 'mphil'), 'Master\'s'),
+        (('bachelor', 'undergraduate'), 'Bachelor\'s'),
+        ('postdoc', 'Postdoctoral'),
+    ], default='Master\'s/PhD'),
+    deadline=Attribute([
+        Pattern(NUMERIC_DATE, re.IGNORECASE, guard=DATE_SEPARATORS),
+        Pattern(ISO_DATE, re.IGNORECASE, guard=DATE_SEPARATORS),
+        Pattern(MONTH_DATE, re.IGNORECASE, guard=MONTHS),
+        _deadline_sentence,
+    ], default='Check official announcement'),
+)
+
 class HECScraper(BaseScraper):
     """HEC Pakistan scraper with guaranteed fallback results"""
     
+    # Announcement blocks for _parse_scholarship_list, links for the news fallback
+    parse_scope = {'name': 'div', 'class_': LISTING_CLASSES}
+    news_scope = ('a',)
+    extractor = HEC_ATTRIBUTES
+    
     def scrape(self, profile: Dict) -> List[Dict]:
         """Scrape HEC scholarships - always returns results"""
         scholarships = []
@@ -40,14 +87,17 @@ class HECScraper(BaseScraper):
         
         try:
             # Try with increased timeout and SSL verification disabled
-            response = self.session.get(self.url, timeout=40, verify=False)
-            soup = BeautifulSoup(response.content, 'lxml')
+            response = self.fetch_page(timeout=self.request_timeout(default=40), verify=False)
             
             # Method 1: Find scholarship announcements
+            soup = self.parse_page(response.content, response.encoding)
             scholarships.extend(self._parse_scholarship_list(soup, profile))
             
             # Method 2: Look for news/announcements section
             if not scholarships:
+                if self.parse_scope != self.news_scope:
+                    # The announcement scope left the links out
+                    soup = self.parse_page(response.content, response.encoding, scope=self.news_scope)
                 scholarships.extend(self._parse_news_section(soup))
             
         except Exception as e:
@@ -55,12 +105,12 @@ class HECScraper(BaseScraper):
         
         return scholarships
     
-    def _parse_scholarship_list(self, soup: BeautifulSoup, profile: Dict) -> List[Dict]:
+    def _parse_scholarship_list(self, soup: Node, profile: Dict) -> List[Dict]:
         """Parse scholarship listings from HEC page"""
         scholarships = []
         
         # Look for common HEC patterns
-        content_divs = soup.find_all('div', class_=re.compile(r'(content|scholarship|news|announcement)', re.I))
+        content_divs = soup.find_all('div', class_=LISTING_CLASSES)
         
         for div in content_divs[:15]:
             try:
@@ -72,7 +122,7 @@ class HECScraper(BaseScraper):
         
         return scholarships
     
-    def _parse_news_section(self, soup: BeautifulSoup) -> List[Dict]:
+    def _parse_news_section(self, soup: Node) -> List[Dict]:
         """Parse news/announcements that might contain scholarships"""
         scholarships = []
         
@@ -103,17 +153,18 @@ class HECScraper(BaseScraper):
             url = 'https://hec.gov.pk' + url
         
         content = div.get_text(strip=True)
+        attributes = self.extractor.extract(content, title=title)
         
         return {
             'title': title,
-            'country': self._extract_country(title + ' ' + content),
-            'degree': self._extract_degree(content),
+            'country': attributes['country'],
+            'degree': attributes['degree'],
             'field': 'All fields',
             'duration': 'Varies',
             'funding': 'Full or partial funding',
             'eligibility': 'Pakistani nationals with strong academic records',
             'documents': 'Academic transcripts, IELTS/TOEFL, Research proposal (if applicable)',
-            'deadline': self._extract_deadline(content),
+            'deadline': attributes['deadline'],
             'url': url
         }
     
@@ -138,65 +189,9 @@ class HECScraper(BaseScraper):
             'url': url
         }
     
-    def _extract_deadline(self, text: str) -> str:
-        """Extract deadline from text"""
-        date_patterns = [
-            r'\d{1,2}[-/]\d{1,2}[-/]\d{4}',
-            r'\d{4}[-/]\d{1,2}[-/]\d{1,2}',
-            r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-        
-        if 'deadline' in text.lower():
-            deadline_idx = text.lower().find('deadline')
-            snippet = text[deadline_idx:deadline_idx+100]
-            return snippet.split('.')[0]
-        
-        return 'Check official announcement'
-    
-    def _extract_country(self, text: str) -> str:
-        """Extract country from text"""
-        countries = {
-            'germany': 'Germany',
-            'usa': 'United States', 'america': 'United States',
-            'uk': 'United Kingdom', 'britain': 'United Kingdom',
-            'canada': 'Canada',
-            'australia': 'Australia',
-            'china': 'China',
-            'japan': 'Japan',
-            'france': 'France',
-            'netherlands': 'Netherlands',
-            'sweden': 'Sweden',
-            'norway': 'Norway',
-            'turkey': 'Turkey',
-            'korea': 'South Korea'
-        }
-        
-        text_lower = text.lower()
-        for keyword, country in countries.items():
-            if keyword in text_lower:
-                return country
-        
-        return 'Various'
-    
-    def _extract_degree(self, text: str) -> str:
-        """Extract degree level from text"""
-        text_lower = text.lower()
-        
-        if 'phd' in text_lower or 'doctoral' in text_lower:
-            return 'PhD'
-        elif 'master' in text_lower or 'ms' in text_lower or 'mphil' in text_lower:
-            return 'Master\'s'
-        elif 'bachelor' in text_lower or 'undergraduate' in text_lower:
-            return 'Bachelor\'s'
-        elif 'postdoc' in text_lower:
-            return 'Postdoctoral'
-        
-        return 'Master\'s/PhD'
+    def _get_fallback_scholarships(self) -> List[Dict]:
+        """Served while the circuit breaker is open"""
+        return self._get_guaranteed_scholarships()
     
     def _get_guaranteed_scholarships(self) -> List[Dict]:
         """Return guaranteed HEC Pakistan scholarships (always available)"""
@@ -0,0 +1,112 @@
+# scrapers/html_text.py
+
+"""
+Text of small HTML fragments without building a tree.
+
+Feed summaries are a few hundred bytes of <p>, <a> and entities, yet getting
+their text through a DOM (BeautifulSoup, or even lxml) costs a parser and a
+tree per entry. strip_html() is a single left-to-right scan instead: it
+collects the text nodes a parser would build (text_nodes()), entity-decoded,
+and strips and joins them as get_text(strip=True) does. What it keeps of the tree is the
+stack of open element names, because that decides where text nodes end:
+
+- a start tag, a comment or a doctype/processing instruction ends a text
+  node, and so does an end tag that closes an open element; a stray end tag
+  is dropped and the text on both sides stays one node
+- <script>, <style> and <template> contents are skipped, as get_text() does;
+  <textarea> and <title> contents are text, tags included
+- a "<" that cannot start markup ("a < b") is text
+- an unterminated comment or tag swallows the rest of the fragment
+- line breaks are normalised to "\n", entities decoded by html.unescape
+
+This follows the HTML5 tokenizer. Where lxml.html (the default backend of
+scrapers/dom.py) departs from it, e.g. a self-closing <script/> is empty and
+a stray </p> does not split the text, it does what lxml.html does. The DOM
+path stays available through html_to_text(markup, backend=...).
+"""
+
+import re
+from html import unescape
+from typing import List
+
+# One piece of markup; the tag alternative comes first as the most common.
+# Quoted attribute values may contain '>'.
+_TOKEN = re.compile(r'''
+    <(?P<end>/)?(?P<name>[a-zA-Z][^\s/>]*)(?:[^>"']|"[^"]*"|'[^']*')*>   # start or end tag
+  | <!--(?:-?>|.*?(?:--!?>|\Z))                                        # comment, <!--> included
+  | <(?:[!?]|/(?![a-zA-Z]|\Z))[^>]*(?:>|\Z)                           # doctype, PI, bogus comment, </>
+  | </?[a-zA-Z].*\Z                                                    # unterminated tag: drops the rest
+''', re.DOTALL | re.VERBOSE)
+
+_VOID_ELEMENTS = frozenset((
+    'area', 'base', 'basefont', 'bgsound', 'br', 'col', 'embed', 'frame', 'hr', 'img', 'input',
+    'keygen', 'link', 'meta', 'param', 'source', 'track', 'wbr',
+))
+_SKIPPED_ELEMENTS = ('script', 'style', 'template')  # contents are not text
+_RCDATA_ELEMENTS = ('textarea', 'title')            # contents are text, tags included
+_RAW_END = {name: re.compile(rf'</{name}[\s/>]', re.IGNORECASE)
+            for name in _SKIPPED_ELEMENTS + _RCDATA_ELEMENTS}
+
+
+def _decode(text: str) -> str:
+    return unescape(text) if '&' in text else text
+
+
+def text_nodes(markup: str) -> List[str]:
+    """The decoded text nodes of an HTML fragment, in document order"""
+    if '\r' in markup:
+        markup = markup.replace('\r\n', '\n').replace('\r', '\n')
+    nodes: List[str] = []
+    run: List[str] = []  # decoded pieces of the current text node
+    open_elements: List[str] = []
+    search, pos = _TOKEN.search, 0
+
+    while True:
+        token = search(markup, pos)
+        if token is None:
+            if pos < len(markup):
+                run.append(_decode(markup[pos:]))
+            break
+        start = token.start()
+        if start > pos:
+            run.append(_decode(markup[pos:start]))
+        pos = token.end()
+
+        name = token.group('name')
+        if name is None:
+            if markup.startswith('</>', start):
+                continue  # dropped without a node
+        else:
+            name = name.lower()
+            if token.group('end'):
+                if name not in open_elements:
+                    continue  # stray end tag: no node, the text runs on
+                del open_elements[len(open_elements) - 1 - open_elements[::-1].index(name):]
+            elif name in _RAW_END and markup[pos - 2] != '/':
+                if run:
+                    nodes.append(''.join(run))
+                    run = []
+                closing = _RAW_END[name].search(markup, pos)
+                content_end = len(markup) if closing is None else closing.start()
+                if name in _RCDATA_ELEMENTS and content_end > pos:
+                    nodes.append(_decode(markup[pos:content_end]))
+                close = -1 if closing is None else markup.find('>', closing.end() - 1)
+                pos = len(markup) if close == -1 else close + 1
+                continue
+            elif name not in _VOID_ELEMENTS:
+                open_elements.append(name)
+
+        if run:
+            nodes.append(''.join(run))
+            run = []
+
+    if run:
+        nodes.append(''.join(run))
+    return nodes
+
+
+def strip_html(markup: str) -> str:
+    """Text of an HTML fragment, like get_text(strip=True) on its parsed tree"""
+    if not markup:
+        return ''
+    return ''.join(filter(None, map(str.strip, text_nodes(markup))))
@@ -4,80 +4,334 @@
 Hybrid scraper that tries multiple methods in priority order:
 1. Official API (fastest, most reliable)
 2. RSS Feeds (fast, structured)
-3. HTML Scraping (moderate speed)
-4. Selenium (slowest, but handles JS)
-5. Guaranteed fallback data
+3. Embedded structured data (JSON-LD, hydration state, XHR endpoints)
+4. HTML Scraping (moderate speed)
+5. Selenium (slowest, but handles JS)
+6. Guaranteed fallback data
+
+Sources with method_mode "race" start the cheap HTTP methods as hedged
+requests instead: each gets hedge_delay seconds before the next one starts,
+and the first non-empty result wins.
+
+With ADAPTIVE_METHOD_ORDER the order above is only the starting point:
+methods are re-ranked per source by their recent success rate and latency,
+and methods that keep failing are skipped apart from periodic probes.
 """
 
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import List, Dict, Optional, Tuple
+from config.settings import HYBRID_METHOD_MODE, HEDGE_DELAY_SECONDS, ADAPTIVE_METHOD_ORDER
+from scrapers.attribute_extractor import Attribute, AttributeExtractor, Pattern, DATE_SEPARATORS, MONTHS, NUMERIC_DATE
 from scrapers.base_scraper import BaseScraper
+from scrapers.dom import Node, html_to_text
+from scrapers.parse_scope import SCRIPT_SCOPE
+from scrapers.structured_data import extract_scholarships, find_endpoints, scholarships_from_json
+from utils.browser_pool import get_browser_pool
+from utils.http_transport import HTTPTransport
+from utils.method_stats import get_method_stats
+from utils.page_fetcher import CandidateCounter
+from utils.single_flight import get_single_flight
 
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    BeautifulSoup = None
-
+import asyncio
+import contextvars
 import feedparser
 import json
 import re
+import time
+
+# Attributes of RSS entries (first matching rule wins)
+HYBRID_ATTRIBUTES = AttributeExtractor(
+    country=Attribute({
+        'germany': 'Germany', 'usa': 'United States', 'america': 'United States',
+        'uk': 'United Kingdom', 'britain': 'United Kingdom',
+        'canada': 'Canada', 'australia': 'Australia',
+        'france': 'France', 'japan': 'Japan', 'china': 'China'
+    }, default='Various', title=True),
+    degree=Attribute([
+        (('phd', 'doctoral'), 'PhD'),
+        ('master', 'Master\'s'),
+        ('bachelor', 'Bachelor\'s'),
+    ], default='Various'),
+    field=Attribute({
+        'engineering': 'Engineering',
+        'computer': 'Computer Science',
+        'business': 'Business',
+        'medicine': 'Medicine'
+    }, default='All fields'),
+    funding=Attribute([
+        (('fully funded', 'full scholarship'), 'Fully funded'),
+        ('partial', 'Partial funding'),
+    ], default='See website'),
+    deadline=Attribute([
+        Pattern(NUMERIC_DATE, re.IGNORECASE, guard=DATE_SEPARATORS),
+        Pattern(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}', re.IGNORECASE,
+                guard=tuple(month[:3] for month in MONTHS)),
+    ], default='Check website'),
+)
+
 
 class HybridScraper(BaseScraper):
     """
     Advanced scraper that tries multiple methods to get real-time data
     """
     
-    def __init__(self, source_config: Dict):
-        super().__init__(source_config)
+    def __init__(self, source_config: Dict, transport: Optional[HTTPTransport] = None):
+        super().__init__(source_config, transport)
         self.api_endpoint = source_config.get('api_endpoint')
         self.rss_feed = source_config.get('rss_feed')
         self.use_selenium = source_config.get('use_selenium', False)
+        self.ready_selector = source_config.get('ready_selector')  # CSS selector marking a rendered page
+        # JS-heavy pages usually embed their data; try it before HTML/Selenium
+        self.structured_data = source_config.get('structured_data', self.use_selenium)
+        self.method_mode = source_config.get('method_mode', HYBRID_METHOD_MODE)
+        self.hedge_delay = source_config.get('hedge_delay', HEDGE_DELAY_SECONDS)
+        self.method_stats = get_method_stats() if ADAPTIVE_METHOD_ORDER else None
         self.fallback_data = source_config.get('fallback_data', [])
     
+    # Console label for each scraping method
+    METHOD_LABELS = {
+        'API': '📡 Trying API...',
+        'RSS': '📰 Trying RSS feed...',
+        'Structured': '🧩 Trying embedded structured data...',
+        'HTML': '🌐 Trying HTML scraping...',
+        'Selenium': '🤖 Trying Selenium (JavaScript rendering)...',
+    }
+    
+    # Cheap HTTP methods that may run concurrently in race mode (Selenium never does)
+    RACEABLE_METHODS = ('API', 'RSS', 'Structured', 'HTML')
+    
+    # Items _parse_html keeps, and the elements counted towards them while the
+    # page streams in (an empty tuple reads the whole page)
+    max_items = 15
+    candidate_tags = ('a',)
+    parse_scope = ('a',)
+    extractor = HYBRID_ATTRIBUTES
+    
+    def _available_methods(self) -> List[str]:
+        """Methods configured for this source, in priority order"""
+        methods = []
+        if self.api_endpoint:
+            methods.append('API')
+        if self.rss_feed:
+            methods.append('RSS')
+        if self.structured_data:
+            methods.append('Structured')
+        methods.append('HTML')
+        if self.use_selenium:
+            methods.append('Selenium')
+        return methods
+    
+    def _ordered_methods(self) -> List[str]:
+        """Available methods, reordered and filtered by this source's history"""
+        methods = self._available_methods()
+        if self.method_stats is None:
+            return methods
+        
+        order, skipped = self.method_stats.plan(self.name, methods)
+        if skipped:
+            print(f"    ⏭️  Skipping {', '.join(skipped)} (failing recently)")
+        if order != [m for m in methods if m in order]:
+            print(f"    🧠 Method order from history: {' → '.join(order)}")
+        return order
+    
+    def _record_method(self, method: str, scholarships: List[Dict], started: float):
+        # Writes to SQLite: the async paths call it through asyncio.to_thread
+        if self.method_stats is not None:
+            self.method_stats.record(self.name, method, bool(scholarships), time.monotonic() - started)
+    
+    def _run_method(self, method: str, profile: Dict) -> List[Dict]:
+        """Run a single scraping method (blocking) and record how it went"""
+        started = time.monotonic()
+        scholarships = self._call_method(method, profile)
+        self._record_method(method, scholarships, started)
+        return scholarships
+    
+    async def _arun_method(self, method: str, profile: Dict) -> List[Dict]:
+        """Async _run_method()"""
+        started = time.monotonic()
+        scholarships = await self._acall_method(method, profile)
+        await asyncio.to_thread(self._record_method, method, scholarships, started)
+        return scholarships
+    
+    def _call_method(self, method: str, profile: Dict) -> List[Dict]:
+        """Dispatch to a scraping method (blocking)"""
+        if method == 'API':
+            return self._try_api(profile)
+        if method == 'RSS':
+            return self._try_rss()
+        if method == 'Structured':
+            return self._try_structured()
+        if method == 'HTML':
+            return self._try_html(profile)
+        if method == 'Selenium':
+            return self._try_selenium(profile)
+        return []
+    
+    async def _acall_method(self, method: str, profile: Dict) -> List[Dict]:
+        """Dispatch to a scraping method on the event loop"""
+        if method == 'API':
+            return await self._atry_api(profile)
+        if method == 'RSS':
+            return await self._atry_rss()
+        if method == 'Structured':
+            return await self._atry_structured()
+        if method == 'HTML':
+            return await self._atry_html(profile)
+        if method == 'Selenium':
+            # WebDriver is blocking by nature - keep it off the loop
+            return await asyncio.to_thread(self._try_selenium, profile)
+        return []
+    
+    def _split_methods(self):
+        """(methods to race, methods to run one by one afterwards) for this source"""
+        methods = self._ordered_methods()
+        if self.method_mode != 'race':
+            return [], methods
+        raced = [m for m in methods if m in self.RACEABLE_METHODS]
+        if len(raced) < 2:
+            return [], methods
+        return raced, [m for m in methods if m not in raced]
+    
+    def _race_methods(self, methods: List[str], profile: Dict) -> Tuple[Optional[str], List[Dict]]:
+        """
+        Hedged execution: start methods in priority order, each hedge_delay after
+        the previous one (or at once if it already failed), and return the first
+        non-empty result. Methods still queued are cancelled; running ones cannot
+        be interrupted, so they finish in the background and only warm the cache.
+        
+        Only attempts that finish before the race is decided are recorded in the
+        method statistics, as in _arace_methods(), where the losers are cancelled.
+        """
+        executor = ThreadPoolExecutor(max_workers=len(methods), thread_name_prefix='hedge')
+        running = {}  # future -> (method, started)
+        
+        def first_result(timeout: Optional[float]):
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while running:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                done, _ = wait(running, timeout=remaining, return_when=FIRST_COMPLETED)
+                if not done:
+                    return None
+                winner = None
+                for future in done:
+                    method, started = running.pop(future)
+                    if future.exception() is not None:
+                        continue
+                    scholarships = future.result()
+                    self._record_method(method, scholarships, started)
+                    if scholarships and winner is None:
+                        winner = method, scholarships
+                if winner:
+                    return winner
+            return None
+        
+        try:
+            for i, method in enumerate(methods):
+                print(f"    {self.METHOD_LABELS[method]}")
+                # copy_context: the search's retry budget must follow into the worker
+                context = contextvars.copy_context()
+                future = executor.submit(context.run, self._call_method, method, profile)
+                running[future] = method, time.monotonic()
+                last = i == len(methods) - 1
+                winner = first_result(None if last else self.hedge_delay)
+                if winner:
+                    return winner
+            return None, []
+        finally:
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    async def _arace_methods(self, methods: List[str], profile: Dict) -> Tuple[Optional[str], List[Dict]]:
+        """Async _race_methods(); losing tasks are cancelled"""
+        running = {}  # task -> (method, started)
+        
+        async def first_result(timeout: Optional[float]):
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while running:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                done, _ = await asyncio.wait(running, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    return None
+                winner = None
+                for task in done:
+                    method, started = running.pop(task)
+                    if task.cancelled() or task.exception() is not None:
+                        continue
+                    scholarships = task.result()
+                    await asyncio.to_thread(self._record_method, method, scholarships, started)
+                    if scholarships and winner is None:
+                        winner = method, scholarships
+                if winner:
+                    return winner
+            return None
+        
+        try:
+            for i, method in enumerate(methods):
+                print(f"    {self.METHOD_LABELS[method]}")
+                task = asyncio.ensure_future(self._acall_method(method, profile))
+                running[task] = method, time.monotonic()
+                last = i == len(methods) - 1
+                winner = await first_result(None if last else self.hedge_delay)
+                if winner:
+                    return winner
+            return None, []
+        finally:
+            for task in running:
+                task.cancel()
+    
     def scrape(self, profile: Dict) -> List[Dict]:
         """
         Try multiple scraping methods in priority order
         """
-        scholarships = []
         methods_tried = []
         
         print(f"    🔄 Hybrid scraping {self.name}...")
         
-        # Method 1: Try API
-        if self.api_endpoint:
-            print(f"    📡 Trying API...")
-            scholarships = self._try_api(profile)
-            methods_tried.append("API")
+        raced, sequential = self._split_methods()
+        if raced:
+            method, scholarships = self._race_methods(raced, profile)
+            methods_tried.extend(raced)
             if scholarships:
-                print(f"    ✅ API successful: {len(scholarships)} scholarships")
+                print(f"    ✅ {method} successful (raced): {len(scholarships)} scholarships")
                 return scholarships
         
-        # Method 2: Try RSS Feed
-        if self.rss_feed:
-            print(f"    📰 Trying RSS feed...")
-            scholarships = self._try_rss()
-            methods_tried.append("RSS")
+        for method in sequential:
+            print(f"    {self.METHOD_LABELS[method]}")
+            scholarships = self._run_method(method, profile)
+            methods_tried.append(method)
             if scholarships:
-                print(f"    ✅ RSS successful: {len(scholarships)} scholarships")
+                print(f"    ✅ {method} successful: {len(scholarships)} scholarships")
                 return scholarships
         
-        # Method 3: Try HTML Scraping
-        print(f"    🌐 Trying HTML scraping...")
-        scholarships = self._try_html(profile)
-        methods_tried.append("HTML")
-        if scholarships:
-            print(f"    ✅ HTML successful: {len(scholarships)} scholarships")
-            return scholarships
+        # Last resort: return fallback data
+        print(f"    ⚠️  All methods failed ({', '.join(methods_tried)}), using fallback")
+        return self._get_fallback_scholarships()
+    
+    async def ascrape(self, profile: Dict) -> List[Dict]:
+        """
+        Async version of scrape() - fetches through the search's AsyncTransport
+        """
+        methods_tried = []
         
-        # Method 4: Try Selenium (if enabled and available)
-        if self.use_selenium:
-            print(f"    🤖 Trying Selenium (JavaScript rendering)...")
-            scholarships = self._try_selenium(profile)
-            methods_tried.append("Selenium")
+        print(f"    🔄 Hybrid scraping {self.name}...")
+        
+        raced, sequential = self._split_methods()
+        if raced:
+            method, scholarships = await self._arace_methods(raced, profile)
+            methods_tried.extend(raced)
             if scholarships:
-                print(f"    ✅ Selenium successful: {len(scholarships)} scholarships")
+                print(f"    ✅ {method} successful (raced): {len(scholarships)} scholarships")
+                return scholarships
+        
+        for method in sequential:
+            print(f"    {self.METHOD_LABELS[method]}")
+            scholarships = await self._arun_method(method, profile)
+            methods_tried.append(method)
+            if scholarships:
+                print(f"    ✅ {method} successful: {len(scholarships)} scholarships")
                 return scholarships
         
-        # Method 5: Return fallback data
         print(f"    ⚠️  All methods failed ({', '.join(methods_tried)}), using fallback")
         return self._get_fallback_scholarships()
     
@@ -88,7 +342,7 @@ class HybridScraper(BaseScraper):
             response = self.session.get(
                 self.api_endpoint,
                 params=params,
-                timeout=20
+                timeout=self.request_timeout(self.api_endpoint, default=20)
             )
             
             if response.status_code == 200:
@@ -99,67 +353,204 @@ class HybridScraper(BaseScraper):
         
         return []
     
+    async def _atry_api(self, profile: Dict) -> List[Dict]:
+        """Async version of _try_api()"""
+        try:
+            params = self._build_api_params(profile)
+            response = await self._aget(self.api_endpoint, params=params, timeout=self.request_timeout(self.api_endpoint, default=20))
+            
+            if response.status_code == 200:
+                return self._parse_api_response(response.json())
+        except Exception as e:
+            print(f"      API error: {e}")
+        
+        return []
+    
     def _try_rss(self) -> List[Dict]:
         """Try to fetch from RSS feed"""
         try:
-            feed = feedparser.parse(self.rss_feed)
-            scholarships = []
+            document = self.feeds.fetch(self.rss_feed, self.session)
+            return self._parse_with_memo(document, 'RSS', self._parse_feed_bytes)
+        except Exception as e:
+            print(f"      RSS error: {e}")
+        
+        return []
+    
+    async def _atry_rss(self) -> List[Dict]:
+        """Async version of _try_rss() - bounded download and parse off the event loop"""
+        try:
+            document = await self.feeds.afetch(self.rss_feed, self.session)
+            return await asyncio.to_thread(self._parse_with_memo, document, 'RSS', self._parse_feed_bytes)
+        except Exception as e:
+            print(f"      RSS error: {e}")
+        
+        return []
+    
+    def _parse_feed_bytes(self, content: bytes) -> List[Dict]:
+        """Parse a downloaded feed document"""
+        return self._parse_feed(feedparser.parse(content))
+    
+    def _parse_feed(self, feed) -> List[Dict]:
+        """Turn parsed feed entries into scholarships"""
+        scholarships = []
+        
+        for entry in feed.entries[:15]:
+            scholarship = self._parse_rss_entry(entry)
+            if scholarship:
+                scholarships.append(scholarship)
+        
+        return scholarships
+    
+    def _try_structured(self) -> List[Dict]:
+        """Try data embedded in the page, then the JSON endpoints its scripts call"""
+        try:
+            # Streamed like _try_html but never stopped early: a cacheable page is
+            # stored in full, so whichever method runs second is served from the cache
+            response = self.fetch_page(timeout=self.request_timeout(default=30), verify=False)
+            found = self._parse_with_memo(
+                response, 'Structured', lambda content: self._parse_structured_bytes(content, response.encoding)
+            )
+            if found['scholarships']:
+                return found['scholarships']
             
-            for entry in feed.entries[:15]:
-                scholarship = self._parse_rss_entry(entry)
-                if scholarship:
-                    scholarships.append(scholarship)
+            for endpoint in found['endpoints']:
+                response = self.session.get(
+                    endpoint, headers={'Accept': 'application/json'},
+                    timeout=self.request_timeout(endpoint, default=20), verify=False
+                )
+                scholarships = self._parse_endpoint_response(response, endpoint)
+                if scholarships:
+                    return scholarships
+        except Exception as e:
+            print(f"      Structured data error: {e}")
+        
+        return []
+    
+    async def _atry_structured(self) -> List[Dict]:
+        """Async version of _try_structured()"""
+        try:
+            response = await self._aget(self.url, timeout=self.request_timeout(default=30), verify=False)
+            found = await asyncio.to_thread(
+                self._parse_with_memo, response, 'Structured',
+                lambda content: self._parse_structured_bytes(content, response.encoding)
+            )
+            if found['scholarships']:
+                return found['scholarships']
             
-            return scholarships
+            for endpoint in found['endpoints']:
+                response = await self._aget(
+                    endpoint, headers={'Accept': 'application/json'},
+                    timeout=self.request_timeout(endpoint, default=20), verify=False
+                )
+                scholarships = self._parse_endpoint_response(response, endpoint)
+                if scholarships:
+                    return scholarships
         except Exception as e:
-            print(f"      RSS error: {e}")
+            print(f"      Structured data error: {e}")
         
         return []
     
+    def _parse_structured_bytes(self, content: bytes, encoding: Optional[str] = None) -> Dict:
+        """Embedded scholarships plus the endpoints to try when there are none"""
+        # The scanners only read <script> bodies, so only those are kept
+        soup = self.parse_page(content, encoding, scope=SCRIPT_SCOPE)
+        scholarships = extract_scholarships(soup, self.url)
+        return {
+            'scholarships': scholarships,
+            'endpoints': [] if scholarships else find_endpoints(soup, self.url)
+        }
+    
+    def _parse_endpoint_response(self, response, endpoint: str) -> List[Dict]:
+        """Scholarships from a JSON endpoint response (non-JSON responses are ignored)"""
+        if response.status_code != 200 or 'json' not in response.headers.get('content-type', ''):
+            return []
+        return scholarships_from_json(response.json(), endpoint)
+    
     def _try_html(self, profile: Dict) -> List[Dict]:
         """Try HTML scraping"""
         try:
-            response = self.session.get(self.url, timeout=30, verify=False)
-            soup = BeautifulSoup(response.content, 'lxml')
-            return self._parse_html(soup, profile)
+            document = self._fetch_html_page()
+            return self._parse_with_memo(
+                document, 'HTML', lambda content: self._parse_html_bytes(content, profile, document.encoding)
+            )
+        except Exception as e:
+            print(f"      HTML error: {e}")
+        
+        return []
+    
+    async def _atry_html(self, profile: Dict) -> List[Dict]:
+        """Async version of _try_html() - streamed on the event loop, parsed on a worker thread"""
+        try:
+            document = await self.afetch_page(**self._html_page_options())
+            return await asyncio.to_thread(
+                self._parse_with_memo, document, 'HTML',
+                lambda content: self._parse_html_bytes(content, profile, document.encoding)
+            )
         except Exception as e:
             print(f"      HTML error: {e}")
         
         return []
     
+    def _fetch_html_page(self):
+        """Stream the page, stopping once there are enough candidates for max_items"""
+        return self.fetch_page(**self._html_page_options())
+    
+    def _html_page_options(self) -> Dict:
+        """fetch_page()/afetch_page() arguments for the HTML method"""
+        return dict(
+            timeout=self.request_timeout(default=30), verify=False,
+            stop_after=self.max_items if self.candidate_tags else None,
+            is_candidate=self._is_stream_candidate, candidate_tags=self.candidate_tags
+        )
+    
+    def _is_stream_candidate(self, element) -> bool:
+        """Whether a streamed lxml element is something _parse_html would keep"""
+        return element.get('href') is not None and self._is_scholarship_link(CandidateCounter.text(element))
+    
+    def _parse_html_bytes(self, content: bytes, profile: Dict, encoding: Optional[str] = None) -> List[Dict]:
+        """Build the tree (source's backend, sniffed encoding) and run the site-specific parser"""
+        soup = self.parse_page(content, encoding)
+        return self._parse_html(soup, profile)
+    
+    def _parse_with_memo(self, response, method: str, parse) -> List[Dict]:
+        """
+        Parse a response body, reusing the stored result when the body is unchanged
+        
+        Cache hits, 304 revalidations and identical re-downloads all carry the
+        same body fingerprint, so the parse step is skipped for them, and
+        concurrent parses of the same body are coalesced. Parsers do not
+        depend on the profile (filtering happens in match_profile).
+        """
+        cache = self.transport.cache
+        fingerprint = getattr(response, 'cache_fingerprint', None)
+        scope = f"{type(self).__name__}|{self.name}|{method}"
+        
+        def parse_once():
+            if cache is not None:
+                parsed = cache.get_parsed(scope, fingerprint)
+                if parsed is not None:
+                    print(f"      ♻️  {method} unchanged, reusing parsed result")
+                    return parsed
+            
+            scholarships = parse(response.content)
+            if cache is not None:
+                cache.put_parsed(scope, fingerprint, scholarships)
+            return scholarships
+        
+        if not fingerprint:
+            return parse_once()
+        return get_single_flight().do(('parse', scope, fingerprint), parse_once)
+    
     def _try_selenium(self, profile: Dict) -> List[Dict]:
         """Try Selenium for JavaScript-heavy sites"""
         try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            from selenium.webdriver.chrome.service import Service
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            from webdriver_manager.chrome import ChromeDriverManager
+            # Headless Chrome is pooled and reused across sources and searches
+            pool = get_browser_pool()
+            html = pool.render(self.url, self.ready_selector, label=self.name)
+            print(f"      ⏱️  Rendered in {pool.render_times[self.name]:.2f}s")
             
-            # Setup headless Chrome
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            try:
-                driver.get(self.url)
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-                
-                html = driver.page_source
-                soup = BeautifulSoup(html, 'lxml')
-                return self._parse_html(soup, profile)
-            
-            finally:
-                driver.quit()
+            soup = self.parse_page(html)
+            return self._parse_html(soup, profile)
         
         except Exception as e:
             print(f"      Selenium error: {e}")
@@ -214,24 +605,24 @@ class HybridScraper(BaseScraper):
         
         # Extract text from description
         description = entry.get('description', '') or entry.get('summary', '')
-        soup = BeautifulSoup(description, 'lxml')
-        text = soup.get_text(strip=True)
+        text = html_to_text(description)
+        attributes = self.extractor.extract(text, title=title)
         
         return {
             'title': title,
-            'country': self._extract_country(title + ' ' + text),
-            'degree': self._extract_degree(text),
-            'field': self._extract_field(text),
+            'country': attributes['country'],
+            'degree': attributes['degree'],
+            'field': attributes['field'],
             'duration': 'Varies',
-            'funding': self._extract_funding(text),
+            'funding': attributes['funding'],
             'eligibility': 'See website',
             'documents': 'See website',
-            'deadline': self._extract_deadline(text),
+            'deadline': attributes['deadline'],
             'url': link
         }
     
-    def _parse_html(self, soup: BeautifulSoup, profile: Dict) -> List[Dict]:
-        """Parse HTML - override in subclasses for specific sites"""
+    def _parse_html(self, soup: Node, profile: Dict) -> List[Dict]:
+        """Parse HTML - override in subclasses for specific sites (soup is a scrapers.dom node)"""
         scholarships = []
         
         # Generic HTML parsing
@@ -259,7 +650,7 @@ class HybridScraper(BaseScraper):
                     'url': url
                 })
                 
-                if len(scholarships) >= 15:
+                if len(scholarships) >= self.max_items:
                     break
         
         return scholarships
@@ -270,71 +661,6 @@ class HybridScraper(BaseScraper):
         text_lower = text.lower()
         return any(kw in text_lower for kw in keywords) and len(text) > 15
     
-    def _extract_country(self, text: str) -> str:
-        """Extract country from text"""
-        countries = {
-            'germany': 'Germany', 'usa': 'United States', 'america': 'United States',
-            'uk': 'United Kingdom', 'britain': 'United Kingdom',
-            'canada': 'Canada', 'australia': 'Australia',
-            'france': 'France', 'japan': 'Japan', 'china': 'China'
-        }
-        
-        text_lower = text.lower()
-        for keyword, country in countries.items():
-            if keyword in text_lower:
-                return country
-        
-        return 'Various'
-    
-    def _extract_degree(self, text: str) -> str:
-        """Extract degree level"""
-        text_lower = text.lower()
-        if 'phd' in text_lower or 'doctoral' in text_lower:
-            return 'PhD'
-        elif 'master' in text_lower:
-            return 'Master\'s'
-        elif 'bachelor' in text_lower:
-            return 'Bachelor\'s'
-        return 'Various'
-    
-    def _extract_field(self, text: str) -> str:
-        """Extract field of study"""
-        fields = {
-            'engineering': 'Engineering',
-            'computer': 'Computer Science',
-            'business': 'Business',
-            'medicine': 'Medicine'
-        }
-        
-        text_lower = text.lower()
-        for keyword, field in fields.items():
-            if keyword in text_lower:
-                return field
-        
-        return 'All fields'
-    
-    def _extract_funding(self, text: str) -> str:
-        """Extract funding info"""
-        if 'fully funded' in text.lower() or 'full scholarship' in text.lower():
-            return 'Fully funded'
-        elif 'partial' in text.lower():
-            return 'Partial funding'
-        return 'See website'
-    
-    def _extract_deadline(self, text: str) -> str:
-        """Extract deadline"""
-        patterns = [
-            r'\d{1,2}[-/]\d{1,2}[-/]\d{4}',
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-        
-        return 'Check website'
-    
     def _get_fallback_scholarships(self) -> List[Dict]:
         """Return fallback data if all methods fail"""
         if self.fallback_data:
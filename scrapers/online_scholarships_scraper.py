@@ -1,11 +1,22 @@
 # scrapers/online_scholarships_scraper.py - RELIABLE ONLINE SCRAPER
 
 from typing import List, Dict
+from scrapers.attribute_extractor import Attribute, AttributeExtractor
 from scrapers.base_scraper import BaseScraper
-import feedparser
 import requests
 import re
 
+# Country of Scholars4Dev entries (first matching rule wins)
+SCHOLARS4DEV_ATTRIBUTES = AttributeExtractor(
+    country=Attribute([
+        (('germany', 'daad'), 'Germany'),
+        (('uk', 'britain', 'chevening'), 'United Kingdom'),
+        ('canada', 'Canada'),
+        ('australia', 'Australia'),
+        (('usa', 'united states', 'fulbright'), 'United States'),
+    ], default='Multiple'),
+)
+
 class OnlineScholarshipsScraper(BaseScraper):
     """Scraper for online scholarship databases using APIs and RSS feeds"""
 
@@ -29,14 +40,17 @@ class OnlineScholarshipsScraper(BaseScraper):
         """Parse Scholars4Dev RSS feed"""
         scholarships = []
         try:
-            feed = feedparser.parse("https://www.scholars4dev.com/feed/")
+            feed = self._fetch_feed("https://www.scholars4dev.com/feed/")
+            entries = feed.entries[:20]  # Limit to 20 latest
+            # Country from the descriptions, one keyword scan for the whole feed
+            attributes = SCHOLARS4DEV_ATTRIBUTES.extract_many([entry.get('summary', '') for entry in entries])
             
-            for entry in feed.entries[:20]:  # Limit to 20 latest
+            for entry, extracted in zip(entries, attributes):
                 try:
                     scholarship = {
                         'title': entry.get('title', 'Unknown'),
                         'url': entry.get('link', ''),
-                        'country': 'Multiple',
+                        'country': extracted['country'],
                         'degree': 'Various',
                         'field': 'All fields',
                         'funding': 'Partial/Full',
@@ -46,20 +60,6 @@ class OnlineScholarshipsScraper(BaseScraper):
                         'description': entry.get('summary', '')[:200]
                     }
                     
-                    # Extract country from description if possible
-                    if entry.get('summary'):
-                        desc = entry['summary'].lower()
-                        if 'germany' in desc or 'daad' in desc:
-                            scholarship['country'] = 'Germany'
-                        elif 'uk' in desc or 'britain' in desc or 'chevening' in desc:
-                            scholarship['country'] = 'United Kingdom'
-                        elif 'canada' in desc:
-                            scholarship['country'] = 'Canada'
-                        elif 'australia' in desc:
-                            scholarship['country'] = 'Australia'
-                        elif 'usa' in desc or 'united states' in desc or 'fulbright' in desc:
-                            scholarship['country'] = 'United States'
-                    
                     scholarships.append(scholarship)
                 except Exception as e:
                     continue
@@ -73,7 +73,7 @@ class OnlineScholarshipsScraper(BaseScraper):
         """Parse Opportunities Corners RSS feed"""
         scholarships = []
         try:
-            feed = feedparser.parse("https://opportunitiescorners.com/feed/")
+            feed = self._fetch_feed("https://opportunitiescorners.com/feed/")
             
             for entry in feed.entries[:20]:
                 try:
@@ -103,7 +103,7 @@ class OnlineScholarshipsScraper(BaseScraper):
         """Parse Youth Opportunities RSS feed"""
         scholarships = []
         try:
-            feed = feedparser.parse("https://www.youthopportunities.com/feed/")
+            feed = self._fetch_feed("https://www.youthopportunities.com/feed/")
             
             for entry in feed.entries[:20]:
                 try:
@@ -129,6 +129,10 @@ class OnlineScholarshipsScraper(BaseScraper):
         
         return scholarships
 
+    def _fetch_feed(self, feed_url: str):
+        """Bounded feed download through the pooled session (shared with other scrapers)"""
+        return self.feeds.parse(feed_url, self.session)
+
     def _get_fallback_scholarships(self) -> List[Dict]:
         """Fallback scholarships when scraping fails"""
         return [
@@ -0,0 +1,59 @@
+# scrapers/parse_scope.py
+
+"""
+Parse scopes: build only the parts of a page a parser looks at.
+
+Most parsers only search a page for <a>, <article> or <script> nodes, yet a
+full BeautifulSoup tree of a portal page is tens of thousands of Python
+objects. A parse scope is handed to BeautifulSoup as a SoupStrainer, so only
+matching elements (with their whole subtrees) are materialised; lxml still
+reads the whole document, but the tree built from it is a fraction of the
+size.
+
+A scope is one of:
+- None: the whole page
+- a tag name or a list of tag names, e.g. ["article"] (this is the form used
+  by the "parse_scope" key in config/sources.py)
+- a dict of SoupStrainer arguments, e.g. {"name": "div", "class_": "card"}
+- a SoupStrainer
+
+Scrapers declare a parse_scope class attribute; a source's "parse_scope"
+key replaces it. The bs4 backend of scrapers/dom.py builds only the scoped
+elements; the lxml backend parses the page natively and then prunes the
+tree to the same elements, so parsers walk the same (small) tree on both.
+selectolax keeps the whole page, and a ready-made SoupStrainer only applies
+to bs4. A scope has to include every element the parser walks from
+(find_parent() can only reach ancestors that are themselves in scope).
+"""
+
+from typing import Optional
+
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
+except ImportError:
+    BeautifulSoup = SoupStrainer = None
+
+# Link containers plus bare links: the context GenericScraper reads around a link
+LINK_CONTEXT_SCOPE = ('div', 'article', 'section', 'li', 'a')
+
+# Inline scripts: JSON-LD, hydration state and the endpoints they call (scrapers/structured_data.py)
+SCRIPT_SCOPE = 'script'
+
+
+def make_strainer(scope) -> Optional['SoupStrainer']:
+    """SoupStrainer for a scope declaration, None for the whole page"""
+    if scope is None or isinstance(scope, SoupStrainer):
+        return scope
+    if isinstance(scope, str):
+        return SoupStrainer(scope)
+    if isinstance(scope, dict):
+        return SoupStrainer(**scope)
+    return SoupStrainer(list(scope))
+
+
+def scoped_soup(content, scope=None, encoding: Optional[str] = None) -> 'BeautifulSoup':
+    """BeautifulSoup of content restricted to scope (bytes are decoded with encoding)"""
+    strainer = make_strainer(scope)
+    if isinstance(content, bytes):
+        return BeautifulSoup(content, 'lxml', parse_only=strainer, from_encoding=encoding)
+    return BeautifulSoup(content, 'lxml', parse_only=strainer)
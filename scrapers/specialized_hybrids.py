@@ -2,26 +2,28 @@
 
 from typing import List, Dict
 from scrapers.hybrid_scraper import HybridScraper
-
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    BeautifulSoup = None
+from scrapers.structured_data import iter_json
+from scrapers.dom import Node
 
 import re
-import json
 
 class Scholars4DevHybrid(HybridScraper):
     """Scholars4Dev with RSS + HTML fallback"""
     
-    def _parse_html(self, soup: BeautifulSoup, profile: Dict) -> List[Dict]:
+    candidate_tags = ('article',)
+    parse_scope = ('article',)
+    
+    def _is_stream_candidate(self, element) -> bool:
+        return re.search('post', element.get('class', ''), re.I) is not None
+    
+    def _parse_html(self, soup: Node, profile: Dict) -> List[Dict]:
         """Custom HTML parsing for Scholars4Dev"""
         scholarships = []
         
         # Find article listings
         articles = soup.find_all('article', class_=re.compile('post', re.I))
         
-        for article in articles[:15]:
+        for article in articles[:self.max_items]:
             title_elem = article.find(['h2', 'h3'])
             link_elem = article.find('a', href=True)
             
@@ -45,14 +47,21 @@ class Scholars4DevHybrid(HybridScraper):
 class ScholarshipPortalHybrid(HybridScraper):
     """ScholarshipPortal with RSS + HTML"""
     
-    def _parse_html(self, soup: BeautifulSoup, profile: Dict) -> List[Dict]:
+    max_items = 20
+    candidate_tags = ('div',)
+    parse_scope = {'name': 'div', 'class_': re.compile('scholarship', re.I)}
+    
+    def _is_stream_candidate(self, element) -> bool:
+        return re.search('scholarship', element.get('class', ''), re.I) is not None
+    
+    def _parse_html(self, soup: Node, profile: Dict) -> List[Dict]:
         """Custom HTML parsing for ScholarshipPortal"""
         scholarships = []
         
         # Find scholarship cards
         cards = soup.find_all('div', class_=re.compile('scholarship', re.I))
         
-        for card in cards[:20]:
+        for card in cards[:self.max_items]:
             title_elem = card.find(['h3', 'h4', 'a'])
             link_elem = card.find('a', href=True)
             
@@ -80,26 +89,25 @@ class ScholarshipPortalHybrid(HybridScraper):
 class DAADHybrid(HybridScraper):
     """DAAD with JSON extraction + guaranteed fallback"""
     
-    def _parse_html(self, soup: BeautifulSoup, profile: Dict) -> List[Dict]:
+    # The JSON may sit in a script anywhere in the page, so read all of it
+    candidate_tags = ()
+    parse_scope = ('script', 'a')
+    
+    def _parse_html(self, soup: Node, profile: Dict) -> List[Dict]:
         """Parse DAAD with JSON extraction"""
         scholarships = []
         
         # Try to find JSON data in scripts
-        script_tags = soup.find_all('script', text=re.compile('scholarship|stipendium', re.I))
+        script_tags = soup.find_all('script', string=re.compile('scholarship|stipendium', re.I))
         
         for script in script_tags:
-            try:
-                json_match = re.search(r'{[\s\S]*}', script.string)
-                if json_match:
-                    data = json.loads(json_match.group(0))
-                    if 'items' in data or 'scholarships' in data:
-                        return self._parse_api_response(data)
-            except:
-                continue
+            for data in iter_json(script.string or ''):
+                if isinstance(data, dict) and ('items' in data or 'scholarships' in data):
+                    return self._parse_api_response(data)
         
         # Fallback to link extraction
         cards = soup.find_all('a', href=re.compile('stipendium', re.I))
-        for card in cards[:15]:
+        for card in cards[:self.max_items]:
             title = card.get_text(strip=True)
             if len(title) > 15:
                 scholarships.append({
@@ -0,0 +1,359 @@
+# scrapers/structured_data.py
+
+"""
+Structured data embedded in HTML pages.
+
+Many JavaScript-heavy sites ship the data they render inside the page itself:
+schema.org JSON-LD blocks, framework hydration state (__NEXT_DATA__,
+window.__INITIAL_STATE__ = {...}, application/json script tags) or the URL
+of the JSON endpoint the page calls. Reading those directly is far cheaper
+than rendering the page in a browser.
+
+JSON is located with a bracket-matching scanner (string and escape aware)
+rather than a regex, since a greedy or lazy `{...}` regex cannot find where
+a nested object ends.
+
+The finders take a page root from scrapers/dom.py (any backend); they only
+read <script> elements, so the page can be parsed with SCRIPT_SCOPE
+(scrapers/parse_scope.py).
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urljoin, urlparse
+from scrapers.dom import Node
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+# Characters the scanner has to look at; everything else is skipped in bulk
+_SIGNIFICANT = re.compile(r'["\'\\{}\[\]]')
+_JSON_START = re.compile(r'[{\[]')
+_CLOSERS = {'{': '}', '[': ']'}
+
+# window.__INITIAL_STATE__ = {...}, window.__APOLLO_STATE__ = {...}, ...
+_STATE_ASSIGNMENT = re.compile(r'(?:window\.|self\.)?__[A-Z_]+__\s*=\s*(?=[{\[])')
+
+# fetch("/api/..."), axios.get('/api/...'), $.getJSON("...json"), xhr.open("GET", "...")
+_XHR_CALL = re.compile(
+    r'''(?:fetch|axios(?:\.get)?|\$\.getJSON|\$\.get|\.open)\(\s*(?:["']GET["']\s*,\s*)?["'`]([^"'`\s]+)["'`]'''
+)
+# Any string literal that looks like an API URL
+_API_LITERAL = re.compile(
+    r'''["']((?:https?://[^"'\s]+)?/(?:api|wp-json|graphql|_next/data)/[^"'\s]*|[^"'\s]+\.json(?:\?[^"'\s]*)?)["']'''
+)
+
+SCHOLARSHIP_KEYWORDS = re.compile(
+    r'scholarship|fellowship|grant|stipend|bursary|studentship|funding|award', re.I
+)
+
+# schema.org types that describe a funding opportunity on their own
+_GRANT_TYPES = {'MonetaryGrant', 'Grant', 'EducationalOccupationalProgram'}
+# Types that can describe one when their title says so
+_CONTENT_TYPES = {'Course', 'Event', 'Article', 'NewsArticle', 'BlogPosting', 'CreativeWork', 'ListItem'}
+
+_TITLE_KEYS = ('title', 'name', 'headline', 'label')
+_URL_KEYS = ('url', 'link', 'href', 'permalink', 'uri', 'path')
+_FIELD_KEYS = {
+    'country': ('country', 'addressCountry', 'location', 'hostCountry', 'destination'),
+    'degree': ('degree', 'degreeLevel', 'level', 'educationalLevel', 'educationalCredentialAwarded', 'studyLevel'),
+    'field': ('field', 'subject', 'discipline', 'fieldOfStudy', 'about'),
+    'duration': ('duration', 'timeToComplete', 'timeRequired'),
+    'funding': ('funding', 'amount', 'fundingAmount', 'offers'),
+    'eligibility': ('eligibility', 'eligibleRegion', 'eligibleNationalities', 'audience'),
+    'deadline': ('deadline', 'applicationDeadline', 'closingDate', 'validThrough', 'endDate'),
+}
+_DEFAULTS = {
+    'country': 'Various',
+    'degree': 'Not specified',
+    'field': 'All fields',
+    'duration': 'Varies',
+    'funding': 'See website',
+    'eligibility': 'See website',
+    'documents': 'See website',
+    'deadline': 'Check website',
+}
+
+
+def match_brackets(text: str, start: int) -> int:
+    """
+    Index just past the bracket that closes the one at text[start]
+
+    Brackets inside single- or double-quoted strings are ignored and escapes
+    are honoured. Returns -1 when the brackets are unbalanced or mismatched.
+    """
+    stack = []
+    quote = None
+    escaped = False
+    for match in _SIGNIFICANT.finditer(text, start):
+        ch = match.group()
+        if quote:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == quote:
+                quote = None
+            continue
+        if ch in '"\'':
+            quote = ch
+        elif ch in _CLOSERS:
+            stack.append(_CLOSERS[ch])
+        elif ch in '}]':
+            if not stack or stack.pop() != ch:
+                return -1
+            if not stack:
+                return match.end()
+        # A backslash outside a string is just skipped
+    return -1
+
+
+def iter_json(text: str) -> Iterator[Any]:
+    """Yield every top-level JSON object/array found in text, in order"""
+    pos = 0
+    while True:
+        match = _JSON_START.search(text, pos)
+        if match is None:
+            return
+        start = match.start()
+        end = match_brackets(text, start)
+        if end < 0:
+            pos = start + 1
+            continue
+        try:
+            value = json.loads(text[start:end])
+        except ValueError:
+            # e.g. a JS object literal; a JSON value may still be nested inside
+            pos = start + 1
+            continue
+        yield value
+        pos = end
+
+
+def _load(text: str) -> Optional[Any]:
+    """Parse a script body that should be JSON, tolerating wrappers like comments"""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return next(iter_json(text), None)
+
+
+def find_json_ld(soup: Node) -> List[Any]:
+    """Parsed contents of every application/ld+json script"""
+    blocks = []
+    for script in soup.find_all('script', type=re.compile(r'application/ld\+json', re.I)):
+        data = _load(script.string or script.get_text() or '')
+        if data is not None:
+            blocks.append(data)
+    return blocks
+
+
+def find_hydration_data(soup: Node) -> List[Any]:
+    """Framework state embedded in the page (__NEXT_DATA__, __INITIAL_STATE__, JSON script tags)"""
+    blobs = []
+    for script in soup.find_all('script'):
+        text = script.string or ''
+        if not text.strip():
+            continue
+        script_type = (script.get('type') or '').lower()
+        if 'ld+json' in script_type:
+            continue
+        if script_type == 'application/json' or script.get('id') == '__NEXT_DATA__':
+            data = _load(text)
+            if data is not None:
+                blobs.append(data)
+            continue
+        for assignment in _STATE_ASSIGNMENT.finditer(text):
+            end = match_brackets(text, assignment.end())
+            if end < 0:
+                continue
+            try:
+                blobs.append(json.loads(text[assignment.end():end]))
+            except ValueError:
+                continue
+    return blobs
+
+
+def find_endpoints(soup: Node, base_url: str, limit: int = 3) -> List[str]:
+    """Same-site JSON/API URLs referenced by inline scripts"""
+    host = urlparse(base_url).netloc.lower()
+    endpoints = []
+    for script in soup.find_all('script'):
+        text = script.string or ''
+        if not text or 'ld+json' in (script.get('type') or '').lower():
+            continue
+        for pattern in (_XHR_CALL, _API_LITERAL):
+            for match in pattern.finditer(text):
+                candidate = match.group(1)
+                # Skip template literals and other computed URLs
+                if '${' in candidate or '{' in candidate or '+' in candidate:
+                    continue
+                url = urljoin(base_url, candidate)
+                parsed = urlparse(url)
+                if parsed.scheme not in ('http', 'https') or parsed.netloc.lower() != host:
+                    continue
+                if url not in endpoints:
+                    endpoints.append(url)
+                    if len(endpoints) >= limit:
+                        return endpoints
+    return endpoints
+
+
+def _text(value: Any) -> str:
+    """Flatten a JSON value (string, number, schema.org node or list) to display text"""
+    if value is None or isinstance(value, bool):
+        return ''
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, str):
+        if '<' in value and BeautifulSoup is not None:
+            value = BeautifulSoup(value, 'lxml').get_text(' ', strip=True)
+        return ' '.join(value.split())[:200]
+    if isinstance(value, dict):
+        if 'value' in value and ('currency' in value or 'unitText' in value):
+            return ' '.join(filter(None, [_text(value.get('currency')), _text(value['value'])]))
+        for key in ('rendered', 'name', '@value', 'value', 'text', 'title'):
+            if key in value:
+                return _text(value[key])
+        return ''
+    if isinstance(value, list):
+        return ', '.join(filter(None, (_text(v) for v in value[:3])))
+    return ''
+
+
+def _first(node: Dict, keys) -> str:
+    for key in keys:
+        text = _text(node.get(key))
+        if text:
+            return text
+    return ''
+
+
+def _node_type(node: Dict) -> set:
+    kind = node.get('@type')
+    return set(kind) if isinstance(kind, list) else {kind}
+
+
+def _is_relevant(node: Dict, title: str) -> bool:
+    if _node_type(node) & _GRANT_TYPES:
+        return True
+    description = _text(node.get('description')) or _text(node.get('excerpt'))
+    return bool(SCHOLARSHIP_KEYWORDS.search(f"{title} {description}"))
+
+
+def to_scholarship(node: Dict, base_url: str) -> Optional[Dict]:
+    """Map a structured record to the scraper's scholarship dict, or None without title/url"""
+    title = _first(node, _TITLE_KEYS)
+    url = _first(node, _URL_KEYS)
+    if len(title) < 10 or not url:
+        return None
+
+    scholarship = {'title': title}
+    for field, default in _DEFAULTS.items():
+        scholarship[field] = _first(node, _FIELD_KEYS.get(field, ())) or default
+    scholarship['url'] = urljoin(base_url, url)
+    return scholarship
+
+
+def _json_ld_nodes(data: Any) -> Iterator[Dict]:
+    """Flatten JSON-LD: lists, @graph containers and ItemList elements"""
+    stack = [data]
+    while stack:
+        node = stack.pop(0)
+        if isinstance(node, list):
+            stack[:0] = node
+            continue
+        if not isinstance(node, dict):
+            continue
+        if '@graph' in node:
+            stack[:0] = node['@graph'] if isinstance(node['@graph'], list) else [node['@graph']]
+            continue
+        if 'itemListElement' in node:
+            elements = node['itemListElement']
+            stack[:0] = elements if isinstance(elements, list) else [elements]
+            continue
+        if 'ListItem' in _node_type(node) and isinstance(node.get('item'), dict):
+            # Keep the list item's name/url when the nested item lacks them
+            stack.insert(0, {**node, **node['item'], '@type': node['item'].get('@type', 'ListItem')})
+            continue
+        yield node
+
+
+def scholarships_from_json_ld(blocks: List[Any], base_url: str, limit: int = 20) -> List[Dict]:
+    scholarships = []
+    seen = set()
+    for block in blocks:
+        for node in _json_ld_nodes(block):
+            if not _node_type(node) & (_GRANT_TYPES | _CONTENT_TYPES):
+                continue
+            scholarship = to_scholarship(node, base_url)
+            if scholarship is None or scholarship['url'] in seen:
+                continue
+            if not _is_relevant(node, scholarship['title']):
+                continue
+            seen.add(scholarship['url'])
+            scholarships.append(scholarship)
+            if len(scholarships) >= limit:
+                return scholarships
+    return scholarships
+
+
+def _record_lists(data: Any) -> Iterator[List[Dict]]:
+    """Every list in a JSON tree whose items look like records (title + url)"""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            records = [v for v in value if isinstance(v, dict)
+                       and _first(v, _TITLE_KEYS) and _first(v, _URL_KEYS)]
+            if len(records) >= 2:
+                yield records
+            stack.extend(value)
+
+
+def scholarships_from_json(data: Any, base_url: str, limit: int = 20) -> List[Dict]:
+    """
+    Scholarships from arbitrary JSON (hydration state or an API response)
+
+    Lists of title+url records are ranked by how many of their items mention
+    scholarship keywords, so navigation menus and the like lose to the
+    actual listings.
+    """
+    ranked = []
+    for records in _record_lists(data):
+        hits = sum(1 for r in records if _is_relevant(r, _first(r, _TITLE_KEYS)))
+        if hits:
+            ranked.append((hits, records))
+    ranked.sort(key=lambda item: item[0], reverse=True)
+
+    scholarships = []
+    seen = set()
+    for _, records in ranked:
+        for record in records:
+            scholarship = to_scholarship(record, base_url)
+            if scholarship is None or scholarship['url'] in seen:
+                continue
+            if not _is_relevant(record, scholarship['title']):
+                continue
+            seen.add(scholarship['url'])
+            scholarships.append(scholarship)
+            if len(scholarships) >= limit:
+                return scholarships
+    return scholarships
+
+
+def extract_scholarships(soup: Node, base_url: str, limit: int = 20) -> List[Dict]:
+    """Scholarships from a page's JSON-LD, falling back to its hydration state"""
+    scholarships = scholarships_from_json_ld(find_json_ld(soup), base_url, limit)
+    if scholarships:
+        return scholarships
+    for blob in find_hydration_data(soup):
+        scholarships = scholarships_from_json(blob, base_url, limit)
+        if scholarships:
+            return scholarships
+    return []
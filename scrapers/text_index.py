@@ -0,0 +1,141 @@
+# scrapers/text_index.py
+
+"""
+One-pass text index of a page for the card and link parsers.
+
+extract_scholarship_cards() reads the text of up to 50 nested blocks and
+GenericScraper the text around every matching link. Calling get_text() on
+each of them re-reads the same strings once per nesting level, so a page of
+deeply nested <div>s costs O(depth x size). TextIndex walks the document
+once (scrapers.dom.walk) instead:
+
+- every non-empty stripped string is kept in one list in document order, so
+  the text of any element is a contiguous slice of it, the union of its
+  children's slices;
+- the page text is joined and lowercased once, on first use; a keyword test
+  on an element is a bisect into the keyword's offsets in it, not a scan;
+- each block remembers its first <a href> and first heading, and each link
+  its nearest enclosing block, which is what find() and find_parent() would
+  return.
+
+It works on every backend of scrapers/dom.py.
+"""
+
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Tuple
+from scrapers.dom import Node, walk
+
+# Card and link-context containers (what find_parent() looks for around a link)
+BLOCK_TAGS = ('article', 'div', 'li', 'section')
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'strong')
+
+
+class IndexedElement:
+    """A block, heading or link of a TextIndex; its text is strings[first:last]"""
+
+    __slots__ = ('node', 'first', 'last', 'anchor', 'heading', 'container')
+
+    def __init__(self, node: Node, first: int, container: Optional['IndexedElement']):
+        self.node = node
+        self.first = first
+        self.last = first
+        self.anchor: Optional[IndexedElement] = None   # first <a href> inside (blocks only)
+        self.heading: Optional[IndexedElement] = None  # first heading inside (blocks only)
+        self.container = container                     # nearest enclosing block
+
+    def __repr__(self) -> str:
+        return f"<IndexedElement {self.node.name} [{self.first}:{self.last}]>"
+
+
+class TextIndex:
+    """Blocks, headings and links of a page with their text, from one walk"""
+
+    def __init__(self, root: Node, blocks: Iterable[str] = BLOCK_TAGS,
+                 headings: Iterable[str] = HEADING_TAGS):
+        self.strings: List[str] = []
+        self.blocks: List[IndexedElement] = []  # document order, like find_all(blocks)
+        self.links: List[IndexedElement] = []   # <a href> in document order
+        self._texts: Dict[Tuple[int, str], str] = {}
+        self._lowered: Optional[str] = None
+        self._offsets: List[int] = []
+        self._occurrences: Dict[str, List[int]] = {}
+        self._build(root, frozenset(blocks), frozenset(headings))
+
+    def _build(self, root: Node, blocks: frozenset, headings: frozenset):
+        strings = self.strings
+        stack: List[Optional[IndexedElement]] = []  # one entry per open element walk() reports
+        open_blocks: List[IndexedElement] = []
+        # open_blocks[i:] have no heading / link yet: once one is found every
+        # block open at that point has it, so the ones missing it are a suffix
+        need_heading = need_anchor = 0
+
+        for event, item in walk(root, blocks | headings | {'a'}):
+            if event == 'text':
+                text = item.strip()
+                if text:
+                    strings.append(text)
+            elif event == 'start':
+                name = item.name
+                container = open_blocks[-1] if open_blocks else None
+                element = None
+                if name == 'a' and item.get('href') is not None:
+                    element = IndexedElement(item, len(strings), container)
+                    self.links.append(element)
+                    for block in open_blocks[need_anchor:]:
+                        block.anchor = element
+                    need_anchor = len(open_blocks)
+                elif name in headings:
+                    element = IndexedElement(item, len(strings), container)
+                    for block in open_blocks[need_heading:]:
+                        block.heading = element
+                    need_heading = len(open_blocks)
+                if name in blocks:
+                    element = element or IndexedElement(item, len(strings), container)
+                    self.blocks.append(element)
+                    open_blocks.append(element)
+                stack.append(element)
+            else:
+                element = stack.pop()
+                if element is None:
+                    continue
+                element.last = len(strings)
+                if open_blocks and open_blocks[-1] is element:
+                    open_blocks.pop()
+                    need_heading = min(need_heading, len(open_blocks))
+                    need_anchor = min(need_anchor, len(open_blocks))
+
+    def get_text(self, element: IndexedElement, separator: str = '') -> str:
+        """element.node.get_text(separator, strip=True), built once per element"""
+        key = (id(element), separator)
+        text = self._texts.get(key)
+        if text is None:
+            text = self._texts[key] = separator.join(self.strings[element.first:element.last])
+        return text
+
+    def contains_any(self, element: IndexedElement, keywords: Iterable[str]) -> bool:
+        """Whether a keyword occurs in element's get_text(' ', strip=True).lower()"""
+        if element.first == element.last:
+            return any(not keyword for keyword in keywords)
+        if self._lowered is None:
+            lowered = [text.lower() for text in self.strings]
+            self._lowered = ' '.join(lowered)
+            self._offsets = [0, *accumulate(len(text) + 1 for text in lowered)]
+        start, end = self._offsets[element.first], self._offsets[element.last] - 1
+        for keyword in keywords:
+            positions = self._positions(keyword)
+            i = bisect_left(positions, start)
+            if i < len(positions) and positions[i] + len(keyword) <= end:
+                return True
+        return False
+
+    def _positions(self, keyword: str) -> List[int]:
+        """Start offsets of keyword in the lowercased page text (overlaps included)"""
+        positions = self._occurrences.get(keyword)
+        if positions is None:
+            positions = self._occurrences[keyword] = []
+            find, at = self._lowered.find, self._lowered.find(keyword)
+            while at != -1:
+                positions.append(at)
+                at = find(keyword, at + 1)
+        return positions
@@ -1,37 +1,22 @@
 # utils/anti_block.py
 
 import time
-import random
 from typing import Dict, Optional
 from fake_useragent import UserAgent
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from utils.http_transport import ACCEPT_ENCODING, HTTPTransport, get_transport
 
 class AntiBlockSession:
     """Enhanced requests session with anti-blocking features"""
     
-    def __init__(self):
+    def __init__(self, transport: Optional[HTTPTransport] = None):
         self.ua = UserAgent()
+        self.transport = transport or get_transport()
         self.session = self._create_session()
         
     def _create_session(self) -> requests.Session:
-        """Create a session with retry strategy"""
-        session = requests.Session()
-        
-        # Retry strategy
-        retry_strategy = Retry(
-            total=3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            backoff_factor=1,
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST"]
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        return session
+        """Create a session on the shared, pooled transport (retries included)"""
+        return self.transport.create_session()
     
     def get_headers(self) -> Dict[str, str]:
         """Generate randomized headers"""
@@ -39,7 +24,7 @@ class AntiBlockSession:
             'User-Agent': self.ua.random,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': ACCEPT_ENCODING,  # only codings we can decode
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
@@ -50,11 +35,15 @@ class AntiBlockSession:
         }
     
     def get(self, url: str, timeout: int = 15, delay: Optional[float] = None) -> requests.Response:
-        """Make GET request with anti-blocking measures"""
-        # Random delay between requests
-        if delay is None:
-            delay = random.uniform(1.5, 3.0)
-        time.sleep(delay)
+        """
+        Make GET request with anti-blocking measures
+        
+        Politeness comes from the per-host token bucket in the shared transport,
+        so requests to other hosts are not delayed. Pass delay to force a fixed
+        pause before this request.
+        """
+        if delay is not None:
+            time.sleep(delay)
         
         headers = self.get_headers()
         
@@ -72,8 +61,7 @@ class AntiBlockSession:
             raise
     
     def post(self, url: str, data: Dict = None, json: Dict = None, timeout: int = 15) -> requests.Response:
-        """Make POST request with anti-blocking measures"""
-        time.sleep(random.uniform(1.5, 3.0))
+        """Make POST request with anti-blocking measures (throttled per host by the transport)"""
         
         headers = self.get_headers()
         if json:
@@ -94,12 +82,17 @@ class AntiBlockSession:
             raise
     
     def close(self):
-        """Close the session"""
+        """Close the session (pooled connections stay with the transport)"""
         self.session.close()
 
 
 class RateLimiter:
-    """Simple rate limiter for API calls"""
+    """
+    Simple rate limiter for API calls
+    
+    Blocks the calling thread; scraper traffic is throttled per host by
+    utils.rate_limiter.HostRateLimiter instead (see get_rate_limiter()).
+    """
     
     def __init__(self, calls_per_minute: int = 20):
         self.calls_per_minute = calls_per_minute
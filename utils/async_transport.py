@@ -0,0 +1,302 @@
+# utils/async_transport.py
+
+"""
+Async HTTP transport used by the asyncio search path.
+
+An AsyncTransport is opened once per search (one event loop) and made the
+"current" transport for every task spawned inside it, so scrapers can fetch
+without threading a client through their call signatures. httpx is used when
+installed; otherwise requests are pushed onto worker threads through the
+shared, pooled requests transport so the async path still works. Both
+paths read and fill the same persistent response cache, and identical
+concurrent requests are coalesced into one fetch. Listing pages are streamed
+on the loop through open_stream() (utils/page_fetcher.py).
+
+With the optional h2 package installed (pip install httpx[http2]) the httpx
+clients negotiate HTTP/2, so the robots.txt, feed, listing and detail
+requests a search sends to one host share a single multiplexed connection.
+Hosts without HTTP/2 are still served over HTTP/1.1.
+"""
+
+import asyncio
+import contextvars
+import copy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+import requests
+from config.settings import ASYNC_MAX_CONNECTIONS, HTTP_POOL_CONNECTIONS, HTTP2_ENABLED
+from utils.charset import get_charset_cache
+from utils.http_transport import HTTPTransport, get_transport, share_response
+from utils.response_cache import request_key
+from utils.single_flight import get_single_flight
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - httpx's optional HTTP/2 support
+    HTTP2_AVAILABLE = httpx is not None
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+_current_transport = contextvars.ContextVar('async_transport', default=None)
+
+
+def _share_async_response(response):
+    """Copy of a response handed to a coalesced caller, as the sync adapter does"""
+    if httpx is None or not isinstance(response, httpx.Response):
+        return share_response(response, response.request)  # a requests.Response replayed from the cache
+    shared = copy.copy(response)  # httpx's pickle state: drops the stream and the request
+    shared.headers = httpx.Headers(response.headers)
+    shared.request = response.request
+    for attr in ('from_cache', 'revalidated', 'cache_fingerprint'):
+        setattr(shared, attr, getattr(response, attr, None))
+    shared.coalesced = True
+    return shared
+
+
+def current_async_transport() -> Optional['AsyncTransport']:
+    """Return the AsyncTransport opened by the enclosing search, if any"""
+    return _current_transport.get()
+
+
+class AsyncTransport:
+    """Async HTTP client scoped to a single event loop"""
+
+    def __init__(self, transport: Optional[HTTPTransport] = None,
+                 max_connections: int = ASYNC_MAX_CONNECTIONS,
+                 max_keepalive: int = HTTP_POOL_CONNECTIONS,
+                 http2: bool = HTTP2_ENABLED):
+        self.transport = transport or get_transport()
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.flights = get_single_flight()
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        self._clients = {}
+        self._token = None
+
+    async def __aenter__(self) -> 'AsyncTransport':
+        self._token = _current_transport.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        _current_transport.reset(self._token)
+        await self.aclose()
+
+    def _client(self, verify: bool):
+        """One httpx client per TLS-verification mode (verify is client-wide in httpx)"""
+        if verify not in self._clients:
+            self._clients[verify] = httpx.AsyncClient(
+                verify=verify,
+                http2=self.http2,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive
+                )
+            )
+        return self._clients[verify]
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+                  params: Optional[Dict] = None, timeout=None, verify: bool = True):
+        """
+        Fetch a URL without blocking the event loop
+
+        Returns:
+            httpx.Response, or requests.Response on the thread fallback. Both expose
+            status_code, headers, content, text, json() and raise_for_status().
+        """
+        if httpx is None:
+            # The pooled requests adapter already applies the response cache
+            return await asyncio.to_thread(
+                self.transport.session.get, url,
+                headers=headers, params=params, timeout=timeout, verify=verify
+            )
+        
+        full_url = requests.Request('GET', url, params=params).prepare().url
+        key = ('async', request_key('GET', full_url, headers), verify)
+        led = []
+        
+        def fetch():
+            led.append(True)
+            return self._fetch_decoded(full_url, headers, timeout, verify)
+        
+        response = await self.flights.ado(key, fetch)
+        return response if led else _share_async_response(response)
+    
+    async def _send(self, url: str, headers: Optional[Dict[str, str]], timeout, verify: bool,
+                    stream: bool = False):
+        """Rate-limited httpx GET with the shared policy's timeouts and retries (body unread if stream)"""
+        policy = self.transport.policy
+        connect, read = policy.timeout(timeout)
+        client = self._client(verify)
+        attempt = 0
+        while True:
+            await self.transport.limiter.aacquire(url)
+            request = client.build_request(
+                'GET', url, headers=headers, timeout=httpx.Timeout(read, connect=connect)
+            )
+            started = time.monotonic()
+            try:
+                response = await client.send(request, stream=stream)
+            except httpx.TransportError as e:
+                if isinstance(e, httpx.ReadTimeout):
+                    await asyncio.to_thread(self.transport.latency.record, url, read)
+                if not policy.should_retry('GET', attempt, failed=True):
+                    raise
+                delay = policy.delay(attempt)
+            else:
+                # httpx only knows a streamed response's elapsed once it is closed
+                elapsed = time.monotonic() - started if stream else response.elapsed.total_seconds()
+                await asyncio.to_thread(self.transport.latency.record, url, elapsed)
+                if not policy.should_retry('GET', attempt, status=response.status_code):
+                    return response
+                delay = policy.delay(attempt, response.headers.get('Retry-After'))
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    async def _open(self, url: str, headers: Optional[Dict[str, str]], timeout, verify: bool,
+                    stream: bool = False):
+        """
+        Cache-aware httpx request (revalidates stale entries)
+        
+        Same cache rules as the sync adapter. A fresh or revalidated entry
+        comes back as a replayed requests.Response (from_cache set); a
+        response from the network carries the cache_key to store it under.
+        The SQLite reads and writes run on worker threads so they never
+        block the event loop.
+        """
+        cache = self.transport.cache
+        if cache is None or not cache.is_cacheable_request('GET', headers):
+            return await self._send(url, headers, timeout, verify, stream)
+        
+        key = cache.make_key('GET', url, headers)
+        entry, fresh = await asyncio.to_thread(cache.lookup, key)
+        if fresh:
+            return entry.to_response()
+        
+        sent_headers = dict(headers or {})
+        validators = entry.validators() if entry is not None else {}
+        sent_headers.update(validators)
+        
+        response = await self._send(url, sent_headers, timeout, verify, stream)
+        if response.status_code == 304 and validators:
+            await response.aclose()
+            replay = (await asyncio.to_thread(cache.refresh, entry, response.headers)).to_response()
+            replay.revalidated = True
+            return replay
+        
+        response.from_cache = False
+        response.revalidated = False
+        response.cache_fingerprint = None
+        response.cache_key = key
+        return response
+    
+    async def _fetch(self, url: str, headers: Optional[Dict[str, str]], timeout, verify: bool):
+        """Buffered _open(), stored in the response cache"""
+        response = await self._open(url, headers, timeout, verify)
+        if getattr(response, 'cache_key', None) is not None:
+            await self.store_streamed(response, response.content)
+        return response
+    
+    async def open_stream(self, url: str, headers: Optional[Dict[str, str]] = None, timeout=None,
+                          verify: bool = True):
+        """
+        GET whose body the caller streams (see PageFetcher.afetch)
+        
+        Returns a complete requests.Response when the cache answers
+        (from_cache set). Otherwise the live httpx response with its body
+        unread: read it with aiter_bytes(), aclose() it and hand a complete
+        body to store_streamed(). Streamed bodies belong to a single caller,
+        so these requests are not coalesced. Needs httpx.
+        """
+        return await self._open(url, headers, timeout, verify, stream=True)
+    
+    def will_store(self, response) -> bool:
+        """Whether store_streamed() would cache this response once its body is complete"""
+        return getattr(response, 'cache_key', None) is not None \
+            and self.transport.cache.is_cacheable(response.status_code, response.headers)
+    
+    async def store_streamed(self, response, body: bytes):
+        """Cache a response from open_stream() once the caller has read its complete body"""
+        if not self.will_store(response):
+            return
+        stored = await asyncio.to_thread(
+            self.transport.cache.put, response.cache_key, str(response.url),
+            response.status_code, response.headers, body
+        )
+        if stored is not None:
+            response.cache_fingerprint = stored.fingerprint
+    
+    async def _fetch_decoded(self, url: str, headers: Optional[Dict[str, str]], timeout, verify: bool):
+        """_fetch() with the response's encoding settled, see utils/charset.py"""
+        return get_charset_cache().apply(await self._fetch(url, headers, timeout, verify))
+
+    async def aclose(self):
+        """Close all clients opened by this transport"""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+
+def _run(coro):
+    """
+    asyncio.run() that does not wait for the default executor's threads
+
+    asyncio.run() joins worker threads on exit, so one blocking scrape still
+    running past the search deadline would hold up the results. Here
+    leftover tasks are cancelled as usual, but threads are left to finish
+    in the background.
+    """
+    loop = asyncio.new_event_loop()
+    executor = ThreadPoolExecutor(thread_name_prefix='search')
+    loop.set_default_executor(executor)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            executor.shutdown(wait=False)
+            loop.close()
+
+
+def run_sync(coro):
+    """
+    Run a coroutine to completion from synchronous code
+
+    Runs a fresh event loop on the calling thread (so callbacks such as
+    Streamlit progress updates stay on that thread). If the caller is already
+    inside a running loop, the coroutine is run on a helper thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _run(coro)
+
+    result = {}
+
+    def runner():
+        try:
+            result['value'] = _run(coro)
+        except BaseException as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=runner, daemon=True)
+    thread.start()
+    thread.join()
+    if 'error' in result:
+        raise result['error']
+    return result['value']
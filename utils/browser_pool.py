@@ -0,0 +1,264 @@
+# utils/browser_pool.py
+
+"""
+Reusable headless Chrome instances for Selenium scraping.
+
+Starting Chrome (and resolving chromedriver through webdriver_manager) costs
+seconds, and used to happen for every Selenium source on every search. The
+pool starts browsers lazily, hands them out one source at a time, and keeps
+them for later sources and searches. Each lease gets a fresh tab with cookies
+cleared, browsers are health-checked before reuse, recycled after
+BROWSER_MAX_PAGES pages, and quit after BROWSER_IDLE_TIMEOUT seconds unused.
+
+With BROWSER_FAST_PROFILE the browsers only fetch what is needed to get the
+DOM: the page load strategy is "eager" (DOMContentLoaded, not every
+subresource), images are disabled, and requests matching
+BROWSER_BLOCKED_URLS (media, fonts, stylesheets, analytics and ad scripts)
+are dropped through the DevTools protocol. render() waits on a per-source
+readiness selector instead of a fixed wait on <body> and records how long
+each source took to render.
+
+selenium and webdriver_manager stay optional: they are imported on first use.
+"""
+
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+from config.settings import (
+    BROWSER_POOL_SIZE, BROWSER_IDLE_TIMEOUT, BROWSER_MAX_PAGES, CHROMEDRIVER_PATH,
+    BROWSER_FAST_PROFILE, BROWSER_BLOCKED_URLS, SELENIUM_READY_TIMEOUT
+)
+
+
+class _Browser:
+    """One Chrome process and its usage bookkeeping"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.last_used = time.monotonic()
+
+    def healthy(self) -> bool:
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+
+class BrowserPool:
+    """Bounded pool of headless Chrome drivers, started on demand"""
+
+    _driver_path = None
+    _driver_path_lock = threading.Lock()
+
+    def __init__(self, size: int = BROWSER_POOL_SIZE, idle_timeout: float = BROWSER_IDLE_TIMEOUT,
+                 max_pages: int = BROWSER_MAX_PAGES, fast: bool = BROWSER_FAST_PROFILE):
+        self.size = max(1, size)
+        self.idle_timeout = idle_timeout
+        self.max_pages = max_pages
+        self.fast = fast
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._idle: List[_Browser] = []
+        self._reaper = None
+        self._closed = False
+        self.counters = {'launched': 0, 'reused': 0, 'recycled': 0, 'reaped': 0}
+        self.render_times: Dict[str, float] = {}
+
+    @classmethod
+    def driver_path(cls) -> str:
+        """chromedriver location, resolved once per process"""
+        if cls._driver_path is None:
+            with cls._driver_path_lock:
+                if cls._driver_path is None:
+                    if CHROMEDRIVER_PATH:
+                        cls._driver_path = CHROMEDRIVER_PATH
+                    else:
+                        from webdriver_manager.chrome import ChromeDriverManager
+                        cls._driver_path = ChromeDriverManager().install()
+        return cls._driver_path
+
+    def _options(self):
+        from selenium.webdriver.chrome.options import Options
+
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        if self.fast:
+            chrome_options.page_load_strategy = 'eager'
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.media_stream': 2,
+                'profile.default_content_setting_values.notifications': 2,
+            })
+        return chrome_options
+
+    def _prepare_tab(self, driver):
+        """Apply request blocking to the current tab (DevTools settings are per tab)"""
+        if not self.fast or not BROWSER_BLOCKED_URLS:
+            return
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(BROWSER_BLOCKED_URLS)})
+        except Exception:
+            # Not a Chromium driver, or DevTools unavailable: load everything
+            pass
+
+    def _launch(self) -> _Browser:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+
+        driver = webdriver.Chrome(service=Service(self.driver_path()), options=self._options())
+        self._prepare_tab(driver)
+        with self._lock:
+            self.counters['launched'] += 1
+        return _Browser(driver)
+
+    def _checkout(self) -> _Browser:
+        """Most recently used healthy idle browser, or a new one"""
+        while True:
+            with self._lock:
+                browser = self._idle.pop() if self._idle else None
+            if browser is None:
+                return self._launch()
+            if browser.healthy():
+                with self._lock:
+                    self.counters['reused'] += 1
+                return browser
+            browser.quit()
+
+    def _recycle_tab(self, browser: _Browser):
+        """Replace the used tab with a blank one and drop cookies"""
+        driver = browser.driver
+        old = driver.current_window_handle
+        driver.switch_to.new_window('tab')
+        fresh = driver.current_window_handle
+        driver.switch_to.window(old)
+        driver.close()
+        driver.switch_to.window(fresh)
+        driver.delete_all_cookies()
+        self._prepare_tab(driver)
+
+    def _checkin(self, browser: _Browser):
+        browser.pages += 1
+        browser.last_used = time.monotonic()
+        if self._closed or browser.pages >= self.max_pages:
+            with self._lock:
+                self.counters['recycled'] += 1
+            browser.quit()
+            return
+        try:
+            self._recycle_tab(browser)
+        except Exception:
+            # The browser died mid-page; the next lease launches a new one
+            browser.quit()
+            return
+        with self._lock:
+            self._idle.append(browser)
+        self._ensure_reaper()
+
+    @contextmanager
+    def driver(self):
+        """Lease a driver for one page load; blocks while all browsers are busy"""
+        self._slots.acquire()
+        browser = None
+        try:
+            browser = self._checkout()
+            yield browser.driver
+        finally:
+            if browser is not None:
+                self._checkin(browser)
+            self._slots.release()
+
+    def render(self, url: str, ready_selector: Optional[str] = None,
+               timeout: float = SELENIUM_READY_TIMEOUT, label: Optional[str] = None) -> str:
+        """
+        Load url in a pooled browser and return the rendered HTML
+
+        Waits until ready_selector (CSS) is present, or <body> if none is given.
+        If the selector never shows up, whatever has rendered by the timeout
+        is returned. The render time is recorded under label (default: url).
+        """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        with self.driver() as driver:
+            started = time.monotonic()
+            driver.get(url)
+            locator = (By.CSS_SELECTOR, ready_selector) if ready_selector else (By.TAG_NAME, 'body')
+            try:
+                WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
+            except TimeoutException:
+                print(f"      ⚠️  '{locator[1]}' not found after {timeout}s, using page as rendered")
+            html = driver.page_source
+            elapsed = time.monotonic() - started
+
+        with self._lock:
+            self.render_times[label or url] = round(elapsed, 3)
+        return html
+
+    def _ensure_reaper(self):
+        with self._lock:
+            if self._reaper is not None and self._reaper.is_alive():
+                return
+            self._reaper = threading.Thread(target=self._reap_loop, name='browser-pool-reaper', daemon=True)
+            self._reaper.start()
+
+    def _reap_loop(self):
+        """Quit browsers idle for longer than idle_timeout; exits once the pool is empty"""
+        while not self._closed:
+            time.sleep(max(1.0, self.idle_timeout / 4))
+            now = time.monotonic()
+            with self._lock:
+                expired = [b for b in self._idle if now - b.last_used >= self.idle_timeout]
+                self._idle = [b for b in self._idle if b not in expired]
+                self.counters['reaped'] += len(expired)
+                empty = not self._idle
+                if empty:
+                    self._reaper = None
+            for browser in expired:
+                browser.quit()
+            if empty:
+                return
+
+    def stats(self):
+        """Launch/reuse counters, idle browsers and the last render time per source"""
+        with self._lock:
+            return {**self.counters, 'idle': len(self._idle), 'render_times': dict(self.render_times)}
+
+    def shutdown(self):
+        """Quit every idle browser (leased ones are quit when returned)"""
+        self._closed = True
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for browser in idle:
+            browser.quit()
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Process-wide browser pool shared by all Selenium scrapers"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = BrowserPool()
+                atexit.register(_pool.shutdown)
+    return _pool
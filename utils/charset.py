@@ -0,0 +1,138 @@
+# utils/charset.py
+
+"""
+Charset detection for fetched pages.
+
+When a server sends no charset, requests' response.text falls back to
+statistical detection (charset_normalizer/chardet over the whole body), and
+BeautifulSoup does the same for bytes without a declaration. Both are slow
+on large pages. Instead every response gets its encoding set here, once, in
+the fetch layer:
+
+1. a byte-order mark
+2. the charset parameter of the Content-Type header
+3. a <meta charset> / http-equiv declaration or an XML declaration in the
+   first SNIFF_BYTES of the body
+4. UTF-8 if the start of the body is valid UTF-8 with non-ASCII text in it
+5. the encoding last declared by the same host, if it decodes the body
+6. windows-1252
+
+Declared encodings (1-3) are remembered per host. Parsers then get the raw
+bytes plus response.encoding (BeautifulSoup's from_encoding), or
+response.text, which decodes once with the known codec.
+"""
+
+import codecs
+import re
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+# Bytes of the body searched for a <meta> or XML declaration
+SNIFF_BYTES = 4096
+
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+)
+_HEADER_CHARSET = re.compile(r'charset\s*=\s*["\']?([\w.:\-]+)', re.I)
+_META_CHARSET = re.compile(rb'<meta[^>]+?charset\s*=\s*["\']?\s*([\w.:\-]+)', re.I)
+_XML_ENCODING = re.compile(rb'^\s*<\?xml[^>]+encoding\s*=\s*["\']([\w.:\-]+)', re.I)
+_TEXTUAL = re.compile(r'^text/|html|xml|json|javascript', re.I)
+
+# Labels browsers decode differently from Python's codec of the same name
+_ALIASES = {
+    'iso8859-1': 'cp1252',
+    'ascii': 'cp1252',
+}
+
+
+def normalize_encoding(label: str) -> Optional[str]:
+    """Encoding name for a declared label, None if Python does not know it"""
+    try:
+        name = codecs.lookup(label.strip().lower()).name
+    except LookupError:
+        return None
+    return _ALIASES.get(name, name)
+
+
+def declared_encoding(content: bytes, content_type: str = '') -> Optional[str]:
+    """Encoding declared by a BOM, the Content-Type header or the start of the markup"""
+    for bom, encoding in _BOMS:
+        if content.startswith(bom):
+            return encoding
+
+    match = _HEADER_CHARSET.search(content_type or '')
+    if match:
+        encoding = normalize_encoding(match.group(1))
+        if encoding:
+            return encoding
+
+    sample = content[:SNIFF_BYTES]
+    match = _XML_ENCODING.search(sample) or _META_CHARSET.search(sample)
+    if match:
+        encoding = normalize_encoding(match.group(1).decode('ascii', 'ignore'))
+        if encoding and encoding.startswith('utf-16'):
+            # An ASCII-readable declaration cannot be UTF-16 (HTML spec says: UTF-8)
+            return 'utf-8'
+        return encoding
+    return None
+
+
+def _decodes(sample: bytes, encoding: str) -> bool:
+    try:
+        # Incremental, so a character cut off at the end of the sample is fine
+        codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+        return True
+    except (UnicodeDecodeError, LookupError):
+        return False
+
+
+class CharsetCache:
+    """Declared encodings per host, and the detection built on them"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, str] = {}
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def encoding_for(self, url: str, content: bytes, content_type: str = '') -> str:
+        """Encoding to decode content (a body or its first chunk) fetched from url with"""
+        host = self.host_of(url)
+        encoding = declared_encoding(content, content_type)
+        if encoding:
+            with self._lock:
+                self._hosts[host] = encoding
+            return encoding
+
+        sample = content[:SNIFF_BYTES * 16]
+        with self._lock:
+            remembered = self._hosts.get(host)
+        if sample.isascii():
+            return remembered or 'utf-8'
+        if _decodes(sample, 'utf-8'):
+            # Non-ASCII text in a legacy encoding is practically never valid UTF-8
+            return 'utf-8'
+        if remembered and _decodes(sample, remembered):
+            return remembered
+        return 'cp1252'
+
+    def apply(self, response):
+        """Set response.encoding (requests or httpx response) so .text never guesses"""
+        content_type = response.headers.get('content-type', '')
+        if content_type and not _TEXTUAL.search(content_type):
+            return response  # images, archives, ...
+        response.encoding = self.encoding_for(str(response.url), response.content, content_type)
+        return response
+
+
+_cache = CharsetCache()
+
+
+def get_charset_cache() -> CharsetCache:
+    """Process-wide per-host encoding cache used by the transports"""
+    return _cache
@@ -0,0 +1,136 @@
+# utils/circuit_breaker.py
+
+"""
+Per-source circuit breakers.
+
+A source that is down still costs a full timeout (plus retries) on every
+search. After BREAKER_FAILURE_THRESHOLD consecutive failed scrapes its
+breaker opens and the scraper serves its fallback data without touching the
+network. Once BREAKER_COOLDOWN_SECONDS have passed, a single probe scrape is
+let through (half-open): success closes the breaker, failure re-opens it for
+another cool-down.
+
+Scrapers are rebuilt for every search, so breakers live in a process-wide
+registry keyed by source name.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+from config.settings import BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN_SECONDS
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker for one source"""
+
+    def __init__(self, name: str, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 cooldown: float = BREAKER_COOLDOWN_SECONDS):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self.state = CLOSED
+        self.failures = 0          # consecutive
+        self.opened_at = None
+        self.probe_started = None
+        self.counters = {'successes': 0, 'failures': 0, 'short_circuited': 0, 'opened': 0}
+
+    def allow(self) -> bool:
+        """Whether a scrape may go ahead; in half-open state only one probe at a time"""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and now - self.opened_at >= self.cooldown:
+                self.state = HALF_OPEN
+                self.probe_started = now
+                return True
+            if self.state == HALF_OPEN and now - self.probe_started >= self.cooldown:
+                # The previous probe never reported back (e.g. cancelled); send another
+                self.probe_started = now
+                return True
+            self.counters['short_circuited'] += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.counters['successes'] += 1
+            self.failures = 0
+            self.state = CLOSED
+            self.opened_at = None
+            self.probe_started = None
+
+    def record_failure(self):
+        with self._lock:
+            self.counters['failures'] += 1
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.counters['opened'] += 1
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.probe_started = None
+
+    def snapshot(self) -> Dict:
+        """Current state, consecutive failures and seconds until the next probe"""
+        with self._lock:
+            retry_in = None
+            if self.state == OPEN:
+                retry_in = round(max(0.0, self.cooldown - (time.monotonic() - self.opened_at)), 1)
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'retry_in': retry_in,
+                **self.counters,
+            }
+
+    def reset(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self.probe_started = None
+
+
+class CircuitBreakerRegistry:
+    """Breakers by source name, created on first use"""
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 cooldown: float = BREAKER_COOLDOWN_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self._breakers[name] = CircuitBreaker(name, self.failure_threshold, self.cooldown)
+            return breaker
+
+    def states(self) -> Dict[str, Dict]:
+        """Snapshot of every source's breaker"""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.snapshot() for breaker in breakers}
+
+    def reset(self, name: Optional[str] = None):
+        """Close one source's breaker, or all of them"""
+        with self._lock:
+            breakers = list(self._breakers.values()) if name is None else [self._breakers.get(name)]
+        for breaker in breakers:
+            if breaker is not None:
+                breaker.reset()
+
+
+_registry = CircuitBreakerRegistry()
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Process-wide breaker registry used by BaseScraper"""
+    return _registry
@@ -0,0 +1,100 @@
+# utils/feed_fetcher.py
+
+"""
+RSS/Atom feed downloads for the scrapers.
+
+feedparser.parse(url) fetches with urllib: no timeout, no retries, no pooling
+and no size limit, so one hung feed host could pin a worker forever. Feeds are
+instead downloaded here through the shared session with separate connect and
+read timeouts, an overall time limit and a byte cap, and only the bytes are
+handed to feedparser. Truncated feeds still parse (feedparser is lenient and
+we only use the first entries), they are just never cached.
+"""
+
+import asyncio
+import time
+from typing import Optional
+import feedparser
+import requests
+from config.settings import FEED_CONNECT_TIMEOUT, FEED_READ_TIMEOUT, FEED_TOTAL_TIMEOUT, FEED_MAX_BYTES
+from utils.http_transport import HTTPTransport, get_transport
+from utils.response_cache import request_key
+from utils.single_flight import get_single_flight
+
+CHUNK_SIZE = 16 * 1024
+
+
+class FeedDocument:
+    """Downloaded feed bytes plus the cache metadata used for parse reuse"""
+
+    def __init__(self, url: str, status_code: int, content: bytes, truncated: bool = False,
+                 from_cache: bool = False, cache_fingerprint: Optional[str] = None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.truncated = truncated
+        self.from_cache = from_cache
+        self.cache_fingerprint = cache_fingerprint
+
+
+class FeedFetcher:
+    """Bounded, pooled feed downloader"""
+
+    def __init__(self, transport: Optional[HTTPTransport] = None,
+                 connect_timeout: float = FEED_CONNECT_TIMEOUT,
+                 read_timeout: float = FEED_READ_TIMEOUT,
+                 total_timeout: float = FEED_TOTAL_TIMEOUT,
+                 max_bytes: int = FEED_MAX_BYTES):
+        self.transport = transport or get_transport()
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.total_timeout = total_timeout
+        self.max_bytes = max_bytes
+
+    def fetch(self, url: str, session: Optional[requests.Session] = None) -> FeedDocument:
+        """Download a feed (concurrent downloads of the same feed are coalesced)"""
+        session = session or self.transport.session
+        key = ('feed', request_key('GET', url, session.headers))
+        return get_single_flight().do(key, lambda: self._download(url, session))
+
+    async def afetch(self, url: str, session: Optional[requests.Session] = None) -> FeedDocument:
+        """Async fetch(); the bounded download runs on a worker thread"""
+        return await asyncio.to_thread(self.fetch, url, session)
+
+    def parse(self, url: str, session: Optional[requests.Session] = None):
+        """Download and parse a feed"""
+        return feedparser.parse(self.fetch(url, session).content)
+
+    def _download(self, url: str, session: requests.Session) -> FeedDocument:
+        started = time.monotonic()
+        response = session.get(url, stream=True, timeout=(self.connect_timeout, self.read_timeout))
+        try:
+            response.raise_for_status()
+            chunks = []
+            size = 0
+            truncated = False
+            for chunk in response.iter_content(CHUNK_SIZE):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= self.max_bytes:
+                    truncated = True
+                    print(f"      ⚠️  Feed {url} exceeds {self.max_bytes} bytes, truncating")
+                    break
+                if time.monotonic() - started > self.total_timeout:
+                    raise requests.exceptions.Timeout(
+                        f"Feed {url} took longer than {self.total_timeout}s to download"
+                    )
+            body = b''.join(chunks)[:self.max_bytes]
+        finally:
+            response.close()
+
+        if not truncated:
+            self.transport.store_streamed(response, body)
+        return FeedDocument(
+            url=response.url,
+            status_code=response.status_code,
+            content=body,
+            truncated=truncated,
+            from_cache=getattr(response, 'from_cache', False),
+            cache_fingerprint=None if truncated else getattr(response, 'cache_fingerprint', None)
+        )
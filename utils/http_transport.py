@@ -0,0 +1,283 @@
+# utils/http_transport.py
+
+"""
+Process-wide HTTP transport shared by every scraper.
+
+Each scraper keeps its own lightweight requests.Session (headers, cookies),
+but all sessions are mounted on the same pooled adapter. urllib3 keeps one
+connection pool per host inside that adapter, so TCP/TLS connections are
+reused across scrapers, searches and Streamlit reruns instead of being
+re-established every time ScraperFactory builds a fresh set of scrapers.
+
+The adapter also serves GET requests from the persistent response cache
+(utils/response_cache.py) while entries are fresh, and revalidates stale
+entries with conditional requests (a 304 replays the stored body).
+Concurrent identical GETs are coalesced into one fetch (utils/single_flight.py)
+and requests that do reach the network are throttled per host
+(utils/rate_limiter.py). Timeouts and retries follow the shared RetryPolicy
+(utils/retry_policy.py); each retry waits for a fresh rate-limit slot.
+Response times are fed to the per-host latency histograms that adaptive
+timeouts are derived from (utils/latency_tracker.py), and every buffered
+response has its encoding set once by utils/charset.py.
+"""
+
+import atexit
+import copy
+import importlib.util
+import threading
+import time
+from typing import Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.request import ACCEPT_ENCODING as URLLIB3_ACCEPT_ENCODING
+from config.settings import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_POOL_BLOCK
+from utils.response_cache import ResponseCache, get_response_cache, request_key
+from utils.single_flight import SingleFlight, get_single_flight
+from utils.rate_limiter import HostRateLimiter, get_rate_limiter
+from utils.retry_policy import RetryPolicy, get_retry_policy
+from utils.latency_tracker import LatencyTracker, get_latency_tracker
+from utils.charset import get_charset_cache
+
+
+def _installed(*modules: str) -> bool:
+    return any(importlib.util.find_spec(module) is not None for module in modules)
+
+
+def _accept_encoding() -> str:
+    """
+    Content codings that both transports can decode
+
+    urllib3 only offers br/zstd when their decoders are importable; httpx
+    decodes them with the same optional packages (brotli or brotlicffi,
+    zstandard). Advertising anything else would hand compressed bytes to
+    the parsers.
+    """
+    httpx_decodes = {'gzip', 'deflate'}
+    if _installed('brotli', 'brotlicffi'):
+        httpx_decodes.add('br')
+    if _installed('zstandard'):
+        httpx_decodes.add('zstd')
+    codings = [coding.strip() for coding in URLLIB3_ACCEPT_ENCODING.split(',')]
+    return ', '.join(coding for coding in codings if coding in httpx_decodes)
+
+
+ACCEPT_ENCODING = _accept_encoding()
+
+
+def share_response(response: requests.Response, request) -> requests.Response:
+    """Copy of a fully-read response handed to a coalesced caller"""
+    shared = copy.copy(response)  # drops raw and non-standard attributes
+    shared.headers = CaseInsensitiveDict(response.headers)
+    shared.request = request
+    shared.connection = getattr(response, 'connection', None)
+    for attr in ('from_cache', 'revalidated', 'cache_fingerprint'):
+        setattr(shared, attr, getattr(response, attr, None))
+    shared.coalesced = True
+    return shared
+
+
+class SharedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools outlive the sessions it is mounted on"""
+
+    def __init__(self, cache: Optional[ResponseCache] = None,
+                 flights: Optional[SingleFlight] = None,
+                 limiter: Optional[HostRateLimiter] = None,
+                 policy: Optional[RetryPolicy] = None,
+                 latency: Optional[LatencyTracker] = None, **kwargs):
+        self.cache = cache
+        self.flights = flights or get_single_flight()
+        self.limiter = limiter or get_rate_limiter()
+        self.policy = policy or get_retry_policy()
+        self.latency = latency or get_latency_tracker()
+        self.charsets = get_charset_cache()
+        super().__init__(**kwargs)
+
+    def _use_cache(self, request) -> bool:
+        """Whether the cache serves this request, see ResponseCache.is_cacheable_request()"""
+        return self.cache is not None and self.cache.is_cacheable_request(request.method, request.headers)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        send_kwargs = dict(stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        if request.method != 'GET' or stream:
+            # Streamed bodies belong to a single caller and cannot be shared
+            # (PageFetcher sniffs their charset from the first chunk instead)
+            response = self._send_cached(request, **send_kwargs)
+            return response if stream else self.charsets.apply(response)
+
+        # Identical concurrent GETs share one fetch
+        led = []
+
+        def fetch():
+            led.append(True)
+            response = self._send_cached(request, **send_kwargs)
+            response.content
+            return self.charsets.apply(response)
+
+        key = ('sync', request_key(request.method, request.url, request.headers), verify)
+        response = self.flights.do(key, fetch)
+        return response if led else share_response(response, request)
+
+    def _send_network(self, request, **send_kwargs):
+        """Actually hit the network (rate limited, with the policy's timeouts and retries)"""
+        send_kwargs['timeout'] = self.policy.timeout(send_kwargs.get('timeout'))
+        attempt = 0
+        while True:
+            self.limiter.acquire(request.url)
+            try:
+                response = super().send(request, **send_kwargs)
+            except requests.exceptions.SSLError:
+                raise  # not transient
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if isinstance(e, requests.exceptions.ReadTimeout):
+                    # Censored sample: the host took at least this long
+                    self.latency.record(request.url, send_kwargs['timeout'][1])
+                if not self.policy.should_retry(request.method, attempt, failed=True):
+                    raise
+                delay = self.policy.delay(attempt)
+            else:
+                self.latency.record(request.url, response.elapsed.total_seconds())
+                if not self.policy.should_retry(request.method, attempt, status=response.status_code):
+                    return response
+                delay = self.policy.delay(attempt, response.headers.get('Retry-After'))
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _send_cached(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if not self._use_cache(request):
+            return self._send_network(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+        key = self.cache.make_key(request.method, request.url, request.headers)
+        entry, fresh = self.cache.lookup(key)
+        if fresh:
+            return self._from_entry(entry, request)
+
+        # Stale entry with validators: ask the server whether it changed
+        sent = request
+        if entry is not None and 'If-None-Match' not in request.headers \
+                and 'If-Modified-Since' not in request.headers:
+            validators = entry.validators()
+            if validators:
+                sent = request.copy()
+                sent.headers.update(validators)
+
+        response = self._send_network(sent, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        if response.status_code == 304 and sent is not request:
+            response.close()
+            refreshed = self.cache.refresh(entry, response.headers)
+            replay = self._from_entry(refreshed, request)
+            replay.revalidated = True
+            return replay
+
+        response.from_cache = False
+        response.revalidated = False
+        response.cache_fingerprint = None
+        if not stream:
+            # Streamed bodies are not read here; HTTPTransport.store_streamed() caches them once complete
+            stored = self.cache.put(key, response.url, response.status_code, response.headers, response.content)
+            if stored is not None:
+                response.cache_fingerprint = stored.fingerprint
+        return response
+
+    def _from_entry(self, entry, request) -> requests.Response:
+        response = entry.to_response(request)
+        response.connection = self
+        return response
+
+    def close(self):
+        # requests.Session.close() closes every mounted adapter. The pools
+        # belong to the transport, so sessions must not tear them down.
+        pass
+
+    def shutdown(self):
+        """Really close all pooled connections"""
+        super().close()
+
+
+class HTTPTransport:
+    """Owns the pooled adapter and hands out sessions mounted on it"""
+
+    def __init__(self, pool_connections: int = HTTP_POOL_CONNECTIONS,
+                 pool_maxsize: int = HTTP_POOL_MAXSIZE,
+                 pool_block: bool = HTTP_POOL_BLOCK,
+                 cache: Optional[ResponseCache] = None):
+        """
+        Args:
+            pool_connections: Number of per-host pools kept alive
+            pool_maxsize: Max idle connections kept per host
+            pool_block: Block instead of opening extra connections when a host pool is exhausted
+            cache: Response cache (defaults to the process-wide one, None if caching is disabled)
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.cache = cache if cache is not None else get_response_cache()
+        self.adapter = SharedHTTPAdapter(
+            cache=self.cache,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.limiter = self.adapter.limiter
+        self.policy = self.adapter.policy
+        self.latency = self.adapter.latency
+        self._session = None
+        self._lock = threading.Lock()
+
+    def mount(self, session: requests.Session) -> requests.Session:
+        """Mount the shared adapter on an existing session"""
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        return session
+
+    def create_session(self, headers: Optional[Dict[str, str]] = None) -> requests.Session:
+        """Create a new session that reuses the shared connection pools"""
+        session = self.mount(requests.Session())
+        session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        if headers:
+            session.headers.update(headers)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """Default session for helpers that are not tied to a scraper"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self.create_session()
+        return self._session
+
+    def will_store(self, response: requests.Response) -> bool:
+        """Whether store_streamed() would cache this response once its body is complete"""
+        if self.cache is None or getattr(response, 'from_cache', False) or response.request is None:
+            return False
+        return self.adapter._use_cache(response.request) \
+            and self.cache.is_cacheable(response.status_code, response.headers)
+
+    def store_streamed(self, response: requests.Response, body: bytes):
+        """Cache a streamed response once the caller has read its complete body"""
+        if not self.will_store(response):
+            return
+        key = self.cache.make_key(response.request.method, response.request.url, response.request.headers)
+        stored = self.cache.put(key, response.url, response.status_code, response.headers, body)
+        if stored is not None:
+            response.cache_fingerprint = stored.fingerprint
+
+    def close(self):
+        """Close all pooled connections"""
+        self.adapter.shutdown()
+
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HTTPTransport:
+    """Return the process-wide transport, creating it on first use"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = HTTPTransport()
+                atexit.register(_transport.close)
+    return _transport
@@ -0,0 +1,148 @@
+# utils/latency_tracker.py
+
+"""
+Per-host response-time histograms and the timeouts derived from them.
+
+Every response that reaches the network is recorded (time to headers) in a
+coarse, log-spaced histogram per host, persisted in SQLite so the history
+survives restarts. A read timeout is recorded as a sample at the timeout
+value, so a host that keeps timing out pushes its own timeout up on the
+next search.
+
+A host's timeout is its TIMEOUT_PERCENTILE latency times TIMEOUT_MARGIN,
+clamped to [TIMEOUT_FLOOR, TIMEOUT_CEILING]. Until a host has
+TIMEOUT_MIN_SAMPLES samples the caller's default applies.
+"""
+
+import bisect
+import threading
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+from config.settings import (
+    TIMEOUT_PERCENTILE, TIMEOUT_MARGIN, TIMEOUT_FLOOR, TIMEOUT_CEILING, TIMEOUT_MIN_SAMPLES
+)
+from utils import storage
+
+# Upper edges (seconds) of the histogram buckets; the last bucket is open-ended
+BUCKET_EDGES = (0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 4.0, 5.0, 7.5, 10.0,
+                15.0, 20.0, 30.0, 45.0, 60.0)
+
+# Halve a host's counts past this many samples so old behaviour fades out
+MAX_SAMPLES = 500
+
+
+class LatencyTracker:
+    """Persistent latency histograms keyed by host"""
+
+    def __init__(self, filename: str = 'latency.sqlite', percentile: float = TIMEOUT_PERCENTILE,
+                 margin: float = TIMEOUT_MARGIN, floor: float = TIMEOUT_FLOOR,
+                 ceiling: float = TIMEOUT_CEILING, min_samples: int = TIMEOUT_MIN_SAMPLES):
+        self.percentile = percentile
+        self.margin = margin
+        self.floor = floor
+        self.ceiling = ceiling
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, List[int]] = {}
+        self._conn = storage.connect(filename)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS host_latency (
+                host TEXT NOT NULL,
+                bucket INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (host, bucket)
+            )
+        """)
+        self._conn.commit()
+        self._load()
+
+    def _load(self):
+        for host, bucket, count in self._conn.execute("SELECT host, bucket, count FROM host_latency"):
+            if 0 <= bucket <= len(BUCKET_EDGES):
+                self._histogram(host)[bucket] = count
+
+    def _histogram(self, host: str) -> List[int]:
+        histogram = self._histograms.get(host)
+        if histogram is None:
+            histogram = self._histograms[host] = [0] * (len(BUCKET_EDGES) + 1)
+        return histogram
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def record(self, url: str, seconds: float):
+        """Add one observed response time for url's host"""
+        host = self.host_of(url)
+        bucket = bisect.bisect_left(BUCKET_EDGES, seconds)
+        with self._lock:
+            histogram = self._histogram(host)
+            histogram[bucket] += 1
+            if sum(histogram) > MAX_SAMPLES:
+                histogram[:] = [count // 2 for count in histogram]
+                self._conn.execute("DELETE FROM host_latency WHERE host = ?", (host,))
+                self._conn.executemany(
+                    "INSERT INTO host_latency (host, bucket, count) VALUES (?, ?, ?)",
+                    [(host, i, count) for i, count in enumerate(histogram) if count]
+                )
+            else:
+                self._conn.execute("""
+                    INSERT INTO host_latency (host, bucket, count) VALUES (?, ?, 1)
+                    ON CONFLICT (host, bucket) DO UPDATE SET count = count + 1
+                """, (host, bucket))
+            self._conn.commit()
+
+    def latency_percentile(self, url: str, percentile: Optional[float] = None) -> Optional[float]:
+        """Upper bound of the bucket holding the given percentile, None without enough data"""
+        with self._lock:
+            histogram = list(self._histograms.get(self.host_of(url), ()))
+        return self._percentile(histogram, self.percentile if percentile is None else percentile)
+
+    def _percentile(self, histogram: List[int], percentile: float) -> Optional[float]:
+        total = sum(histogram)
+        if total < self.min_samples:
+            return None
+        rank = total * percentile / 100.0
+        seen = 0
+        for bucket, count in enumerate(histogram):
+            seen += count
+            if seen >= rank:
+                return BUCKET_EDGES[bucket] if bucket < len(BUCKET_EDGES) else self.ceiling
+        return self.ceiling
+
+    def timeout_for(self, url: str, default: float) -> float:
+        """Read timeout for url: percentile plus margin, clamped; default until there is history"""
+        return self._timeout(self.latency_percentile(url), default)
+
+    def _timeout(self, latency: Optional[float], default: float) -> float:
+        if latency is None:
+            return default
+        return min(self.ceiling, max(self.floor, latency * self.margin))
+
+    def stats(self) -> Dict[str, Dict]:
+        """Sample count, median and derived timeout per host"""
+        with self._lock:
+            # record() updates the histograms in place from other threads
+            histograms = {host: list(histogram) for host, histogram in self._histograms.items()}
+        return {
+            host: {
+                'samples': sum(histogram),
+                'p50': self._percentile(histogram, 50),
+                'timeout': self._timeout(self._percentile(histogram, self.percentile), None),
+            }
+            for host, histogram in histograms.items()
+        }
+
+
+_tracker = None
+_tracker_lock = threading.Lock()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """Process-wide tracker fed by the shared transports"""
+    global _tracker
+    if _tracker is None:
+        with _tracker_lock:
+            if _tracker is None:
+                _tracker = LatencyTracker()
+    return _tracker
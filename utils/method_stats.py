@@ -0,0 +1,147 @@
+# utils/method_stats.py
+
+"""
+Per-source history of which scraping methods work.
+
+Each hybrid method attempt is recorded with its outcome and latency as an
+exponentially weighted success rate and average latency, so recent results
+count most. The table lives in SQLite under CACHE_DIR and is shared by every
+thread and Streamlit worker.
+
+HybridScraper uses it to try methods in order of recent success (then
+speed) and to skip methods that keep failing. A skipped method is still
+probed once every METHOD_PROBE_HOURS in its normal priority slot, so a
+recovered API or feed gets noticed.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from config.settings import METHOD_STATS_MIN_ATTEMPTS, METHOD_SKIP_BELOW, METHOD_PROBE_HOURS
+from utils import storage
+
+# Weight of the newest attempt in the moving averages
+SMOOTHING = 0.3
+
+
+class MethodStats:
+    """Success rates and latencies per (source, method)"""
+
+    def __init__(self, filename: str = 'method_stats.sqlite',
+                 min_attempts: int = METHOD_STATS_MIN_ATTEMPTS,
+                 skip_below: float = METHOD_SKIP_BELOW,
+                 probe_hours: float = METHOD_PROBE_HOURS):
+        self.min_attempts = min_attempts
+        self.skip_below = skip_below
+        self.probe_interval = probe_hours * 3600
+        self._lock = threading.Lock()
+        self._conn = storage.connect(filename)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS method_stats (
+                source TEXT NOT NULL,
+                method TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                successes INTEGER NOT NULL,
+                success_rate REAL NOT NULL,
+                avg_latency REAL NOT NULL,
+                last_attempt REAL NOT NULL,
+                last_success REAL,
+                PRIMARY KEY (source, method)
+            )
+        """)
+        self._conn.commit()
+
+    def record(self, source: str, method: str, success: bool, latency: float):
+        """Fold one attempt into the source's statistics"""
+        now = time.time()
+        with self._lock:
+            # Upsert in SQL so concurrent workers never lose each other's updates
+            self._conn.execute(f"""
+                INSERT INTO method_stats
+                    (source, method, attempts, successes, success_rate, avg_latency, last_attempt, last_success)
+                VALUES (?, ?, 1, ?, ?, ?, ?, ?)
+                ON CONFLICT (source, method) DO UPDATE SET
+                    attempts = attempts + 1,
+                    successes = successes + excluded.successes,
+                    success_rate = success_rate * {1 - SMOOTHING} + excluded.success_rate * {SMOOTHING},
+                    avg_latency = avg_latency * {1 - SMOOTHING} + excluded.avg_latency * {SMOOTHING},
+                    last_attempt = excluded.last_attempt,
+                    last_success = COALESCE(excluded.last_success, last_success)
+            """, (source, method, int(success), float(success), latency, now, now if success else None))
+            self._conn.commit()
+
+    def get(self, source: str) -> Dict[str, Dict]:
+        """Statistics for each method of a source that has been attempted"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT method, attempts, successes, success_rate, avg_latency, last_attempt, last_success "
+                "FROM method_stats WHERE source = ?", (source,)
+            ).fetchall()
+        return {
+            row[0]: {
+                'attempts': row[1],
+                'successes': row[2],
+                'success_rate': round(row[3], 3),
+                'avg_latency': round(row[4], 3),
+                'last_attempt': row[5],
+                'last_success': row[6],
+            }
+            for row in rows
+        }
+
+    def plan(self, source: str, methods: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Order methods for a source
+
+        Returns (methods to run, methods skipped). Methods are ranked by
+        recent success rate, then latency; untried methods count as 50/50
+        and ties keep the configured priority. Failing methods (success rate
+        below skip_below) are skipped once they have min_attempts behind
+        them. When a failing method is due a probe, it goes back to its
+        configured slot instead.
+        """
+        history = self.get(source)
+        now = time.time()
+        ranked, probes, skipped = [], [], []
+        for priority, method in enumerate(methods):
+            stats = history.get(method)
+            if stats is None:
+                ranked.append((0.5, 0.0, priority, method))
+            elif stats['success_rate'] >= self.skip_below:
+                ranked.append((stats['success_rate'], stats['avg_latency'], priority, method))
+            elif now - stats['last_attempt'] >= self.probe_interval:
+                probes.append((priority, method))
+            elif stats['attempts'] >= self.min_attempts:
+                skipped.append(method)
+            else:
+                ranked.append((stats['success_rate'], stats['avg_latency'], priority, method))
+
+        ranked.sort(key=lambda item: (-item[0], item[1], item[2]))
+        order = [item[3] for item in ranked]
+        for priority, method in probes:
+            # Back in the slot it would have had before being demoted
+            slot = sum(1 for other in order if methods.index(other) < priority)
+            order.insert(slot, method)
+        return order, skipped
+
+    def clear(self, source: Optional[str] = None):
+        with self._lock:
+            if source is None:
+                self._conn.execute("DELETE FROM method_stats")
+            else:
+                self._conn.execute("DELETE FROM method_stats WHERE source = ?", (source,))
+            self._conn.commit()
+
+
+_stats = None
+_stats_lock = threading.Lock()
+
+
+def get_method_stats() -> MethodStats:
+    """Process-wide method statistics store"""
+    global _stats
+    if _stats is None:
+        with _stats_lock:
+            if _stats is None:
+                _stats = MethodStats()
+    return _stats
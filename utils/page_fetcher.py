@@ -0,0 +1,264 @@
+# utils/page_fetcher.py
+
+"""
+Streaming page downloads for the HTML scrapers.
+
+session.get() buffers the whole page before anything is parsed, and some
+portals serve megabytes of markup around a listing whose first screen holds
+everything the parsers keep (they stop at 15-20 items). Pages are instead
+streamed through the shared session:
+
+- the body is capped at the source's "max_body_bytes" (default
+  PAGE_MAX_BYTES) and the whole download at PAGE_TOTAL_TIMEOUT
+- the charset is sniffed from the first chunk (utils/charset.py) and the
+  chunks are fed to lxml's incremental HTML parser with it as they arrive,
+  which reports every completed candidate element - scholarship links by
+  default
+- once the scraper's item cap times STREAM_CANDIDATE_HEADROOM candidates have
+  been seen (parsers drop some), the rest of the page is not read. Only
+  responses the cache cannot keep stop early (caching disabled, no-store,
+  uncacheable status): a cacheable page is read in full once and then
+  served, revalidated and parse-memoised from the cache
+
+The bytes read so far and the sniffed encoding go to the HTML parsers
+(scrapers/dom.py), which close the truncated markup. Partial pages are
+never cached; complete ones are stored like any other response, so their
+parse results are reused too.
+
+On the asyncio search path, PageFetcher.afetch() streams the same way over
+the search's AsyncTransport (httpx), so a download does not hold a worker
+thread while it waits on the network.
+"""
+
+import asyncio
+import time
+from typing import Callable, Optional, Sequence
+import requests
+from lxml import etree
+from config.settings import PAGE_MAX_BYTES, PAGE_TOTAL_TIMEOUT, STREAM_EARLY_STOP, STREAM_CANDIDATE_HEADROOM
+from utils.charset import get_charset_cache
+from utils.async_transport import current_async_transport
+from utils.http_transport import HTTPTransport, get_transport
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+CHUNK_SIZE = 16 * 1024
+
+
+class PageDocument:
+    """Downloaded page bytes plus how the download ended"""
+
+    def __init__(self, url: str, status_code: int, content: bytes, encoding: Optional[str] = None,
+                 truncated: bool = False, stopped_early: bool = False, from_cache: bool = False,
+                 cache_fingerprint: Optional[str] = None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.encoding = encoding
+        self.truncated = truncated            # hit the byte cap
+        self.stopped_early = stopped_early    # enough candidates, rest not read
+        self.from_cache = from_cache
+        self.cache_fingerprint = cache_fingerprint
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error for url: {self.url}")
+
+
+class CandidateCounter:
+    """Counts completed elements matching a predicate while the page streams in"""
+
+    def __init__(self, is_candidate: Callable, tags: Sequence[str] = ('a',),
+                 encoding: Optional[str] = None):
+        self.is_candidate = is_candidate
+        self.count = 0
+        self._parser = etree.HTMLPullParser(events=('end',), tag=tuple(tags), encoding=encoding)
+
+    def feed(self, chunk: bytes) -> int:
+        self._parser.feed(chunk)
+        for _, element in self._parser.read_events():
+            if self.is_candidate(element):
+                self.count += 1
+            # Only the count is kept, so drop the subtree as we go
+            element.clear(keep_tail=True)
+        return self.count
+
+    @staticmethod
+    def text(element) -> str:
+        """Whitespace-normalised text of an element (like get_text(strip=True) on one line)"""
+        return ' '.join(''.join(element.itertext()).split())
+
+
+class PageFetcher:
+    """Bounded, pooled page downloader with optional early termination"""
+
+    def __init__(self, transport: Optional[HTTPTransport] = None,
+                 max_bytes: int = PAGE_MAX_BYTES,
+                 total_timeout: float = PAGE_TOTAL_TIMEOUT,
+                 early_stop: bool = STREAM_EARLY_STOP,
+                 headroom: float = STREAM_CANDIDATE_HEADROOM):
+        self.transport = transport or get_transport()
+        self.max_bytes = max_bytes
+        self.total_timeout = total_timeout
+        self.early_stop = early_stop
+        self.headroom = headroom
+
+    def fetch(self, url: str, session: Optional[requests.Session] = None, timeout=None,
+              verify: bool = True, max_bytes: Optional[int] = None,
+              stop_after: Optional[int] = None, is_candidate: Optional[Callable] = None,
+              candidate_tags: Sequence[str] = ('a',)) -> PageDocument:
+        """
+        Stream url into memory
+
+        With stop_after and is_candidate, reading stops once
+        stop_after x headroom elements among candidate_tags satisfied
+        is_candidate (an lxml element predicate).
+        """
+        session = session or self.transport.session
+        started = time.monotonic()
+        response = session.get(url, stream=True, timeout=timeout, verify=verify)
+        if getattr(response, 'from_cache', False):
+            return self._cached_document(url, response)
+
+        # A page the cache can keep is read to the end: stopping early would
+        # send every later search (and the parse memo) back to the network
+        reader = self._reader(url, response, started, max_bytes, stop_after, is_candidate, candidate_tags,
+                              stores=self.transport.will_store(response))
+        try:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                if reader.feed(chunk):
+                    break
+        finally:
+            response.close()
+
+        body = reader.body
+        if reader.complete:
+            self.transport.store_streamed(response, body)
+        return self._document(response, body, reader.encoding, reader.truncated, reader.stopped_early)
+
+    async def afetch(self, url: str, session: Optional[requests.Session] = None, timeout=None,
+                     verify: bool = True, max_bytes: Optional[int] = None,
+                     stop_after: Optional[int] = None, is_candidate: Optional[Callable] = None,
+                     candidate_tags: Sequence[str] = ('a',)) -> PageDocument:
+        """
+        Async fetch(): streamed through the search's AsyncTransport (httpx)
+
+        The body is read on the event loop with the same limits and early
+        stop; without an open AsyncTransport or httpx, fetch() runs on a
+        worker thread instead.
+        """
+        transport = current_async_transport()
+        if transport is None or httpx is None:
+            return await asyncio.to_thread(
+                self.fetch, url, session, timeout, verify, max_bytes, stop_after, is_candidate, candidate_tags
+            )
+        session = session or self.transport.session
+        started = time.monotonic()
+        response = await transport.open_stream(url, dict(session.headers), timeout, verify)
+        if getattr(response, 'from_cache', False):
+            return self._cached_document(url, response)
+
+        reader = self._reader(url, response, started, max_bytes, stop_after, is_candidate, candidate_tags,
+                              stores=transport.will_store(response))
+        try:
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                if reader.feed(chunk):
+                    break
+        finally:
+            await response.aclose()
+
+        body = reader.body
+        if reader.complete:
+            await transport.store_streamed(response, body)
+        return self._document(response, body, reader.encoding, reader.truncated, reader.stopped_early)
+
+    def _reader(self, url: str, response, started: float, max_bytes: Optional[int],
+                stop_after: Optional[int], is_candidate: Optional[Callable],
+                candidate_tags: Sequence[str], stores: bool) -> '_BodyReader':
+        counting = self.early_stop and stop_after and is_candidate is not None and not stores
+        return _BodyReader(
+            url, response.headers.get('content-type', ''), max_bytes or self.max_bytes,
+            started, self.total_timeout,
+            int(stop_after * self.headroom) if counting else None, is_candidate, candidate_tags
+        )
+
+    @classmethod
+    def _cached_document(cls, url: str, response) -> PageDocument:
+        # Already complete in memory; nothing left to save by stopping
+        content_type = response.headers.get('content-type', '')
+        encoding = get_charset_cache().encoding_for(url, response.content, content_type)
+        return cls._document(response, response.content, encoding)
+
+    @staticmethod
+    def _document(response, body: bytes, encoding: Optional[str], truncated: bool = False,
+                  stopped_early: bool = False) -> PageDocument:
+        partial = truncated or stopped_early
+        return PageDocument(
+            url=str(response.url),
+            status_code=response.status_code,
+            content=body,
+            encoding=encoding,
+            truncated=truncated,
+            stopped_early=stopped_early,
+            from_cache=getattr(response, 'from_cache', False),
+            cache_fingerprint=None if partial else getattr(response, 'cache_fingerprint', None)
+        )
+
+
+class _BodyReader:
+    """A streamed body read so far, and whether to stop reading it"""
+
+    def __init__(self, url: str, content_type: str, max_bytes: int, started: float, total_timeout: float,
+                 enough: Optional[int], is_candidate: Optional[Callable], candidate_tags: Sequence[str]):
+        self.url = url
+        self.content_type = content_type
+        self.max_bytes = max_bytes
+        self.started = started
+        self.total_timeout = total_timeout
+        self.enough = enough  # candidates to stop at, None: read to the end
+        self.is_candidate = is_candidate
+        self.candidate_tags = candidate_tags
+        self.chunks = []
+        self.size = 0
+        self.encoding = None
+        self.counter = None
+        self.truncated = False
+        self.stopped_early = False
+
+    def feed(self, chunk: bytes) -> bool:
+        """Take the next chunk; True once the rest of the body should not be read"""
+        if self.encoding is None:
+            self.encoding = get_charset_cache().encoding_for(self.url, chunk, self.content_type)
+            if self.enough is not None:
+                self.counter = CandidateCounter(self.is_candidate, self.candidate_tags, self.encoding)
+        self.chunks.append(chunk)
+        self.size += len(chunk)
+        if self.size >= self.max_bytes:
+            self.truncated = True
+            print(f"      ⚠️  Page {self.url} exceeds {self.max_bytes} bytes, truncating")
+            return True
+        if self.counter is not None and self.counter.feed(chunk) >= self.enough:
+            self.stopped_early = True
+            print(f"      ✂️  Found {self.counter.count} candidates in the first {self.size // 1024} KB, "
+                  f"not reading the rest")
+            return True
+        if time.monotonic() - self.started > self.total_timeout:
+            raise requests.exceptions.Timeout(
+                f"Page {self.url} took longer than {self.total_timeout}s to download"
+            )
+        return False
+
+    @property
+    def complete(self) -> bool:
+        return not (self.truncated or self.stopped_early)
+
+    @property
+    def body(self) -> bytes:
+        return b''.join(self.chunks)[:self.max_bytes]
@@ -0,0 +1,126 @@
+# utils/rate_limiter.py
+
+"""
+Per-host politeness for the shared transport.
+
+Each host gets its own token bucket: up to RATE_LIMIT_BURST requests go out
+immediately, after which requests to that host are spaced by a random
+interval between MIN_REQUEST_DELAY and MAX_REQUEST_DELAY. Slots are reserved
+under a short lock and the wait happens outside it, so requests to different
+hosts never wait on each other. Cache hits never reach the limiter.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+from config.settings import MIN_REQUEST_DELAY, MAX_REQUEST_DELAY, RATE_LIMIT_BURST
+
+
+class _HostBucket:
+    """Token bucket for one host, kept as a theoretical arrival time (GCRA)"""
+
+    def __init__(self):
+        self.next_free = 0.0     # when the bucket would be full again
+        self.min_interval = None  # e.g. robots.txt Crawl-delay
+        self.requests = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+
+
+class HostRateLimiter:
+    """Token-bucket rate limiter keyed by host, with sync and async waits"""
+
+    def __init__(self, min_delay: float = MIN_REQUEST_DELAY, max_delay: float = MAX_REQUEST_DELAY,
+                 burst: int = RATE_LIMIT_BURST):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.burst = max(1, burst)
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, _HostBucket] = {}
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def _bucket(self, host: str) -> _HostBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _HostBucket()
+        return bucket
+
+    def set_min_interval(self, host: str, seconds: Optional[float]):
+        """Force a minimum spacing for a host (e.g. from robots.txt Crawl-delay)"""
+        with self._lock:
+            self._bucket(host.lower()).min_interval = seconds
+
+    def reserve(self, url: str) -> float:
+        """Reserve the next slot for url's host and return how long to wait for it"""
+        host = self.host_of(url)
+        with self._lock:
+            bucket = self._bucket(host)
+            interval = random.uniform(self.min_delay, self.max_delay)
+            if bucket.min_interval:
+                interval = max(interval, bucket.min_interval)
+            # With a crawl delay the host gets no burst allowance
+            tolerance = 0.0 if bucket.min_interval else (self.burst - 1) * interval
+
+            now = time.monotonic()
+            start = max(now, bucket.next_free - tolerance)
+            bucket.next_free = max(bucket.next_free, now) + interval
+
+            wait = start - now
+            bucket.requests += 1
+            if wait > 0:
+                bucket.throttled += 1
+                bucket.total_wait += wait
+            return wait
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to url's host is allowed; returns seconds waited"""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, url: str) -> float:
+        """Async acquire(): only the calling task waits"""
+        wait = self.reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self) -> Dict:
+        """Request counts and time spent waiting, overall and per host"""
+        with self._lock:
+            per_host = {
+                host: {
+                    'requests': b.requests,
+                    'throttled': b.throttled,
+                    'total_wait': round(b.total_wait, 3),
+                    'min_interval': b.min_interval,
+                }
+                for host, b in self._buckets.items()
+            }
+        return {
+            'requests': sum(h['requests'] for h in per_host.values()),
+            'throttled': sum(h['throttled'] for h in per_host.values()),
+            'total_wait': round(sum(h['total_wait'] for h in per_host.values()), 3),
+            'per_host': per_host,
+        }
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Process-wide per-host limiter used by the shared transport"""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = HostRateLimiter()
+    return _limiter
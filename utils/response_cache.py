@@ -0,0 +1,276 @@
+# utils/response_cache.py
+
+"""
+Persistent HTTP response cache.
+
+Responses are stored in SQLite keyed by method, URL and the request headers
+listed in CACHE_VARY_HEADERS. Entries are fresh for CACHE_DURATION_HOURS and
+the store is kept under CACHE_MAX_SIZE_MB by evicting least-recently-used
+entries. The shared transport consults it before touching the network, so a
+repeat search inside the freshness window makes no HTTP requests at all.
+
+Stale entries are revalidated with If-None-Match / If-Modified-Since using
+the stored ETag / Last-Modified. A 304 refreshes the entry and replays the
+stored body. Scrapers can also store their parsed result next to a body
+fingerprint (see get_parsed / put_parsed) and skip re-parsing unchanged pages.
+"""
+
+import hashlib
+import http.client
+import json
+import threading
+import time
+from datetime import timedelta
+from typing import Dict, Optional, Tuple
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from config.settings import (
+    CACHE_DURATION_HOURS, CACHE_MAX_SIZE_MB, CACHE_VARY_HEADERS, ENABLE_CACHING
+)
+from utils import storage
+
+# Statuses worth replaying; redirects are included so cached hops stay offline too
+CACHEABLE_STATUSES = (200, 203, 301, 302, 307, 308)
+
+# Hop-by-hop / transfer headers that no longer describe the stored (decoded) body
+_DROPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection')
+
+
+def request_key(method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                vary_headers=CACHE_VARY_HEADERS) -> str:
+    """Identity of a request: method, URL and the values of the vary headers"""
+    headers = CaseInsensitiveDict(headers or {})
+    parts = [method.upper(), url]
+    for name in vary_headers:
+        parts.append(f"{name.lower()}={headers.get(name, '')}")
+    return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+class CacheEntry:
+    """A stored response"""
+
+    def __init__(self, key: str, url: str, status: int, headers: Dict[str, str],
+                 body: bytes, stored_at: float):
+        self.key = key
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    @property
+    def fingerprint(self) -> str:
+        """Content hash identifying this exact body"""
+        return hashlib.sha1(self.body).hexdigest()
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers built from the stored ETag / Last-Modified"""
+        headers = CaseInsensitiveDict(self.headers)
+        conditional = {}
+        if headers.get('ETag'):
+            conditional['If-None-Match'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            conditional['If-Modified-Since'] = headers['Last-Modified']
+        return conditional
+
+    def to_response(self, request: Optional[requests.PreparedRequest] = None) -> requests.Response:
+        """Rebuild a requests.Response that needs no network access"""
+        response = requests.Response()
+        response.status_code = self.status
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.body
+        response._content_consumed = True
+        response.url = self.url
+        response.reason = http.client.responses.get(self.status, '')
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.elapsed = timedelta(0)
+        response.request = request
+        response.from_cache = True
+        response.revalidated = False
+        response.cache_fingerprint = self.fingerprint
+        return response
+
+
+class ResponseCache:
+    """SQLite-backed, size-bounded LRU cache of HTTP responses"""
+
+    def __init__(self, filename: str = 'http_cache.sqlite',
+                 ttl_hours: float = CACHE_DURATION_HOURS,
+                 max_size_mb: float = CACHE_MAX_SIZE_MB,
+                 vary_headers=CACHE_VARY_HEADERS):
+        self.ttl = ttl_hours * 3600
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.vary_headers = tuple(vary_headers)
+        self._lock = threading.Lock()
+        self._conn = storage.connect(filename)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS parsed_results (
+                scope TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                data TEXT NOT NULL,
+                stored_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+        self.counters = {'hits': 0, 'misses': 0, 'revalidated': 0, 'parsed_reused': 0}
+
+    def make_key(self, method: str, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """Cache key from method, URL and the vary headers of the request"""
+        return request_key(method, url, headers, self.vary_headers)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the stored entry for key (fresh or not), touching its LRU timestamp"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, headers, body, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        url, status, headers, body, stored_at = row
+        return CacheEntry(key, url, status, json.loads(headers), bytes(body), stored_at)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return entry.age() < self.ttl
+
+    def lookup(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Stored entry for key (possibly stale) and whether it is still fresh"""
+        entry = self.get(key)
+        fresh = entry is not None and self.is_fresh(entry)
+        self.counters['hits' if fresh else 'misses'] += 1
+        return entry, fresh
+
+    def refresh(self, entry: CacheEntry, headers) -> CacheEntry:
+        """Mark a stale entry fresh again after a 304, merging the new response headers"""
+        merged = dict(entry.headers)
+        for name, value in dict(headers or {}).items():
+            if name.lower() not in _DROPPED_HEADERS:
+                merged[name] = value
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET headers = ?, stored_at = ?, last_access = ? WHERE key = ?",
+                (json.dumps(merged), now, now, entry.key)
+            )
+            self._conn.commit()
+        self.counters['revalidated'] += 1
+        return CacheEntry(entry.key, entry.url, entry.status, merged, entry.body, now)
+
+    def get_parsed(self, scope: str, fingerprint: Optional[str]):
+        """Parsed result stored for scope, if it was produced from the same body"""
+        if not fingerprint:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, data FROM parsed_results WHERE scope = ?", (scope,)
+            ).fetchone()
+        if row is None or row[0] != fingerprint:
+            return None
+        self.counters['parsed_reused'] += 1
+        return json.loads(row[1])
+
+    def put_parsed(self, scope: str, fingerprint: Optional[str], data):
+        """Remember the parsed result of the body identified by fingerprint"""
+        if not fingerprint:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO parsed_results (scope, fingerprint, data, stored_at) VALUES (?, ?, ?, ?)",
+                (scope, fingerprint, json.dumps(data), time.time())
+            )
+            self._conn.commit()
+
+    def is_cacheable_request(self, method: str, headers) -> bool:
+        """Only plain GETs are cached; callers can opt out with Cache-Control: no-cache / no-store"""
+        if method.upper() != 'GET':
+            return False
+        cache_control = CaseInsensitiveDict(headers or {}).get('Cache-Control', '').lower()
+        return 'no-cache' not in cache_control and 'no-store' not in cache_control
+
+    def is_cacheable(self, status: int, headers) -> bool:
+        """Whether a response may be stored"""
+        if status not in CACHEABLE_STATUSES:
+            return False
+        cache_control = CaseInsensitiveDict(headers or {}).get('Cache-Control', '').lower()
+        return 'no-store' not in cache_control
+
+    def put(self, key: str, url: str, status: int, headers, body: bytes) -> Optional[CacheEntry]:
+        """Store a response body (already content-decoded) and enforce the size bound"""
+        if not self.is_cacheable(status, headers):
+            return None
+        body = body or b''
+        if len(body) > self.max_bytes:
+            return None
+
+        kept = {k: v for k, v in dict(headers or {}).items() if k.lower() not in _DROPPED_HEADERS}
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, url, status, headers, body, size, stored_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, status, json.dumps(kept), body, len(body), now, now)
+            )
+            self._evict()
+            self._conn.commit()
+        return CacheEntry(key, url, status, kept, body, now)
+
+    def _evict(self):
+        """Drop least-recently-used entries until the store fits in max_bytes (lock held)"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def clear(self):
+        """Remove every cached response"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.execute("DELETE FROM parsed_results")
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        """Number of entries and bytes stored"""
+        with self._lock:
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {'entries': count, 'bytes': size, 'max_bytes': self.max_bytes, **self.counters}
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the process-wide response cache, or None when ENABLE_CACHING is off"""
+    global _cache
+    if not ENABLE_CACHING:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache()
+    return _cache
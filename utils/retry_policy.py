@@ -0,0 +1,159 @@
+# utils/retry_policy.py
+
+"""
+Timeouts and retries for every HTTP request.
+
+One RetryPolicy replaces the urllib3 Retry that used to sit on the shared
+adapter (and had no notion of a search as a whole):
+
+- timeouts are split into a connect timeout (CONNECT_TIMEOUT, short: a host
+  that does not accept a connection quickly is down) and a read timeout
+  (REQUEST_TIMEOUT unless the caller passes one)
+- transient failures (connection errors, timeouts, 429 and 5xx) of
+  idempotent requests are retried up to MAX_RETRIES times with jittered
+  exponential backoff starting at RETRY_DELAY, honouring Retry-After
+- every retry also spends from the search's RetryBudget, which all sources
+  share, so a bad network cannot turn one search into minutes of retries
+
+The orchestrator opens a budget per search; it reaches every fetch through a
+ContextVar (asyncio tasks and asyncio.to_thread workers inherit it).
+"""
+
+import contextvars
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple, Union
+from config.settings import (
+    CONNECT_TIMEOUT, REQUEST_TIMEOUT, MAX_RETRIES, RETRY_DELAY, RETRY_MAX_DELAY, SEARCH_RETRY_BUDGET
+)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+Timeout = Union[None, float, Tuple[float, float]]
+
+
+class RetryBudget:
+    """Retries allowed for one search, shared by all of its sources"""
+
+    def __init__(self, max_retries: int = SEARCH_RETRY_BUDGET):
+        self.max_retries = max_retries
+        self.spent = 0
+        self.denied = 0
+        self._lock = threading.Lock()
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget; False once it is used up"""
+        with self._lock:
+            if self.spent >= self.max_retries:
+                self.denied += 1
+                if self.denied == 1:
+                    print(f"      ⚠️  Retry budget of {self.max_retries} used up, failing fast from now on")
+                return False
+            self.spent += 1
+            return True
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'budget': self.max_retries, 'spent': self.spent, 'denied': self.denied}
+
+
+_current_budget = contextvars.ContextVar('retry_budget', default=None)
+
+
+def current_retry_budget() -> Optional[RetryBudget]:
+    """Budget of the search this code runs in, if any"""
+    return _current_budget.get()
+
+
+def set_retry_budget(budget: Optional[RetryBudget]) -> contextvars.Token:
+    """Make budget current; pass the returned token to reset_retry_budget()"""
+    return _current_budget.set(budget)
+
+
+def reset_retry_budget(token: contextvars.Token):
+    _current_budget.reset(token)
+
+
+class RetryPolicy:
+    """Connect/read timeouts and bounded, jittered retries"""
+
+    def __init__(self, connect_timeout: float = CONNECT_TIMEOUT,
+                 read_timeout: float = REQUEST_TIMEOUT,
+                 max_retries: int = MAX_RETRIES,
+                 backoff: float = RETRY_DELAY,
+                 max_backoff: float = RETRY_MAX_DELAY,
+                 retry_statuses=RETRY_STATUSES,
+                 retry_methods=IDEMPOTENT_METHODS):
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = tuple(retry_statuses)
+        self.retry_methods = tuple(retry_methods)
+
+    def timeout(self, timeout: Timeout = None) -> Tuple[float, float]:
+        """
+        (connect, read) timeouts for a request
+
+        A single number from the caller is its read timeout; connecting never
+        gets longer than connect_timeout. Tuples are used as given.
+        """
+        if isinstance(timeout, tuple):
+            return timeout
+        read = self.read_timeout if timeout is None else timeout
+        return min(self.connect_timeout, read), read
+
+    def should_retry(self, method: str, attempt: int, status: Optional[int] = None,
+                     failed: bool = False) -> bool:
+        """
+        Whether attempt (0-based) may be followed by another one
+
+        failed marks a transient transport error (connection error/timeout);
+        otherwise status decides. Granted retries are taken from the current
+        search's budget.
+        """
+        if attempt >= self.max_retries or method.upper() not in self.retry_methods:
+            return False
+        if not failed and status not in self.retry_statuses:
+            return False
+        budget = current_retry_budget()
+        return budget is None or budget.try_spend()
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before retrying: full-jitter exponential backoff, or Retry-After"""
+        if retry_after:
+            wait = self._parse_retry_after(retry_after)
+            if wait is not None:
+                return min(wait, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+
+    @staticmethod
+    def _parse_retry_after(value: str) -> Optional[float]:
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+_policy = None
+_policy_lock = threading.Lock()
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Process-wide policy used by the sync and async transports"""
+    global _policy
+    if _policy is None:
+        with _policy_lock:
+            if _policy is None:
+                _policy = RetryPolicy()
+    return _policy
@@ -0,0 +1,176 @@
+# utils/robots_cache.py
+
+"""
+Cached robots.txt evaluation.
+
+robots.txt is fetched at most once per host per ROBOTS_CACHE_HOURS, parsed
+once, and shared by every thread. Parsed rules are kept in memory and the raw
+file is persisted in SQLite, so restarts do not refetch it either. A host's
+Crawl-delay is passed to the per-host rate limiter.
+"""
+
+import asyncio
+import threading
+import time
+import urllib.parse
+import urllib.robotparser
+from typing import Dict, Optional
+import requests
+from config.settings import ROBOTS_CACHE_HOURS
+from utils import storage
+from utils.rate_limiter import HostRateLimiter, get_rate_limiter
+from utils.single_flight import get_single_flight
+
+
+class RobotsEntry:
+    """robots.txt for one origin, parsed once"""
+
+    def __init__(self, origin: str, status: int, body: str, fetched_at: float):
+        self.origin = origin
+        self.status = status
+        self.body = body
+        self.fetched_at = fetched_at
+        self.parser = None
+        if status == 200:
+            self.parser = urllib.robotparser.RobotFileParser()
+            self.parser.parse(body.splitlines())
+
+    def can_fetch(self, user_agent: str, url: str) -> bool:
+        # No robots.txt or inaccessible -> treat as allowed
+        if self.parser is None:
+            return True
+        return self.parser.can_fetch(user_agent, url)
+
+    def crawl_delay(self, user_agent: str) -> Optional[float]:
+        if self.parser is None:
+            return None
+        delay = self.parser.crawl_delay(user_agent)
+        return float(delay) if delay is not None else None
+
+
+class RobotsCache:
+    """Thread-safe, persistent robots.txt cache keyed by origin (scheme + host)"""
+
+    def __init__(self, filename: str = 'robots.sqlite', ttl_hours: float = ROBOTS_CACHE_HOURS,
+                 limiter: Optional[HostRateLimiter] = None):
+        self.ttl = ttl_hours * 3600
+        self.limiter = limiter or get_rate_limiter()
+        self._entries: Dict[str, RobotsEntry] = {}
+        self._lock = threading.Lock()
+        self._conn = storage.connect(filename)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS robots (
+                origin TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                body TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def origin_of(url: str) -> str:
+        parsed = urllib.parse.urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def _fresh(self, entry: Optional[RobotsEntry]) -> bool:
+        return entry is not None and time.time() - entry.fetched_at < self.ttl
+
+    def _cached(self, origin: str) -> Optional[RobotsEntry]:
+        """Fresh entry from memory, falling back to the on-disk copy"""
+        with self._lock:
+            entry = self._entries.get(origin)
+            if self._fresh(entry):
+                return entry
+            row = self._conn.execute(
+                "SELECT status, body, fetched_at FROM robots WHERE origin = ?", (origin,)
+            ).fetchone()
+        if row is None:
+            return None
+        entry = RobotsEntry(origin, *row)
+        if not self._fresh(entry):
+            return None
+        with self._lock:
+            self._entries[origin] = entry
+        return entry
+
+    def _store(self, origin: str, status: int, body: str) -> RobotsEntry:
+        entry = RobotsEntry(origin, status, body, time.time())
+        if status >= 500:
+            # Server trouble is transient: allow for now, but ask again next time
+            return entry
+        with self._lock:
+            self._entries[origin] = entry
+            self._conn.execute(
+                "INSERT OR REPLACE INTO robots (origin, status, body, fetched_at) VALUES (?, ?, ?, ?)",
+                (origin, status, body, entry.fetched_at)
+            )
+            self._conn.commit()
+        return entry
+
+    def _apply_crawl_delay(self, entry: RobotsEntry, user_agent: str):
+        delay = entry.crawl_delay(user_agent)
+        if delay:
+            self.limiter.set_min_interval(urllib.parse.urlparse(entry.origin).netloc, delay)
+
+    def get(self, url: str, session: requests.Session) -> RobotsEntry:
+        """robots.txt entry for url's origin, fetched through session if missing or stale"""
+        origin = self.origin_of(url)
+        entry = self._cached(origin)
+        if entry is not None:
+            return entry
+
+        def fetch():
+            resp = session.get(f"{origin}/robots.txt", timeout=10)
+            return self._store(origin, resp.status_code, resp.text if resp.status_code == 200 else '')
+
+        return get_single_flight().do(('robots', origin), fetch)
+
+    async def aget(self, url: str, transport, headers: Optional[Dict[str, str]] = None) -> RobotsEntry:
+        """
+        Async get(); transport is the search's AsyncTransport and headers the
+        scraper session's (User-Agent). SQLite access runs on a worker thread.
+        """
+        origin = self.origin_of(url)
+        entry = await asyncio.to_thread(self._cached, origin)
+        if entry is not None:
+            return entry
+
+        async def fetch():
+            resp = await transport.get(f"{origin}/robots.txt", headers=headers, timeout=10)
+            return await asyncio.to_thread(
+                self._store, origin, resp.status_code, resp.text if resp.status_code == 200 else ''
+            )
+
+        return await get_single_flight().ado(('robots', origin), fetch)
+
+    def can_fetch(self, url: str, user_agent: str, session: requests.Session) -> bool:
+        entry = self.get(url, session)
+        self._apply_crawl_delay(entry, user_agent)
+        return entry.can_fetch(user_agent, url)
+
+    async def acan_fetch(self, url: str, user_agent: str, transport,
+                         headers: Optional[Dict[str, str]] = None) -> bool:
+        entry = await self.aget(url, transport, headers)
+        self._apply_crawl_delay(entry, user_agent)
+        return entry.can_fetch(user_agent, url)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._conn.execute("DELETE FROM robots")
+            self._conn.commit()
+
+
+_robots = None
+_robots_lock = threading.Lock()
+
+
+def get_robots_cache() -> RobotsCache:
+    """Process-wide robots.txt cache"""
+    global _robots
+    if _robots is None:
+        with _robots_lock:
+            if _robots is None:
+                _robots = RobotsCache()
+    return _robots
@@ -0,0 +1,136 @@
+# utils/single_flight.py
+
+"""
+Single-flight request coalescing.
+
+When several callers ask for the same key at the same time, only the first
+one (the leader) does the work; the others wait for it and receive the same
+result or exception. Used for duplicate URL fetches and for parsing the same
+body, both within one search and across concurrent Streamlit sessions.
+
+Sync followers wait on a threading.Event; asyncio followers await a future
+on their own event loop, which the leader resolves thread-safely, so sync
+threads and tasks on any loop can follow the same in-flight call without
+tying up a worker thread.
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    """One in-flight execution and its outcome"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+        self.waiters = []  # (loop, future) per asyncio follower
+
+
+def _wake(future: asyncio.Future):
+    if not future.done():  # the follower may have been cancelled meanwhile
+        future.set_result(None)
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.counters = {'executions': 0, 'coalesced': 0}
+
+    def _join(self, key: Hashable):
+        """Return (call, is_leader) for key"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.followers += 1
+                self.counters['coalesced'] += 1
+                return call, False
+            call = _Call()
+            self._calls[key] = call
+            self.counters['executions'] += 1
+            return call, True
+
+    def _finish(self, key: Hashable, call: _Call):
+        with self._lock:
+            self._calls.pop(key, None)
+            call.done.set()
+            waiters, call.waiters = call.waiters, []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                pass  # the follower's loop is already closed
+
+    async def _await(self, call: _Call):
+        """Wait for call to finish without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if call.done.is_set():
+                return
+            call.waiters.append((loop, future))
+        await future
+
+    @staticmethod
+    def _outcome(call: _Call):
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn() unless a call for key is already in flight, then share its outcome"""
+        while True:
+            call, leader = self._join(key)
+            if leader:
+                break
+            call.done.wait()
+            # A cancelled leader says nothing about the key; try again ourselves
+            if not isinstance(call.error, asyncio.CancelledError):
+                return self._outcome(call)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            self._finish(key, call)
+        return call.result
+
+    async def ado(self, key: Hashable, coro_fn: Callable[[], Any]) -> Any:
+        """Async version of do(); coro_fn returns the awaitable to run"""
+        while True:
+            call, leader = self._join(key)
+            if leader:
+                break
+            await self._await(call)
+            if not isinstance(call.error, asyncio.CancelledError):
+                return self._outcome(call)
+
+        try:
+            call.result = await coro_fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            self._finish(key, call)
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """Executions, coalesced followers and calls currently in flight"""
+        with self._lock:
+            return {**self.counters, 'in_flight': len(self._calls)}
+
+
+_flights = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Process-wide coalescing group shared by the fetch layer and scrapers"""
+    return _flights
@@ -0,0 +1,28 @@
+# utils/storage.py
+
+"""
+Location and connections for on-disk state kept between runs (HTTP cache,
+robots.txt, scraper statistics). Everything lives under CACHE_DIR in SQLite
+files, which are safe to share between threads and Streamlit workers.
+"""
+
+import os
+import sqlite3
+from config.settings import CACHE_DIR
+
+
+def cache_file(filename: str) -> str:
+    """Absolute path of a file inside the cache directory (created on demand)"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return os.path.join(CACHE_DIR, filename)
+
+
+def connect(filename: str) -> sqlite3.Connection:
+    """Open a SQLite database in the cache directory for multi-threaded use"""
+    conn = sqlite3.connect(cache_file(filename), timeout=10, check_same_thread=False)
+    try:
+        # WAL lets readers in other processes proceed while one writer commits
+        conn.execute("PRAGMA journal_mode=WAL")
+    except sqlite3.DatabaseError:
+        pass
+    return conn